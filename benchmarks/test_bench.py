@@ -0,0 +1,234 @@
+"""Benchmarks of the hot paths of the models, transforms, data and rendering.
+
+These use pytest-benchmark (and are skipped if it isn't installed).  They are not
+part of the test suite (`pytest` only runs `tests/`), run them with:
+
+    pytest benchmarks
+
+To save the results of a commit as JSON, and compare later commits with it:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare
+
+(`--benchmark-json=FILE` writes the results of a single run to FILE.)
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import pytest
+from psygnal import EmissionInfo
+
+from microvis.core import Camera, Canvas, Image, Transform, View, register_adaptor
+from microvis.core.nodes.image import PercentileContrast
+from microvis.core.nodes.node import Node
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+IMAGE = np.random.default_rng(0).integers(0, 4096, (2048, 2048), dtype=np.uint16)
+
+
+def _noop(*_: Any, **__: Any) -> None:
+    pass
+
+
+def _null_backend(model_cls: type[Node], name: str) -> None:
+    """Register `name` as a backend of `model_cls` that does nothing."""
+    methods = {f"_vis_set_{field}": _noop for field in model_cls.__fields__}
+    adaptor = type(
+        f"Null{model_cls.__name__}",
+        (),
+        {
+            "__init__": _noop,
+            "_vis_get_native": _noop,
+            "_vis_add_node": _noop,
+            **methods,
+        },
+    )
+    register_adaptor(model_cls, name, adaptor)
+
+
+# ---------------------- models ----------------------
+
+
+@pytest.mark.benchmark(group="model")
+@pytest.mark.parametrize("cls", [Node, Camera, View])
+def test_construct(benchmark: BenchmarkFixture, cls: Callable[[], Node]) -> None:
+    benchmark(cls)
+
+
+@pytest.mark.benchmark(group="model")
+def test_construct_image(benchmark: BenchmarkFixture) -> None:
+    benchmark(Image, IMAGE)
+
+
+@pytest.mark.benchmark(group="model")
+@pytest.mark.parametrize("n_backends", [1, 4])
+def test_event_fanout(benchmark: BenchmarkFixture, n_backends: int) -> None:
+    # setting a field: validation, emission, and dispatch to the backends
+    camera = Camera()
+    for i in range(n_backends):
+        _null_backend(Camera, f"null{i}")
+        camera.backend_adaptor(f"null{i}")
+    zooms = iter(range(1, 10**9))
+
+    def _set_zoom() -> None:
+        camera.zoom = next(zooms)
+
+    benchmark(_set_zoom)
+
+
+@pytest.mark.benchmark(group="model")
+@pytest.mark.parametrize("field, value", [("center", (1.0, 2.0, 0.0)), ("zoom", 2.0)])
+def test_event_dispatch(benchmark: BenchmarkFixture, field: str, value: Any) -> None:
+    # the dispatch of an event to the backend alone
+    _null_backend(Camera, "null")
+    camera = Camera()
+    camera.backend_adaptor("null")
+    info = EmissionInfo(getattr(camera.events, field), (value,))
+    benchmark(camera._on_any_event, info)
+
+
+@pytest.mark.benchmark(group="model")
+@pytest.mark.parametrize("n_children", [100, 1000])
+def test_node_add(benchmark: BenchmarkFixture, n_children: int) -> None:
+    _null_backend(Node, "null")
+
+    def _setup() -> tuple[tuple[Node, list[Node]], dict]:
+        # (new children each round: moving nodes to another parent costs more)
+        root = Node()
+        root.backend_adaptor("null")
+        return (root, [Node() for _ in range(n_children)]), {}
+
+    def _add_all(root: Node, children: list[Node]) -> None:
+        for child in children:
+            root.add(child)
+
+    benchmark.pedantic(_add_all, setup=_setup, rounds=10)
+
+
+@pytest.mark.benchmark(group="model")
+def test_transform_to_node(benchmark: BenchmarkFixture) -> None:
+    # between the leaves of two branches of 50 nodes
+    root = Node()
+    leaves = []
+    for _ in range(2):
+        node = root
+        for _ in range(50):
+            child = Node(transform=Transform().translated((1, 2, 3)))
+            node.add(child)
+            node = child
+        leaves.append(node)
+    benchmark(leaves[0].transform_to_node, leaves[1])
+
+
+@pytest.mark.benchmark(group="model")
+@pytest.mark.parametrize("shape", ["deep", "wide"])
+def test_path_to_node(benchmark: BenchmarkFixture, shape: str) -> None:
+    # between a leaf at depth 1000 and its sibling, or two of 1000 children
+    root = Node()
+    node = root
+    for _ in range(999 if shape == "deep" else 1):
+        child = Node()
+        node.add(child)
+        node = child
+    for _ in range(1 if shape == "deep" else 999):
+        node.add(Node())
+    benchmark(
+        node.children[0].path_to_node, node.children[-1] if shape == "wide" else node
+    )
+
+
+# ---------------------- transforms ----------------------
+
+
+@pytest.mark.benchmark(group="transform")
+@pytest.mark.parametrize("depth", [10, 1000])
+def test_transform_compose(benchmark: BenchmarkFixture, depth: int) -> None:
+    transforms = [
+        Transform().rotated(i, (0, 0, 1)).scaled((2, 2, 1)) for i in range(depth)
+    ]
+    benchmark(Transform.chain, *transforms)
+
+
+@pytest.mark.benchmark(group="transform")
+def test_transform_derive(benchmark: BenchmarkFixture) -> None:
+    transform = Transform().rotated(30, (0, 0, 1))
+
+    def _derive() -> None:
+        (transform @ transform).translated((1, 2)).inv().is_null()
+
+    benchmark(_derive)
+
+
+@pytest.mark.benchmark(group="transform")
+@pytest.mark.parametrize("n_points", [1, 100_000])
+def test_transform_map(benchmark: BenchmarkFixture, n_points: int) -> None:
+    transform = Transform().rotated(30, (0, 0, 1)).translated((10, 20, 0))
+    points = np.random.default_rng(0).random((n_points, 2))
+    benchmark(transform.map, points[0] if n_points == 1 else points)
+
+
+@pytest.mark.benchmark(group="transform")
+def test_transform_map_points(benchmark: BenchmarkFixture) -> None:
+    transform = Transform().rotated(30, (0, 0, 1)).translated((10, 20, 0))
+    points = np.random.default_rng(0).random((1_000_000, 2)).astype(np.float32)
+    out = np.empty_like(points)
+    benchmark(transform.map_points, points, out)
+
+
+# ---------------------- data ----------------------
+
+
+@pytest.mark.benchmark(group="data")
+@pytest.mark.parametrize("dtype", ["uint16", "float32"])
+def test_percentile_contrast(benchmark: BenchmarkFixture, dtype: str) -> None:
+    data = IMAGE.astype(dtype)
+    benchmark(PercentileContrast(pmin=1, pmax=99.5).apply, data)
+
+
+# ---------------------- rendering ----------------------
+
+
+@pytest.mark.benchmark(group="render")
+@pytest.mark.parametrize("interpolation", ["nearest", "linear"])
+def test_render(benchmark: BenchmarkFixture, interpolation: str) -> None:
+    # a 512 x 512 view of a 2048 x 2048 image, with the software backend
+    canvas = Canvas(width=512, height=512)
+    view = canvas.add_view()
+    view.add_node(Image(IMAGE, cmap="viridis", interpolation=interpolation))
+    benchmark(canvas.render, backend="numpy")
+
+
+# ---------------------- import ----------------------
+
+
+def _import_microvis() -> int:
+    """Import microvis in a new interpreter, return its cumulative import time (us)."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import microvis"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    # "import time: self [us] | cumulative | imported package"
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and fields[-1].strip() == "microvis":
+            return int(fields[1])
+    raise RuntimeError("microvis not found in the -X importtime output")
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_time(benchmark: BenchmarkFixture) -> None:
+    # the whole (cold) interpreter start; `import microvis` alone is in extra_info
+    times = []
+    benchmark.pedantic(lambda: times.append(_import_microvis()), rounds=10)
+    benchmark.extra_info["import_microvis_us"] = min(times)
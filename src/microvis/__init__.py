@@ -1,15 +1,40 @@
 """package description."""
 
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
+
+from ._lazy import attach
+
+if TYPE_CHECKING:
+    from .convenience import imshow
+    from .core import Camera, Canvas, Image, Scene, View
 
-try:
-    __version__ = version("microvis")
-except PackageNotFoundError:
-    __version__ = "uninstalled"
 __author__ = "Talley Lambert"
 __email__ = "talley.lambert@gmail.com"
 
-from .convenience import imshow
-from .core import Camera, Canvas, Image, Scene, View
-
 __all__ = ["Camera", "Canvas", "Image", "Scene", "View", "imshow"]
+
+# nothing is imported until it is used, so that `import microvis` is fast
+_getattr, __dir__ = attach(
+    __name__,
+    {
+        "Camera": ".core",
+        "Canvas": ".core",
+        "Image": ".core",
+        "Scene": ".core",
+        "View": ".core",
+        "imshow": ".convenience",
+    },
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            __version__ = version("microvis")
+        except PackageNotFoundError:
+            __version__ = "uninstalled"
+        globals()["__version__"] = __version__
+        return __version__
+    return _getattr(name)
@@ -0,0 +1,42 @@
+"""Lazy loading of the public names of a package (see PEP 562)."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Mapping
+
+
+def attach(
+    package: str, names: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return the `__getattr__` and `__dir__` of a package with lazy attributes.
+
+    `names` maps each public name of `package` to the (relative) module defining
+    it, which is only imported when the name is first accessed.  Submodules of the
+    package are also imported on first access (e.g. `microvis.core.canvas`).
+
+    Examples
+    --------
+    >>> __getattr__, __dir__ = attach(__name__, {"Canvas": ".canvas"})
+    """
+    globals_ = vars(import_module(package))
+
+    def __getattr__(name: str) -> Any:
+        if name in names:
+            value = getattr(import_module(names[name], package), name)
+        else:
+            try:
+                value = import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        globals_[name] = value  # only load once
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*globals_, *names})
+
+    return __getattr__, __dir__
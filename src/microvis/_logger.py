@@ -2,20 +2,23 @@ import atexit
 import contextlib
 import os
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["logger"]
+__all__ = ["debug_enabled", "logger"]
 
-if TYPE_CHECKING:
-    from loguru import logger
-else:
+DEBUG = os.getenv("DEBUG", "0") in ("1", "true", "True", "yes")
+DEFAULT_LOG_LEVEL = "DEBUG" if DEBUG else "INFO"
+_DEBUG_NO = 10  # the severity of loguru's DEBUG level
+
+
+def _create_logger() -> Any:
     from loguru import __version__
     from loguru._logger import Core, Logger
 
-    PATCHERS = {"patchers": []}
+    patchers: dict = {"patchers": []}
     with contextlib.suppress(Exception):
         if tuple(int(x) for x in __version__.split("."))[:2] < (0, 7):
-            PATCHERS = {"patcher": None}
+            patchers = {"patcher": None}
 
     # avoid using the global loguru logger in case other packages are using it.
     logger = Logger(
@@ -28,15 +31,42 @@ else:
         raw=False,
         capture=True,
         extra={},
-        **PATCHERS,
+        **patchers,
     )
 
-DEBUG = os.getenv("DEBUG", "0") in ("1", "true", "True", "yes")
-DEFAULT_LOG_LEVEL = "DEBUG" if DEBUG else "INFO"
+    # automatically log to stderr
+    # TODO: add file outputs
+    if sys.stderr:
+        logger.add(sys.stderr, level=DEFAULT_LOG_LEVEL, backtrace=False)
+
+    atexit.register(logger.remove)
+    return logger
 
-# automatically log to stderr
-# TODO: add file outputs
-if sys.stderr:
-    logger.add(sys.stderr, level=DEFAULT_LOG_LEVEL, backtrace=False)
 
-atexit.register(logger.remove)
+class _LazyLogger:
+    """Stands in for the logger, which is only created (with loguru) when used."""
+
+    _logger: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyLogger._logger is None:
+            _LazyLogger._logger = _create_logger()
+        return getattr(_LazyLogger._logger, name)
+
+
+def debug_enabled() -> bool:
+    """Return whether any handler of the logger currently records DEBUG messages.
+
+    This follows the handlers added to (or removed from) the logger at runtime, and
+    is cheap enough to guard the formatting of debug messages on hot paths.
+    """
+    if _LazyLogger._logger is None:
+        # not created yet: it will log at DEFAULT_LOG_LEVEL
+        return DEBUG
+    return bool(_LazyLogger._logger._core.min_level <= _DEBUG_NO)
+
+
+if TYPE_CHECKING:
+    from loguru import logger
+else:
+    logger = _LazyLogger()
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Literal, Tuple, Union
+from typing import Any, Literal, Protocol, Tuple, Union
 
 import numpy as np
 import pydantic.color
@@ -60,7 +60,21 @@ RGBATuple = Tuple[float, float, float, float]
 ClimString = Literal["auto"]
 ValidClim = Union[ClimString, Tuple[float, float]]
 ValidCmap = str
-ArrayLike = np.ndarray
+
+
+class ArrayLike(Protocol):
+    """Minimal array protocol for data.
+
+    Satisfied by numpy arrays, as well as lazy or out-of-core arrays such as
+    `np.memmap`, zarr and dask arrays.  Data is only read by indexing.
+    """
+
+    @property
+    def shape(self) -> Tuple[int, ...]: ...
+    @property
+    def dtype(self) -> Any: ...
+    def __getitem__(self, key: Any) -> Any: ...
+
 
 # fmt: off
 ColorName = Literal[
@@ -0,0 +1,15 @@
+"""Software rendering backend, with no dependencies other than NumPy.
+
+Useful to render images on machines without a display or an OpenGL context, e.g.
+`canvas.render(backend="numpy")`.  Only 2D scenes are supported.
+"""
+
+from ._camera import Camera
+from ._canvas import Canvas
+from ._image import Image
+from ._node import Node
+from ._scene import Scene
+from ._tiled_image import TiledImage
+from ._view import View
+
+__all__ = ["Camera", "Canvas", "Image", "Node", "Scene", "TiledImage", "View"]
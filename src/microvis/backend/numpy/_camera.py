@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+import numpy as np
+
+from microvis.core import Transform
+from microvis.core.nodes import camera
+
+from ._node import Node
+
+if TYPE_CHECKING:
+    from microvis._types import CameraType
+
+    from ._view import View
+
+
+class Camera(Node, camera.CameraAdaptorProtocol):
+    """Adaptor for a 2D (panzoom) camera.
+
+    The center and zoom that haven't been set (or were reset by `_vis_set_range`)
+    are fitted to the bounds of the scene every time the view is drawn.  Both
+    camera types are drawn as panzoom cameras.
+    """
+
+    def __init__(self, camera: camera.Camera, **backend_kwargs: Any) -> None:
+        super().__init__(camera)
+        self._type = camera.type
+        fields_set = camera.__fields_set__
+        self._zoom: Optional[float] = camera.zoom if "zoom" in fields_set else None
+        self._center: Optional[Tuple[float, float]] = None
+        if "center" in fields_set:
+            self._vis_set_center(camera.center)
+        self._margin = 0.0
+        # the view this camera is attached to (see View._vis_set_camera)
+        self._view: Optional[View] = None
+
+    def _vis_set_zoom(self, zoom: float) -> None:
+        self._zoom = zoom
+
+    def _vis_set_center(self, arg: tuple[float, ...]) -> None:
+        y, x = arg[-2:]
+        self._center = (x, y)
+
+    def _vis_set_type(self, arg: CameraType) -> None:
+        self._type = arg
+
+    def _vis_set_range(self, margin: float) -> None:
+        self._zoom = self._center = None
+        self._margin = margin
+
+    def _view_matrix(self, width: float, height: float) -> np.ndarray:
+        """Return the matrix mapping the scene to a view of `width` x `height` px.
+
+        The scene is shown with y pointing down (row 0 of images at the top).
+        """
+        center, zoom = self._center, self._zoom
+        if center is None or zoom is None:
+            scene = self._view._scene if self._view is not None else None
+            bounds = scene._bounds(np.eye(4)) if scene is not None else None
+            if bounds is None:
+                bounds = ((-0.5, -0.5), (0.5, 0.5))
+            (x0, y0), (x1, y1) = bounds
+            if center is None:
+                center = ((x0 + x1) / 2, (y0 + y1) / 2)
+            if zoom is None:
+                pad = 1 + 2 * self._margin
+                zoom = min(width / (x1 - x0 or 1), height / (y1 - y0 or 1)) / pad
+        cx, cy = center
+        return (
+            Transform()
+            .translated((-cx, -cy, 0))
+            .scaled((zoom, zoom, 1))
+            .translated((width / 2, height / 2, 0))
+            .matrix
+        )
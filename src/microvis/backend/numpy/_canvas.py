@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List
+
+import numpy as np
+
+from microvis import core
+
+from ._util import color_to_rgba, to_uint8
+from ._view import View
+
+if TYPE_CHECKING:
+    from microvis import _types
+
+
+class Canvas(core.canvas.CanvasAdaptorProtocol):
+    """Canvas interface for NumPy Backend.
+
+    Nothing is drawn until `_vis_render` is called: it draws the views (in the
+    order they were added) into a (height, width, 4) RGBA uint8 array.  A canvas
+    without a background color is transparent.
+    """
+
+    def __init__(self, canvas: core.Canvas, **backend_kwargs: Any) -> None:
+        self._width = int(canvas.width)
+        self._height = int(canvas.height)
+        self._background_color = color_to_rgba(canvas.background_color)
+        self._title = canvas.title
+        self._visible = canvas.visible
+        self._views: List[View] = []
+        for view in canvas.views:
+            self._vis_add_view(view)
+
+    def _vis_get_native(self) -> Any:
+        return self
+
+    def _vis_set_visible(self, arg: bool) -> None:
+        self._visible = arg
+
+    def _vis_add_view(self, view: core.View) -> None:
+        adaptor = view.backend_adaptor("numpy")._vis_get_native()
+        if not isinstance(adaptor, View):
+            raise TypeError("View must be a NumPy backend View")
+        if adaptor not in self._views:
+            self._views.append(adaptor)
+
+    def _vis_set_width(self, arg: int) -> None:
+        self._width = int(arg)
+
+    def _vis_set_height(self, arg: int) -> None:
+        self._height = int(arg)
+
+    def _vis_set_size(self, width: int, height: int) -> None:
+        self._width, self._height = int(width), int(height)
+
+    def _vis_set_background_color(self, arg: _types.Color | None) -> None:
+        self._background_color = color_to_rgba(arg)
+
+    def _vis_set_title(self, arg: str) -> None:
+        self._title = arg
+
+    def _vis_close(self) -> None:
+        """Close canvas."""
+        self._views.clear()
+
+    def _vis_render(self) -> np.ndarray:
+        """Render the views, and return the (height, width, 4) RGBA uint8 image."""
+        buffer = np.zeros((self._height, self._width, 4), dtype=np.float32)
+        if (color := self._background_color) is not None:
+            buffer[:] = (*(color[:3] * color[3]), color[3])
+        identity = np.eye(4)
+        for view in self._views:
+            view._draw(buffer, identity)
+        return to_uint8(buffer)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Optional, Tuple, cast
+
+import numpy as np
+
+from microvis._types import ImageInterpolation
+
+from ._node import Node
+from ._util import LUT_SIZE, blend, colormap_lut
+
+if TYPE_CHECKING:
+    from microvis import core
+    from microvis._types import ArrayLike
+
+
+class Image(Node):
+    """NumPy backend adaptor for an Image node.
+
+    Pixel (row, col) of the image covers the square from (col, row) to
+    (col + 1, row + 1) in the coordinates of the node.  Every pixel of the target
+    is resampled from the data through the inverse of the (affine) transform, then
+    the contrast limits, gamma and colormap are applied.  Bicubic interpolation
+    falls back to linear interpolation.
+    """
+
+    def __init__(self, image: core.Image, **backend_kwargs: Any) -> None:
+        super().__init__(image)
+        self._data: Optional[np.ndarray] = None
+        self._cmap = str(image.cmap)
+        self._clim: Optional[Tuple[float, float]] = image.clim_applied()
+        self._gamma = image.gamma
+        self._interpolation = image.interpolation
+        if image.data_raw is not None:
+            self._vis_set_data(image.display_data())
+
+    def _vis_set_cmap(self, arg: str) -> None:
+        self._cmap = str(arg)
+
+    def _vis_set_clim(self, arg: tuple[float, float] | None) -> None:
+        self._clim = arg
+
+    def _vis_set_gamma(self, arg: float) -> None:
+        self._gamma = arg
+
+    def _vis_set_interpolation(self, arg: ImageInterpolation) -> None:
+        self._interpolation = arg
+
+    def _vis_set_data(self, arg: ArrayLike) -> None:
+        # the data is only read when drawing, so there is nothing to copy
+        self._data = np.asarray(arg)
+
+    def _local_size(self) -> tuple[float, float] | None:
+        if self._data is None:
+            return None
+        return (self._data.shape[1], self._data.shape[0])
+
+    def _draw_self(self, target: np.ndarray, transform: np.ndarray) -> None:
+        if self._data is None or not self._data.size or self._opacity == 0:
+            return
+        # the 2D affine part of the transform, and its inverse (target -> data)
+        affine = transform[np.ix_([0, 1, 3], [0, 1, 3])]
+        if abs(np.linalg.det(affine)) < 1e-12:
+            return
+        inverse = np.linalg.inv(affine)
+
+        # only resample the pixels of the target covered by the image
+        h, w = self._data.shape[:2]
+        corners = np.array([[0, 0, 1], [w, 0, 1], [0, h, 1], [w, h, 1]]) @ affine
+        (x0, y0), (x1, y1) = corners[:, :2].min(0), corners[:, :2].max(0)
+        x0, y0 = max(math.floor(x0), 0), max(math.floor(y0), 0)
+        x1, y1 = min(math.ceil(x1), target.shape[1]), min(
+            math.ceil(y1), target.shape[0]
+        )
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        # data coordinates of the centers of those pixels.  When the transform
+        # doesn't rotate or shear, columns only depend on x and rows on y, so they
+        # are computed once per row/column and broadcast.
+        xs = np.arange(x0, x1, dtype=np.float64) + 0.5
+        ys = np.arange(y0, y1, dtype=np.float64) + 0.5
+        (a, b, _), (c, d, _), (e, f, _) = inverse
+        if b == 0 and c == 0:
+            cols, rows = (xs * a + e)[None, :], (ys * d + f)[:, None]
+        else:
+            cols = xs[None, :] * a + ys[:, None] * c + e
+            rows = xs[None, :] * b + ys[:, None] * d + f
+
+        values, mask = self._sample(cols, rows)
+        rgba = self._colorize(values)
+        if self._opacity < 1:
+            rgba[..., 3] *= self._opacity
+        region = target[y0:y1, x0:x1]
+        blend(region, rgba, np.broadcast_to(mask, region.shape[:2]))
+
+    def _sample(self, cols: np.ndarray, rows: np.ndarray) -> tuple[np.ndarray, Any]:
+        """Return the data at (broadcastable) coordinates, and where they are valid."""
+        data = cast("np.ndarray", self._data)
+        h, w = data.shape[:2]
+        mask = (cols >= 0) & (cols < w) & (rows >= 0) & (rows < h)
+        if self._interpolation == ImageInterpolation.NEAREST:
+            c = np.clip(cols.astype(np.intp), 0, w - 1)
+            r = np.clip(rows.astype(np.intp), 0, h - 1)
+            return data[r, c].astype(np.float32, copy=False), mask
+
+        # linear (and bicubic): between the centers of the 4 nearest pixels
+        cols, rows = cols - 0.5, rows - 0.5
+        c0, r0 = np.floor(cols), np.floor(rows)
+        fc, fr = (cols - c0).astype(np.float32), (rows - r0).astype(np.float32)
+        if data.ndim == 3:
+            fc, fr = fc[..., None], fr[..., None]
+        c0 = c0.astype(np.intp)
+        r0 = r0.astype(np.intp)
+        c1, r1 = np.clip(c0 + 1, 0, w - 1), np.clip(r0 + 1, 0, h - 1)
+        c0, r0 = np.clip(c0, 0, w - 1), np.clip(r0, 0, h - 1)
+        top = _lerp(data[r0, c0], data[r0, c1], fc)
+        bottom = _lerp(data[r1, c0], data[r1, c1], fc)
+        return _lerp(top, bottom, fr), mask
+
+    def _colorize(self, values: np.ndarray) -> np.ndarray:
+        """Return the RGBA colors (float32, straight alpha) of data `values`."""
+        lo, hi = self._clim if self._clim is not None else _min_max(self._data)
+        scale = 1 / (hi - lo) if hi != lo else 0
+        norm = (values - np.float32(lo)) * np.float32(scale)
+        nan = np.isnan(norm)
+        if has_nan := nan.any():
+            norm[nan] = 0
+        np.clip(norm, 0, 1, out=norm)
+        if self._gamma != 1:
+            norm **= np.float32(self._gamma)
+
+        if values.ndim == 3:  # RGB(A) data, the colormap is not used
+            rgba = np.ones((*values.shape[:2], 4), dtype=np.float32)
+            rgba[..., : values.shape[2]] = norm
+        else:
+            index = (norm * (LUT_SIZE - 1) + 0.5).astype(np.intp, copy=False)
+            rgba = colormap_lut(self._cmap)[index]
+        if has_nan:
+            rgba[nan.any(axis=-1) if values.ndim == 3 else nan] = 0
+        return rgba
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    a = a.astype(np.float32, copy=False)
+    return a + (b - a) * t
+
+
+def _min_max(data: Any) -> tuple[float, float]:
+    return float(np.nanmin(data)), float(np.nanmax(data))
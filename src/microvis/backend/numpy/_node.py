@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+import numpy as np
+
+from microvis.core.nodes import node as core_node
+
+if TYPE_CHECKING:
+    from microvis.core import Transform
+
+# ((x0, y0), (x1, y1))
+Bounds = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+class Node(core_node.NodeAdaptorProtocol):
+    """Node adaptor for the NumPy Backend.
+
+    There is no native object: the adaptors hold the state of the scene graph, and
+    draw themselves (then their children) into an RGBA buffer, see `_draw`.
+    """
+
+    def __init__(self, node: core_node.Node, **backend_kwargs: Any) -> None:
+        self._name = node.name
+        self._visible = node.visible
+        self._opacity = node.opacity
+        self._order = node.order
+        self._interactive = node.interactive
+        self._transform = node.transform
+        self._parent: Optional[Node] = None
+        self._children: List[Node] = []
+
+    def _vis_get_native(self) -> Any:
+        return self
+
+    def _vis_set_name(self, arg: str) -> None:
+        self._name = arg
+
+    def _vis_set_parent(self, arg: core_node.Node | None) -> None:
+        if arg is None:
+            self._set_parent(None)
+        else:
+            parent = arg.backend_adaptor("numpy")._vis_get_native()
+            if not isinstance(parent, Node):
+                raise TypeError("Parent must be a Node")
+            self._set_parent(parent)
+
+    def _vis_set_children(self, arg: list[core_node.Node]) -> None:
+        raise NotImplementedError
+
+    def _vis_set_visible(self, arg: bool) -> None:
+        self._visible = arg
+
+    def _vis_set_opacity(self, arg: float) -> None:
+        self._opacity = arg
+
+    def _vis_set_order(self, arg: int) -> None:
+        self._order = arg
+
+    def _vis_set_interactive(self, arg: bool) -> None:
+        self._interactive = arg
+
+    def _vis_set_transform(self, arg: Transform) -> None:
+        self._transform = arg
+
+    def _vis_add_node(self, node: core_node.Node) -> None:
+        child = node.backend_adaptor("numpy")._vis_get_native()
+        if not isinstance(child, Node):
+            raise TypeError("Node must be a NumPy backend Node")
+        child._set_parent(self)
+
+    def _set_parent(self, parent: Node | None) -> None:
+        if self._parent is not None and self._parent is not parent:
+            self._parent._children.remove(self)
+        if parent is not None and self._parent is not parent:
+            parent._children.append(self)
+        self._parent = parent
+
+    # ---------------------- rendering ----------------------
+
+    def _draw(self, target: np.ndarray, transform: np.ndarray) -> None:
+        """Draw this node and its children into `target`.
+
+        `target` is a (height, width, 4) float32 buffer of premultiplied RGBA, and
+        `transform` is the matrix mapping the coordinates of the parent of this
+        node to the pixels of `target`.  Children are drawn after their parent, by
+        increasing `order`.
+        """
+        if not self._visible:
+            return
+        matrix = self._transform.matrix @ transform
+        self._draw_self(target, matrix)
+        for child in sorted(self._children, key=lambda c: c._order):
+            child._draw(target, matrix)
+
+    def _draw_self(self, target: np.ndarray, transform: np.ndarray) -> None:
+        """Draw the content of this node (nothing, by default)."""
+
+    def _bounds(self, transform: np.ndarray) -> Bounds | None:
+        """Return the bounds of this node and its children, mapped by `transform`."""
+        if not self._visible:
+            return None
+        matrix = self._transform.matrix @ transform
+        corners = []
+        if (size := self._local_size()) is not None:
+            w, h = size
+            points = np.array([[0, 0, 0, 1], [w, 0, 0, 1], [0, h, 0, 1], [w, h, 0, 1]])
+            corners.extend((points @ matrix)[:, :2])
+        for child in self._children:
+            if (bounds := child._bounds(matrix)) is not None:
+                corners.extend(bounds)
+        if not corners:
+            return None
+        (x0, y0), (x1, y1) = np.min(corners, axis=0), np.max(corners, axis=0)
+        return ((float(x0), float(y0)), (float(x1), float(y1)))
+
+    def _local_size(self) -> tuple[float, float] | None:
+        """Return the (width, height) of the content of this node, if it has one."""
+        return None
@@ -0,0 +1,13 @@
+from typing import Any
+
+from microvis import core
+
+from ._node import Node
+
+
+class Scene(Node):
+    def __init__(self, scene: core.Scene, **backend_kwargs: Any) -> None:
+        super().__init__(scene)
+        # XXX: this logic could be moved to the model
+        for node in scene.children:
+            self._vis_add_node(node)  # creates the backend adaptor if needed
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ._node import Node
+
+if TYPE_CHECKING:
+    from microvis import core
+    from microvis._types import ArrayLike, ImageInterpolation
+
+
+class TiledImage(Node):
+    """NumPy backend adaptor for a TiledImage node.
+
+    The tiles are regular Image nodes (children of this node), to which the core
+    applies the image properties: the setters here have nothing to do.
+    """
+
+    def __init__(self, image: core.TiledImage, **backend_kwargs: Any) -> None:
+        super().__init__(image)
+        for tile in image.children:
+            self._vis_add_node(tile)
+
+    def _vis_set_cmap(self, arg: str) -> None:
+        pass
+
+    def _vis_set_clim(self, arg: tuple[float, float] | None) -> None:
+        pass
+
+    def _vis_set_gamma(self, arg: float) -> None:
+        pass
+
+    def _vis_set_interpolation(self, arg: ImageInterpolation) -> None:
+        pass
+
+    def _vis_set_data(self, arg: ArrayLike) -> None:
+        pass
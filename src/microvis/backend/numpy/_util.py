@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from microvis._types import Color
+
+# number of entries of the lookup table of a colormap
+LUT_SIZE = 256
+
+# colors at 9 evenly spaced stops of the perceptually uniform colormaps
+_STOPS = {
+    "viridis": [
+        "#440154", "#472d7b", "#3b528b", "#2c728e", "#21918c",
+        "#28ae80", "#5dc963", "#abdc32", "#fde725",
+    ],
+    "plasma": [
+        "#0d0887", "#4c02a1", "#7e03a8", "#a92395", "#cc4778",
+        "#e66c5c", "#f89540", "#fdc527", "#f0f921",
+    ],
+    "inferno": [
+        "#000004", "#1f0c48", "#550f6d", "#88226a", "#ba3655",
+        "#e35933", "#f98e09", "#f9cb35", "#fcffa4",
+    ],
+    "magma": [
+        "#000004", "#1c1044", "#4f127b", "#812581", "#b5367a",
+        "#e55064", "#fb8761", "#fec287", "#fcfdbf",
+    ],
+}  # fmt: skip
+
+# colormaps going from black to a single color
+_SINGLE_HUE = {
+    "grays": (1.0, 1.0, 1.0),
+    "green": (0.0, 1.0, 0.0),
+    "blue": (0.0, 0.0, 1.0),
+    "red": (1.0, 0.0, 0.0),
+    "cyan": (0.0, 1.0, 1.0),
+    "magenta": (1.0, 0.0, 1.0),
+    "yellow": (1.0, 1.0, 0.0),
+    "orange": (1.0, 0.65, 0.0),
+    "purple": (0.63, 0.13, 0.94),
+}
+
+
+def color_to_rgba(color: Color | None) -> np.ndarray | None:
+    """Return `color` as an array of (r, g, b, a) floats in [0, 1], or None."""
+    if color is None:
+        return None
+    *rgb, alpha = color.as_rgb_tuple(alpha=True)
+    return np.array([*(c / 255 for c in rgb), alpha], dtype=np.float32)
+
+
+@lru_cache(maxsize=None)
+def colormap_lut(name: str) -> np.ndarray:
+    """Return the (LUT_SIZE, 4) float32 RGBA lookup table of colormap `name`."""
+    x = np.linspace(0, 1, LUT_SIZE)
+    if name in _SINGLE_HUE:
+        rgb = x[:, None] * np.array(_SINGLE_HUE[name])
+    elif name in _STOPS:
+        stops = np.array([_hex_to_rgb(c) for c in _STOPS[name]])
+        xp = np.linspace(0, 1, len(stops))
+        rgb = np.stack([np.interp(x, xp, stops[:, i]) for i in range(3)], axis=1)
+    elif name == "hot":
+        rgb = _hot(x)
+    elif name == "bone":
+        rgb = (7 * x[:, None] + _hot(x)[:, ::-1]) / 8
+    elif name == "pink":
+        rgb = np.sqrt((2 * x[:, None] + _hot(x)) / 3)
+    else:
+        raise ValueError(f"Unknown colormap: {name!r}")
+    lut = np.ones((LUT_SIZE, 4), dtype=np.float32)
+    lut[:, :3] = rgb
+    return lut
+
+
+def _hot(x: np.ndarray) -> np.ndarray:
+    # black -> red -> yellow -> white (as in matplotlib)
+    r = np.interp(x, [0, 0.365079, 1], [0.0416, 1, 1])
+    g = np.interp(x, [0, 0.365079, 0.746032, 1], [0, 0, 1, 1])
+    b = np.interp(x, [0, 0.746032, 1], [0, 0, 1])
+    return np.stack([r, g, b], axis=1)
+
+
+def _hex_to_rgb(color: str) -> tuple[float, float, float]:
+    r, g, b = (int(color[i : i + 2], 16) / 255 for i in (1, 3, 5))
+    return r, g, b
+
+
+def blend(target: np.ndarray, rgba: np.ndarray, mask: np.ndarray | None = None) -> None:
+    """Draw `rgba` (straight alpha) over `target` (premultiplied alpha), in place.
+
+    Pixels where `mask` is False are left unchanged.
+    """
+    alpha = rgba[..., 3:]
+    if mask is not None and not mask.all():
+        alpha = alpha * mask[..., None]
+    source = rgba * alpha
+    source[..., 3:] = alpha
+    target *= 1 - alpha
+    target += source
+
+
+def to_uint8(buffer: np.ndarray) -> np.ndarray:
+    """Convert a premultiplied float RGBA buffer to straight alpha uint8 RGBA."""
+    out = buffer.copy()
+    # (transparent pixels are black: 0 / eps)
+    out[..., :3] /= np.maximum(buffer[..., 3:], np.float32(1e-12))
+    np.clip(out, 0, 1, out=out)
+    out *= 255
+    out += 0.5
+    return out.astype(np.uint8)
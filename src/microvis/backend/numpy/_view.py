@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from microvis import core
+
+from ._camera import Camera
+from ._node import Node
+from ._util import blend, color_to_rgba
+
+if TYPE_CHECKING:
+    from microvis import _types
+
+    from ._scene import Scene
+
+
+class View(Node, core.view.ViewAdaptorProtocol):
+    """View interface for NumPy Backend.
+
+    The view is drawn in the rectangle at `position` of size `size` (or the size of
+    the canvas), following the box model of `core.View`: the margin is left empty,
+    then come the border, the background, the padding and the content, in which the
+    scene is drawn (and clipped).
+    """
+
+    def __init__(self, view: core.View, **backend_kwargs: Any) -> None:
+        super().__init__(view)
+        self._position = view.position
+        self._size = view.size
+        self._background_color = color_to_rgba(view.background_color)
+        self._border_width = view.border_width
+        self._border_color = color_to_rgba(view.border_color)
+        self._padding = view.padding
+        self._margin = view.margin
+        self._camera: Optional[Camera] = None
+        self._scene: Optional[Scene] = None
+
+    def _vis_set_camera(self, cam: core.Camera) -> None:
+        camera = cam.backend_adaptor("numpy")._vis_get_native()
+        if not isinstance(camera, Camera):
+            raise TypeError("Camera must be a NumPy backend Camera")
+        if self._camera is not None:
+            self._camera._view = None
+        self._camera = camera
+        camera._view = self
+
+    def _vis_set_scene(self, scene: core.Scene) -> None:
+        self._scene = scene.backend_adaptor("numpy")._vis_get_native()
+
+    def _vis_set_position(self, arg: tuple[float, float]) -> None:
+        self._position = arg
+
+    def _vis_set_size(self, arg: tuple[float, float] | None) -> None:
+        self._size = arg
+
+    def _vis_set_background_color(self, arg: _types.Color | None) -> None:
+        self._background_color = color_to_rgba(arg)
+
+    def _vis_set_border_width(self, arg: float) -> None:
+        self._border_width = arg
+
+    def _vis_set_border_color(self, arg: _types.Color | None) -> None:
+        self._border_color = color_to_rgba(arg)
+
+    def _vis_set_padding(self, arg: int) -> None:
+        self._padding = arg
+
+    def _vis_set_margin(self, arg: int) -> None:
+        self._margin = arg
+
+    def _draw(self, target: np.ndarray, transform: np.ndarray) -> None:
+        if not self._visible:
+            return
+        h, w = target.shape[:2]
+        x, y = self._position
+        width, height = self._size if self._size is not None else (w, h)
+        # margin -> border -> background + padding -> content
+        outer = _inset((x, y, x + width, y + height), self._margin)
+        inner = _inset(outer, self._border_width)
+        content = _inset(inner, self._padding)
+
+        ox0, oy0, ox1, oy1 = _clip(outer, w, h)
+        ix0, iy0, ix1, iy1 = _clip(inner, w, h)
+        if self._border_color is not None and self._border_width > 0:
+            region = target[oy0:oy1, ox0:ox1]
+            border = np.ones(region.shape[:2], dtype=bool)
+            border[iy0 - oy0 : iy1 - oy0, ix0 - ox0 : ix1 - ox0] = False
+            blend(region, np.broadcast_to(self._border_color, region.shape), border)
+        if self._background_color is not None:
+            region = target[iy0:iy1, ix0:ix1]
+            blend(region, np.broadcast_to(self._background_color, region.shape))
+
+        if self._scene is None or self._camera is None:
+            return
+        cx0, cy0, cx1, cy1 = _clip(content, w, h)
+        rx0, ry0, rx1, ry1 = (_round(v) for v in content)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        # scene -> pixels of the content, which may be clipped by the canvas edges
+        matrix = self._camera._view_matrix(rx1 - rx0, ry1 - ry0)
+        offset = core.Transform().translated((rx0 - cx0, ry0 - cy0, 0))
+        self._scene._draw(target[cy0:cy1, cx0:cx1], matrix @ offset.matrix)
+
+
+def _round(value: float) -> int:
+    return round(value)
+
+
+def _inset(rect: tuple[float, ...], amount: float) -> tuple[float, ...]:
+    x0, y0, x1, y1 = rect
+    x0, y0 = x0 + amount, y0 + amount
+    return (x0, y0, max(x1 - amount, x0), max(y1 - amount, y0))
+
+
+def _clip(rect: tuple[float, ...], width: int, height: int) -> tuple[int, ...]:
+    """Return the pixel bounds of `rect`, clipped to a target of the given size."""
+    x0, y0, x1, y1 = (_round(v) for v in rect)
+    return (
+        min(max(x0, 0), width),
+        min(max(y0, 0), height),
+        min(max(x1, 0), width),
+        min(max(y1, 0), height),
+    )
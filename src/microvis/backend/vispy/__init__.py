@@ -3,6 +3,7 @@ from ._canvas import Canvas
 from ._image import Image
 from ._node import Node
 from ._scene import Scene
+from ._tiled_image import TiledImage
 from ._view import View
 
-__all__ = ["Canvas", "View", "Scene", "Camera", "Image", "Node"]
+__all__ = ["Camera", "Canvas", "Image", "Node", "Scene", "TiledImage", "View"]
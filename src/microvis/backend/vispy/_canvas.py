@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+import threading
+from typing import TYPE_CHECKING, Any, Callable, cast
 
-from vispy import scene
+from vispy import app, scene
 
 from microvis import core
 
@@ -13,6 +14,9 @@ if TYPE_CHECKING:
 
     from microvis import _types
 
+# how often (in seconds) draw requests made from other threads are checked
+DRAW_REQUEST_INTERVAL = 1 / 60
+
 
 class Canvas(core.canvas.CanvasAdaptorProtocol):
     """Canvas interface for Vispy Backend."""
@@ -26,6 +30,16 @@ class Canvas(core.canvas.CanvasAdaptorProtocol):
             bgcolor=pyd_color_to_vispy(canvas.background_color),
             **backend_kwargs,
         )
+        # the SceneCanvas may only be updated from the thread that created it.
+        # Draw requests from other threads (e.g. workers with results ready) set a
+        # flag instead, which a timer checks on this thread (a vispy Timer, so this
+        # works with all of the vispy app backends).  The timer only runs once the
+        # canvas has workers, see `_vis_enable_threaded_draws`.
+        self._thread_id = threading.get_ident()
+        self._draw_requested = threading.Event()
+        self._draw_timer: app.Timer | None = None
+        if canvas._workers is not None:
+            self._vis_enable_threaded_draws()
 
     def _vis_get_native(self) -> scene.SceneCanvas:
         return self._vispy_canvas
@@ -39,6 +53,30 @@ class Canvas(core.canvas.CanvasAdaptorProtocol):
             raise TypeError("View must be a Vispy ViewBox")
         self._vispy_canvas.central_widget.add_widget(vispy_view)
 
+    def _vis_connect_before_draw(self, callback: Callable[[], None]) -> None:
+        # connected first, so that it runs before the SceneCanvas draws the scene
+        self._vispy_canvas.events.draw.connect(lambda _: callback(), position="first")
+
+    def _vis_request_draw(self) -> None:
+        if threading.get_ident() == self._thread_id:
+            self._vispy_canvas.update()
+        else:
+            self._draw_requested.set()
+
+    def _vis_enable_threaded_draws(self) -> None:
+        if self._draw_timer is None:
+            self._draw_timer = app.Timer(
+                DRAW_REQUEST_INTERVAL,
+                connect=self._on_draw_timer,
+                app=self._vispy_canvas.app,
+                start=True,
+            )
+
+    def _on_draw_timer(self, _event: Any) -> None:
+        if self._draw_requested.is_set():
+            self._draw_requested.clear()
+            self._vispy_canvas.update()
+
     def _vis_set_width(self, arg: int) -> None:
         _height = self._vispy_canvas.size[1]
         self._vispy_canvas.size = (int(arg), int(_height))
@@ -47,6 +85,9 @@ class Canvas(core.canvas.CanvasAdaptorProtocol):
         _width = self._vispy_canvas.size[0]
         self._vispy_canvas.size = (int(_width), int(arg))
 
+    def _vis_set_size(self, width: int, height: int) -> None:
+        self._vispy_canvas.size = (int(width), int(height))
+
     def _vis_set_background_color(self, arg: _types.Color | None) -> None:
         self._vispy_canvas.bgcolor = pyd_color_to_vispy(arg)
 
@@ -55,6 +96,9 @@ class Canvas(core.canvas.CanvasAdaptorProtocol):
 
     def _vis_close(self) -> None:
         """Close canvas."""
+        if self._draw_timer is not None:
+            self._draw_timer.stop()
+            self._draw_timer = None
         self._vispy_canvas.close()
 
     def _vis_render(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from vispy import scene
 
 from ._node import Node
@@ -26,7 +27,7 @@ class Image(Node):
                 "interpolation": image.interpolation.value,
             }
         )
-        self._vispy_node = scene.Image(image.data, **backend_kwargs)
+        self._vispy_node = scene.Image(image.display_data(), **backend_kwargs)
 
     def _vis_set_cmap(self, arg: str) -> None:
         self._vispy_node.cmap = str(arg)
@@ -42,3 +43,27 @@ class Image(Node):
 
     def _vis_set_data(self, arg: ArrayLike) -> None:
         self._vispy_node.set_data(arg)
+
+    def _vis_update_data_region(
+        self, slices: tuple[slice, ...], values: ArrayLike
+    ) -> None:
+        """Upload only the sub-rectangle of the texture that changed."""
+        node = self._vispy_node
+        if node._data is None:
+            return
+        if not np.may_share_memory(node._data, values):
+            # vispy holds a copy of the data: keep it in sync
+            node._data[slices] = values
+
+        # A partial upload is only possible if the texture is up to date, and the
+        # region covers all channels (for RGB(A) data)
+        full_channels = all(
+            (s.start, s.stop) == (0, n)
+            for s, n in zip(slices[2:], node._data.shape[2:])
+        )
+        if node._need_texture_upload or isinstance(node.clim, str) or not full_channels:
+            node._need_texture_upload = True
+        else:
+            offset = tuple(s.start for s in slices[:2])
+            node._texture.scale_and_set_data(values, offset=offset, copy=False)
+        node.update()
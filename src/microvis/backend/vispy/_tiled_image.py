@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from vispy import scene
+
+from ._node import Node
+
+if TYPE_CHECKING:
+    from microvis import core
+    from microvis._types import ArrayLike, ImageInterpolation
+
+
+class TiledImage(Node):
+    """Vispy backend adaptor for a TiledImage node.
+
+    The tiles are regular Image nodes (children of this node), to which the core
+    applies the image properties: the setters here have nothing to do.
+    """
+
+    _vispy_node: scene.Node
+
+    def __init__(self, image: core.TiledImage, **backend_kwargs: Any) -> None:
+        self._vispy_node = scene.Node(**backend_kwargs)
+        for tile in image.children:
+            self._vis_add_node(tile)
+
+    def _vis_set_cmap(self, arg: str) -> None:
+        pass
+
+    def _vis_set_clim(self, arg: tuple[float, float] | None) -> None:
+        pass
+
+    def _vis_set_gamma(self, arg: float) -> None:
+        pass
+
+    def _vis_set_interpolation(self, arg: ImageInterpolation) -> None:
+        pass
+
+    def _vis_set_data(self, arg: ArrayLike) -> None:
+        pass
@@ -1,14 +1,41 @@
-from ._transform import Transform
-from .canvas import Canvas
-from .nodes import Camera, Image, Node, Scene
-from .view import View
+from typing import TYPE_CHECKING
+
+from microvis._lazy import attach
+
+if TYPE_CHECKING:
+    from ._transform import Transform
+    from ._vis_model import register_adaptor
+    from .canvas import Canvas
+    from .nodes import Camera, Image, MultiscaleImage, Node, Scene, TiledImage
+    from .view import View
 
 __all__ = [
     "Camera",
     "Canvas",
     "Image",
+    "MultiscaleImage",
     "Node",
     "Scene",
+    "TiledImage",
     "Transform",
     "View",
+    "register_adaptor",
 ]
+
+# the models are only imported when first used (e.g. importing `Transform` doesn't
+# import the nodes)
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "Camera": ".nodes",
+        "Canvas": ".canvas",
+        "Image": ".nodes",
+        "MultiscaleImage": ".nodes",
+        "Node": ".nodes",
+        "Scene": ".nodes",
+        "TiledImage": ".nodes",
+        "Transform": "._transform",
+        "View": ".view",
+        "register_adaptor": "._vis_model",
+    },
+)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+__all__ = ["LRUCache"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def _nbytes(obj: Any) -> int:
+    """Return the size of `obj` in bytes (`nbytes` for arrays)."""
+    nbytes = getattr(obj, "nbytes", None)
+    return int(nbytes) if nbytes is not None else sys.getsizeof(obj)
+
+
+class LRUCache(Generic[K, V]):
+    """Least-recently-used cache, bounded by the total size (in bytes) of its values.
+
+    When adding an item would exceed `max_bytes`, the least recently used items
+    are evicted.  Items larger than `max_bytes` are evicted right away.
+    All methods are thread-safe.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of all values in the cache.
+    sizeof : Callable[[V], int], optional
+        Function returning the size of a value in bytes.  By default, `nbytes` is
+        used if the value has it (e.g. numpy arrays), otherwise `sys.getsizeof`.
+    on_evict : Callable[[K, V], Any], optional
+        Called with (key, value) for every item evicted to stay within `max_bytes`
+        (but not for items removed with `pop` or `clear`).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Callable[[V], int] = _nbytes,
+        on_evict: Callable[[K, V], Any] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self._data: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({len(self)} items, "
+            f"{self._nbytes}/{self.max_bytes} bytes)"
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def items(self) -> list[tuple[K, V]]:
+        """Return (key, value) of all items, least recently used first.
+
+        This does not mark the items as used.
+        """
+        with self._lock:
+            return [(k, v) for k, (v, _) in self._data.items()]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of all values in the cache, in bytes."""
+        return self._nbytes
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value for `key` (marking it as recently used), or `default`."""
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Add `value` to the cache, evicting least recently used items as needed."""
+        size = self._sizeof(value)
+        with self._lock:
+            self.pop(key)
+            if size > self.max_bytes:
+                if self._on_evict is not None:
+                    self._on_evict(key, value)
+                return
+            self._data[key] = (value, size)
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                old_key, (old_value, old_size) = self._data.popitem(last=False)
+                self._nbytes -= old_size
+                if self._on_evict is not None:
+                    self._on_evict(old_key, old_value)
+
+    __setitem__ = put
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove `key` from the cache and return its value, or `default`."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            value, size = self._data.pop(key)
+            self._nbytes -= size
+            return value
+
+    def clear(self) -> None:
+        """Remove all items from the cache."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
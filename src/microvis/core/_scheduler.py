@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from microvis._logger import logger
+
+from ._workers import WorkerPool
+
+__all__ = ["ChunkRequest", "ChunkScheduler"]
+
+# (pyramid level, distance from the view center): lower values are read first
+Priority = Tuple[float, float]
+
+
+class ChunkRequest:
+    """A pending read of one chunk, see `ChunkScheduler.submit`."""
+
+    __slots__ = ("callback", "key", "owner", "priority", "read", "state")
+
+    def __init__(
+        self,
+        owner: Any,
+        key: Hashable,
+        read: Callable[[], Any],
+        callback: Callable[[Any], Any],
+        priority: Priority,
+    ) -> None:
+        self.owner = owner
+        self.key = key
+        self.read = read
+        self.callback = callback
+        self.priority = priority
+        # one of "queued", "running", "done" or "cancelled"
+        self.state = "queued"
+
+    def __repr__(self) -> str:
+        return f"ChunkRequest({self.key!r}, priority={self.priority}, {self.state})"
+
+
+class ChunkScheduler:
+    """Reads chunks of data in background threads, closest to the view first.
+
+    Data nodes submit a request for every chunk they need (see `submit`), with a
+    priority of `(level, distance)`: the (pyramid) level of the chunk relative to
+    the level that is displayed, and its distance from the center of the view.
+    Requests are read in order of priority, with at most `max_in_flight` reads
+    running at once, and may be re-prioritized or cancelled (see `cancel`) while
+    they are queued, e.g. when the camera moves, so that a fast pan doesn't leave
+    a long tail of reads of chunks that are no longer in view.
+
+    The results of reads are not delivered from the worker threads: they are
+    collected, `on_ready` is called (from the worker thread), and the callbacks of
+    the requests run when `deliver` is called (e.g. right before the next draw).
+    A request that is cancelled while its read is running is discarded when the
+    read completes.
+
+    Parameters
+    ----------
+    max_in_flight : int
+        The maximum number of reads running at the same time.
+    on_ready : Callable[[], Any], optional
+        Called (from a worker thread) every time a read completes.  It must be
+        thread-safe, e.g. only schedule a call of `deliver` on the owning thread.
+    pool : WorkerPool, optional
+        The pool running the reads (e.g. `Canvas.workers`).  By default, the
+        scheduler has its own pool of `max_in_flight` threads.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        on_ready: Callable[[], Any] | None = None,
+        pool: WorkerPool | None = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        self._max_in_flight = max_in_flight
+        self._on_ready = on_ready
+        self._own_pool = pool is None
+        self._pool = WorkerPool(max_in_flight) if pool is None else pool
+        self._cond = threading.Condition()
+        self._counter = itertools.count()
+        # heap of (priority, order of submission, request), may hold stale entries
+        self._queue: List[Tuple[Priority, int, ChunkRequest]] = []
+        # queued and running requests, keyed on (id(owner), key)
+        self._active: Dict[Tuple[int, Hashable], ChunkRequest] = {}
+        self._running: Set[ChunkRequest] = set()
+        # completed reads, waiting for `deliver`: (request, result, exception)
+        self._done: Deque[Tuple[ChunkRequest, Any, Optional[BaseException]]] = deque()
+        self.n_submitted = 0
+        self.n_completed = 0
+        self.n_cancelled = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(queued={self.queue_depth}, "
+            f"in_flight={self.in_flight}, cancelled={self.n_cancelled})"
+        )
+
+    @property
+    def max_in_flight(self) -> int:
+        """The maximum number of reads running at the same time."""
+        return self._max_in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for a read to start."""
+        with self._cond:
+            return self._n_queued()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of reads currently running."""
+        with self._cond:
+            return len(self._running)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of queued, running, completed and cancelled reads."""
+        with self._cond:
+            return {
+                "queued": self._n_queued(),
+                "in_flight": len(self._running),
+                "submitted": self.n_submitted,
+                "completed": self.n_completed,
+                "cancelled": self.n_cancelled,
+            }
+
+    def submit(
+        self,
+        owner: Any,
+        key: Hashable,
+        read: Callable[[], Any],
+        callback: Callable[[Any], Any],
+        priority: Priority = (0, 0),
+    ) -> ChunkRequest:
+        """Request a read of chunk `key` of `owner`.
+
+        `read()` runs in a worker thread, and `callback(result)` when the results
+        are delivered (see `deliver`).  If a request for the same chunk is already
+        queued or running, it is returned (with its priority updated) instead.
+        """
+        with self._cond:
+            request = self._active.get((id(owner), key))
+            if request is not None:
+                if request.state == "queued" and request.priority != priority:
+                    self._push(request, priority)
+                return request
+            request = ChunkRequest(owner, key, read, callback, priority)
+            self._active[(id(owner), key)] = request
+            self.n_submitted += 1
+            self._push(request, priority)
+            self._dispatch()
+        return request
+
+    def reprioritize(self, owner: Any, priority: Callable[[Any], Priority]) -> None:
+        """Update the priorities of the queued requests of `owner`.
+
+        `priority(key)` returns the new priority of the request for chunk `key`.
+        """
+        with self._cond:
+            for request in self._requests(owner):
+                if request.state == "queued":
+                    request.priority = priority(request.key)
+            # rebuild the heap, dropping stale entries
+            entries = {id(r): (r.priority, n, r) for _, n, r in self._queue}
+            self._queue = [e for e in entries.values() if e[2].state == "queued"]
+            heapq.heapify(self._queue)
+
+    def cancel(self, owner: Any = None, keep: Collection[Hashable] = ()) -> int:
+        """Cancel the requests of `owner` (or of all owners) for chunks not in `keep`.
+
+        Queued requests are never read, and the results of running ones are
+        discarded.  Returns the number of cancelled requests.
+        """
+        with self._cond:
+            if owner is None:
+                requests = list(self._active.values())
+            else:
+                requests = self._requests(owner)
+            cancelled = [r for r in requests if r.key not in keep]
+            for request in cancelled:
+                request.state = "cancelled"
+                del self._active[(id(request.owner), request.key)]
+            self.n_cancelled += len(cancelled)
+            self._cond.notify_all()
+        return len(cancelled)
+
+    def deliver(self) -> int:
+        """Run the callbacks of completed reads (call from the main thread).
+
+        Returns the number of callbacks that ran.  Exceptions raised by reads or
+        callbacks are logged.
+        """
+        n = 0
+        while True:
+            with self._cond:
+                if not self._done:
+                    return n
+                request, result, exc = self._done.popleft()
+            if request.state == "cancelled":
+                continue
+            request.state = "done"
+            if exc is not None:
+                logger.error(f"Reading chunk {request.key!r} failed: {exc!r}")
+                continue
+            try:
+                request.callback(result)
+            except Exception as e:
+                logger.error(f"Delivering chunk {request.key!r} failed: {e!r}")
+            n += 1
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until no request is queued or running.
+
+        Returns False if `timeout` (in seconds) expired first.
+        """
+        with self._cond:
+            idle = lambda: not (self._active or self._running)  # noqa: E731
+            return self._cond.wait_for(idle, timeout)
+
+    def close(self) -> None:
+        """Cancel all requests (and stop the pool of the scheduler, if it has one)."""
+        self.cancel()
+        with self._cond:
+            self._done.clear()
+        if self._own_pool:
+            self._pool.shutdown()
+
+    # ---------------------- internals ----------------------
+
+    def _n_queued(self) -> int:
+        return sum(r.state == "queued" for r in self._active.values())
+
+    def _requests(self, owner: Any) -> list[ChunkRequest]:
+        return [r for (o, _), r in self._active.items() if o == id(owner)]
+
+    def _push(self, request: ChunkRequest, priority: Priority) -> None:
+        # the previous entry of a re-prioritized request is skipped in `_dispatch`
+        request.priority = priority
+        heapq.heappush(self._queue, (priority, next(self._counter), request))
+
+    def _dispatch(self) -> None:
+        # start the reads of the queued requests with the highest priority
+        while self._queue and len(self._running) < self._max_in_flight:
+            priority, _, request = heapq.heappop(self._queue)
+            if request.state != "queued" or priority != request.priority:
+                continue  # cancelled, or a stale entry of a re-prioritized request
+            request.state = "running"
+            self._running.add(request)
+            # reads for display come before any other background work
+            self._pool.submit(self._run, request, priority=-1)
+
+    def _run(self, request: ChunkRequest) -> None:
+        result, exc = None, None
+        try:
+            result = request.read()
+        except Exception as e:
+            exc = e
+        with self._cond:
+            self._running.discard(request)
+            if request.state != "cancelled":
+                self._active.pop((id(request.owner), request.key), None)
+                self._done.append((request, result, exc))
+                self.n_completed += 1
+            self._dispatch()
+            self._cond.notify_all()
+        if self._on_ready is not None and request.state != "cancelled":
+            self._on_ready()
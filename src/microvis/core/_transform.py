@@ -3,13 +3,21 @@ from __future__ import annotations
 import functools
 import math
 from functools import reduce
-from typing import Any, Callable, Generator, Iterable, Sequence, Sized, cast
+from typing import Any, Callable, Generator, Iterable, Optional, Sequence, Sized, cast
 
 import numpy as np
 from numpy.typing import ArrayLike, DTypeLike, NDArray
+from psygnal import SignalGroup
+from pydantic.fields import PrivateAttr
 
 from ._vis_model import Field, ModelBase
 
+_object_setattr = object.__setattr__
+
+# number of points mapped at once by `map_points`, so that the temporaries stay
+# small (and in cache) whatever the number of points
+MAP_CHUNK_SIZE = 65_536
+
 
 def _arg_to_vec4(
     func: Callable[[Transform, ArrayLike], NDArray]
@@ -32,21 +40,31 @@ def _arg_to_vec4(
     def wrapper(self_: Transform, arg: ArrayLike) -> NDArray:
         if not isinstance(arg, (tuple, list, np.ndarray)):
             raise TypeError(f"Cannot convert argument to 4D vector: {arg!r}")
-        arg = np.array(arg)
+        arg = np.asarray(arg)
         flatten = arg.ndim == 1
         arg = as_vec4(arg)
 
         ret = func(self_, arg)
-        return np.copy(np.ravel(ret)) if flatten and ret is not None else ret
+        # (the result is a new array, so this doesn't need a copy)
+        return ret.reshape(-1) if flatten and ret is not None else ret
 
     return wrapper
 
 
 class Transform(ModelBase):
-    """Transformation."""
+    """Transformation.
+
+    Transforms are immutable (their `matrix` is read-only), so the inverse and
+    `is_null` are computed once per transform, and transforms derived from others
+    (`@`, `inv`, `translated`, `chain`, ...) skip validation.
+    """
 
     matrix: np.ndarray = Field(default_factory=lambda: np.eye(4))
 
+    # memoized `inv()` and `is_null()`
+    _inverse: Optional[Transform] = PrivateAttr(None)
+    _null: Optional[bool] = PrivateAttr(None)
+
     class Config:
         arbitrary_types_allowed = True
         frozen = True
@@ -55,10 +73,44 @@ class Transform(ModelBase):
         return self.matrix.astype(dtype)
 
     def __init__(_model_self_, matrix: ArrayLike | None = None) -> None:
-        matrix = np.eye(4) if matrix is None else np.asarray(matrix, dtype=float)
+        matrix = np.eye(4) if matrix is None else np.array(matrix, dtype=float)
         if matrix.shape != (4, 4):
             raise ValueError(f"Expected 4x4 matrix, got {matrix.shape}")
-        super().__init__(matrix=matrix)
+        _model_self_._init_trusted(matrix)
+
+    @classmethod
+    def _from_matrix(cls, matrix: np.ndarray) -> Transform:
+        """Return a transform of the 4x4 float `matrix` (made read-only), unchecked."""
+        obj = cls.__new__(cls)
+        obj._init_trusted(matrix)
+        return obj
+
+    def _init_trusted(self, matrix: np.ndarray) -> None:
+        # what `ModelBase.__init__` does, minus the validation of the (already
+        # valid) matrix and the creation of the signal group (see `events`).
+        matrix.flags.writeable = False
+        _object_setattr(self, "__dict__", {"matrix": matrix})
+        _object_setattr(self, "__fields_set__", {"matrix"})
+        _object_setattr(self, "_inverse", None)
+        _object_setattr(self, "_null", None)
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        # (pickle does not preserve the read-only flag of the matrix)
+        self.matrix.flags.writeable = False
+
+    @property
+    def events(self) -> SignalGroup:
+        """Return the signal group of the transform (which never emits).
+
+        It is created on first access: a transform is frozen, and most of them are
+        intermediate results that nobody listens to.
+        """
+        events = getattr(self, "_events", None)
+        if not isinstance(events, SignalGroup):
+            events = self.__signal_group__(self)
+            _object_setattr(self, "_events", events)
+        return events
 
     def __repr_args__(self) -> Sequence[tuple[str | None, Any]]:
         return [] if self.is_null() else [(None, self.matrix)]
@@ -78,28 +130,34 @@ class Transform(ModelBase):
         raise TypeError(f"Cannot convert {v!r} to Transform")
 
     def is_null(self) -> bool:
-        return np.allclose(self.matrix, np.eye(4))
+        if self._null is None:
+            _object_setattr(self, "_null", np.allclose(self.matrix, _IDENTITY))
+        return cast("bool", self._null)
 
     def __matmul__(self, other: Transform | ArrayLike) -> Transform:
         """Return the dot product of this transform with another."""
         if isinstance(other, Transform):
-            other = other.matrix
+            return Transform._from_matrix(self.matrix @ other.matrix)
         return Transform(matrix=self.matrix @ other)
 
     def dot(self, other: Transform | ArrayLike) -> Transform:
         """Return the dot product of this transform with another."""
         if isinstance(other, Transform):
-            other = other.matrix
+            return Transform._from_matrix(np.dot(self.matrix, other.matrix))
         return Transform(matrix=np.dot(self.matrix, other))
 
     @property
     def T(self) -> Transform:
         """Return the transpose of the transform."""
-        return Transform(matrix=self.matrix.T)
+        return Transform._from_matrix(self.matrix.T)
 
     def inv(self) -> Transform:
-        """Return the inverse of the transform."""
-        return Transform(matrix=np.linalg.inv(self.matrix))
+        """Return the inverse of the transform (computed once)."""
+        if self._inverse is None:
+            inverse = Transform._from_matrix(np.linalg.inv(self.matrix))
+            _object_setattr(inverse, "_inverse", self)
+            _object_setattr(self, "_inverse", inverse)
+        return cast("Transform", self._inverse)
 
     def translated(self, pos: ArrayLike) -> Transform:
         """Return new transform, translated by pos.
@@ -113,7 +171,7 @@ class Transform(ModelBase):
             Position (x, y, z) to translate by.
         """
         pos = as_vec4(np.array(pos))
-        return self.dot(translate(pos[0, :3]))
+        return Transform._from_matrix(self.matrix @ translate(pos[0, :3]))
 
     def rotated(
         self, angle: float, axis: ArrayLike, about: ArrayLike | None = None
@@ -135,8 +193,8 @@ class Transform(ModelBase):
         """
         if about is not None:
             about = as_vec4(about)[0, :3]
-            return self.translated(-about).dot(rotate(angle, axis)).translated(about)
-        return self.dot(rotate(angle, axis))
+            return self.translated(-about).rotated(angle, axis).translated(about)
+        return Transform._from_matrix(self.matrix @ rotate(angle, axis))
 
     def scaled(
         self, scale_factor: ArrayLike, center: ArrayLike | None = None
@@ -158,7 +216,7 @@ class Transform(ModelBase):
         if center is not None:
             center = as_vec4(center)[0, :3]
             _scale = np.dot(np.dot(translate(-center), _scale), translate(center))
-        return self.dot(_scale)
+        return Transform._from_matrix(self.matrix @ _scale)
 
     @_arg_to_vec4
     def map(self, coords: ArrayLike) -> NDArray:
@@ -191,7 +249,40 @@ class Transform(ModelBase):
         coords : ndarray
             Coordinates.
         """
-        return cast(NDArray, np.dot(coords, np.linalg.inv(self.matrix)))
+        return cast(NDArray, np.dot(coords, self.inv().matrix))
+
+    def map_points(
+        self, points: ArrayLike, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Map an (N, 2) or (N, 3) array of points, with no (N, 4) temporaries.
+
+        Unlike `map`, the returned points have the same shape as `points` (z is
+        dropped for 2D points, and projective transforms are divided by w).  This
+        is meant for large numbers of points (e.g. picking, or export), which are
+        mapped in chunks of `MAP_CHUNK_SIZE`.
+
+        Parameters
+        ----------
+        points : array-like
+            (N, 2) or (N, 3) coordinates (x, y[, z]).
+        out : np.ndarray, optional
+            Array of the same shape as `points`, and float32 or float64 dtype, in
+            which to write the result.  May be `points` itself.  If None, a new
+            array is returned, of float32 dtype if `points` is float32, otherwise
+            float64.
+
+        Returns
+        -------
+        out : np.ndarray
+            The mapped points.
+        """
+        return _map_points(self.matrix, points, out)
+
+    def imap_points(
+        self, points: ArrayLike, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Inverse map an (N, 2) or (N, 3) array of points (see `map_points`)."""
+        return _map_points(self.inv().matrix, points, out)
 
     @classmethod
     def chain(cls, *transforms: Transform) -> Transform:
@@ -207,7 +298,45 @@ class Transform(ModelBase):
         transform : Transform
             Chained transform.
         """
-        return reduce(lambda a, b: a @ b, transforms, cls())
+        if not transforms:
+            return cls()
+        return cls._from_matrix(reduce(np.matmul, (t.matrix for t in transforms)))
+
+
+_IDENTITY = np.eye(4)
+_IDENTITY.flags.writeable = False
+
+
+def _map_points(
+    matrix: np.ndarray, points: ArrayLike, out: np.ndarray | None
+) -> np.ndarray:
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(f"Expected an (N, 2) or (N, 3) array, got {points.shape}")
+    if out is None:
+        dtype = np.float32 if points.dtype == np.float32 else np.float64
+        out = np.empty(points.shape, dtype=dtype)
+    elif out.shape != points.shape or out.dtype not in (np.float32, np.float64):
+        raise ValueError(
+            f"`out` must be a float32 or float64 array of shape {points.shape}"
+        )
+
+    ndim = points.shape[1]
+    # row vectors: [x, y, (z,) 1] @ matrix, keeping the x, y, (z) (and w) columns
+    linear = matrix[:ndim, :ndim].astype(out.dtype)
+    offset = matrix[3, :ndim].astype(out.dtype)
+    projective = not np.array_equal(matrix[:, 3], (0, 0, 0, 1))
+    w_col = matrix[:ndim, 3].astype(out.dtype)
+    for start in range(0, len(points), MAP_CHUNK_SIZE):
+        chunk = slice(start, start + MAP_CHUNK_SIZE)
+        src, dst = points[chunk], out[chunk]
+        # (w must be computed before `dst` is written: it may be `src`)
+        w = src @ w_col + matrix[3, 3] if projective else None
+        np.matmul(src, linear, out=dst)
+        dst += offset
+        if w is not None:
+            dst /= w[:, None]
+    return out
 
 
 # from vispy ...
@@ -229,7 +358,7 @@ def rotate(angle: float, axis: ArrayLike) -> np.ndarray:
         Transformation matrix describing the rotation.
     """
     angle = np.radians(angle)
-    axis = np.array(axis, copy=False)
+    axis = np.asarray(axis)
     if len(axis) != 3:
         raise ValueError("axis must be a 3-element vector")
     x, y, z = axis / np.linalg.norm(axis)
@@ -316,7 +445,7 @@ def as_vec4(obj: ArrayLike, default: ArrayLike = (0, 0, 0, 1)) -> np.ndarray:
     obj = np.atleast_2d(obj)
     # For multiple vectors, reshape to (..., 4)
     if obj.shape[-1] < 4:
-        new = np.empty(obj.shape[:-1] + (4,), dtype=obj.dtype)
+        new = np.empty((*obj.shape[:-1], 4), dtype=obj.dtype)
         new[:] = default
         new[..., : obj.shape[-1]] = obj
         obj = new
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import sys
 from abc import abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 from importlib import import_module
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Generic,
+    Iterator,
+    Optional,
     Protocol,
-    Set,
+    Tuple,
     Type,
     TypeVar,
     cast,
@@ -20,15 +26,41 @@ from psygnal import EmissionInfo, EventedModel
 from psygnal.containers import EventedList
 from pydantic.fields import Field, PrivateAttr
 
-from microvis._logger import logger
+from microvis._logger import debug_enabled, logger
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from importlib.metadata import EntryPoint
 
-__all__ = ["Field", "VisModel", "ModelBase", "SupportsVisibility"]
+__all__ = [
+    "Field",
+    "ModelBase",
+    "SupportsVisibility",
+    "UpdateQueue",
+    "VisModel",
+    "register_adaptor",
+]
 
 SETTER_METHOD = "_vis_set_{name}"
 
+# {(model_class, adaptor_class): {signal_name: setter_method_name}}
+# populated lazily by `_setter_table`, once per (model, adaptor) class pair.
+_SETTER_TABLES: Dict[Tuple[type, type], Dict[str, str]] = {}
+
+# {(model_class, backend_name): adaptor_class}, of validated adaptor classes.
+# populated by `register_adaptor`, or lazily by `VisModel._get_adaptor_class` the
+# first time a model class is used with a backend.
+_ADAPTOR_CLASSES: Dict[Tuple[type, str], type] = {}
+
+# Entry point group through which other packages may provide a backend.  The name
+# of the entry point is the name of the backend, and its object a module (or any
+# namespace) with adaptor classes named after the core classes, like
+# `microvis.backend.vispy`.  e.g. in pyproject.toml:
+#
+#     [project.entry-points."microvis.backends"]
+#     mybackend = "my_package.microvis_backend"
+BACKEND_ENTRY_POINT_GROUP = "microvis.backends"
+
 
 class ModelBase(EventedModel):
     """Base class for all pydantic-style models."""
@@ -88,18 +120,32 @@ class VisModel(ModelBase, Generic[AdaptorType]):
     # but there is discussion that this might be too limiting.
     # dicsussion: https://github.com/python/mypy/issues/5144
     _backend_adaptors: ClassVar[Dict[str, BackendAdaptorProtocol]] = PrivateAttr({})
-    # This is the set of all field names that must have setters in the backend adaptor.
-    # set during the init
-    _evented_fields: ClassVar[Set[str]] = PrivateAttr(set())
-    # this is a cache of all adaptor classes that have been validated to implement
-    # the correct methods (via validate_adaptor_class).
-    _validated_adaptor_classes: ClassVar[Set[Type]] = PrivateAttr(set())
+    # {backend_name: {signal_name: bound adaptor setter}}
+    # This is the dispatch table used by `_on_any_event`.  It is populated once
+    # when an adaptor is created, so that emitting an event to a backend costs a
+    # single dict lookup per adaptor.
+    _adaptor_setters: Dict[str, Dict[str, Callable]] = PrivateAttr(default_factory=dict)
+    # {signal_name: args} of events collected inside of `hold_updates`.
+    # None when updates are not being held.
+    _held_events: Optional[Dict[str, tuple]] = PrivateAttr(None)
+    # When not None, backend updates are deferred: they are collected in this
+    # (usually canvas-owned) queue, and applied when the queue is flushed.
+    _update_queue: Optional[UpdateQueue] = PrivateAttr(None)
 
     # This is an optional class variable that can be set by subclasses to
     # provide a mapping of backend names to backend adaptor classes.
     # see `examples/custom_node.py` for an example of how this is used.
+    # (it is read once per class and backend, see `_get_adaptor_class`)
     BACKEND_ADAPTORS: ClassVar[Dict[str, Type[BackendAdaptorProtocol]]]
 
+    # Mapping of {composite_name: (field_name, ...)} for related fields that a
+    # backend may prefer to set in a single call.  When updates are flushed
+    # (see `hold_updates`) and any of the fields changed, an adaptor method named
+    # `_vis_set_{composite_name}` will be called with the values of all fields
+    # (in order), if the adaptor implements it.  Otherwise, each field's own
+    # setter is used.
+    COMPOSITE_SETTERS: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+
     def has_backend_adaptor(self, backend: str | None = None) -> bool:
         """Return True if the object has a backend adaptor.
 
@@ -122,7 +168,9 @@ class VisModel(ModelBase, Generic[AdaptorType]):
         backend = backend or _get_default_backend()
         if backend not in self._backend_adaptors:
             cls = self._get_adaptor_class(backend)
-            self._backend_adaptors[backend] = self._create_adaptor(cls)
+            adaptor = self._create_adaptor(cls)
+            self._backend_adaptors[backend] = adaptor
+            self._adaptor_setters[backend] = self._bind_setters(adaptor)
         return cast("AdaptorType", self._backend_adaptors[backend])
 
     @property
@@ -146,15 +194,25 @@ class VisModel(ModelBase, Generic[AdaptorType]):
         backend: str,
         class_name: str | None = None,
     ) -> Type[AdaptorType]:
-        """Retrieve the adaptor class with the same name as the object class."""
+        """Retrieve the adaptor class with the same name as the object class.
+
+        In order, the adaptor class is the one registered with `register_adaptor`,
+        the one in `BACKEND_ADAPTORS`, or the class named `class_name` (by default,
+        the name of the object class) in the backend module.  It is validated and
+        cached the first time, so this is a single dict lookup afterwards.
+        """
+        key = (type(self), backend)
+        if (adaptor_class := _ADAPTOR_CLASSES.get(key)) is not None:
+            return cast("Type[AdaptorType]", adaptor_class)
+
         if hasattr(self, "BACKEND_ADAPTORS") and backend in self.BACKEND_ADAPTORS:
             adaptor_class = self.BACKEND_ADAPTORS[backend]
             logger.debug(f"Using class-provided adaptor class: {adaptor_class}")
         else:
             class_name = class_name or type(self).__name__
-            backend_module = import_module(f"microvis.backend.{backend}")
-            adaptor_class = getattr(backend_module, class_name)
-        return self.validate_adaptor_class(adaptor_class)
+            adaptor_class = getattr(_backend_module(backend), class_name)
+        _ADAPTOR_CLASSES[key] = self.validate_adaptor_class(adaptor_class)
+        return cast("Type[AdaptorType]", adaptor_class)
 
     def _create_adaptor(self, cls: Type[AdaptorType]) -> AdaptorType:
         """Instantiate the backend adaptor object.
@@ -171,67 +229,248 @@ class VisModel(ModelBase, Generic[AdaptorType]):
         if hasattr(self, "events"):
             self.events.connect(self._on_any_event)
 
-        # determine fields that need setter methods in the backend adaptor
-        # TODO:
-        # this really shouldn't need to be in the init.  `__init_subclass__` would be
-        # better, but that unfortunately gets called after EventedModel.__new__.
-        # need to look into it
-        signals = set(self.__signal_group__._signals_)
-        self._evented_fields.update(set(self.__fields__).intersection(signals))
+    def _bind_setters(self, adaptor: Any) -> dict[str, Callable]:
+        """Return a dict of {signal_name: bound setter} for `adaptor`."""
+        setters = {}
+        for signal_name, method in _setter_table(type(self), type(adaptor)).items():
+            try:
+                setters[signal_name] = getattr(adaptor, method)
+            except AttributeError as e:
+                logger.exception(e)
+        return setters
 
     def _on_any_event(self, info: EmissionInfo) -> None:
-        signal_name = info.signal.name
-        if signal_name not in self._evented_fields:
+        self._update_backend(info.signal.name, info.args)
+
+    def _update_backend(self, name: str, args: tuple) -> None:
+        """Send `args` to the `_vis_set_{name}` method of all backend adaptors.
+
+        If updates are being held (`hold_updates`) or deferred (`_update_queue`),
+        the update is recorded and applied later instead.
+        """
+        if not self._adaptor_setters:
+            return
+        if (held := self._held_events) is not None:
+            # last value wins, it will be sent when `hold_updates` exits.
+            held[name] = (
+                self._merge_update(name, held[name], args) if name in held else args
+            )
+            return
+        if self._update_queue is not None:
+            self._update_queue.put(self, name, args)
             return
 
         # NOTE: this loop runs anytime any attribute on any model is changed...
         # so it has the potential to be a performance bottleneck.
         # It is the the apparent cost, however, for allowing a model object to have
-        # multiple simultaneous backend adaptors. This should be re-evaluated often.
-        for adaptor in self.backend_adaptors:
-            try:
-                name = SETTER_METHOD.format(name=signal_name)
-                setter = getattr(adaptor, name)
-            except AttributeError as e:
-                logger.exception(e)
-                return
+        # multiple simultaneous backend adaptors.  The setters are looked up once
+        # per adaptor (see `_bind_setters`), so this should stay cheap.
+        for setters in self._adaptor_setters.values():
+            if (setter := setters.get(name)) is not None:
+                self._call_setter(setter, name, args)
 
-            event_name = f"{type(self).__name__}.{signal_name}"
-            logger.debug(f"{event_name}={info.args} emitting to backend")
+    def _merge_update(self, name: str, old: tuple, new: tuple) -> tuple:
+        """Combine two pending (not yet applied) updates of the same name.
 
-            try:
-                setter(*info.args)
-            except Exception as e:
-                logger.exception(e)
+        By default, the last value wins.  Subclasses may override this for
+        updates that accumulate (e.g. dirty regions of data).
+        """
+        return new
+
+    def _call_setter(self, setter: Callable, name: str, args: tuple) -> None:
+        if debug_enabled():
+            logger.debug(f"{type(self).__name__}.{name}={args} emitting to backend")
+        try:
+            setter(*args)
+        except Exception as e:
+            logger.exception(e)
+
+    @contextmanager
+    def hold_updates(self) -> Iterator[None]:
+        """Context in which backend updates are collected and applied once at exit.
+
+        Events are still emitted as usual inside of the context, but they are not
+        sent to the backend adaptor(s) until the outermost context exits.  If a
+        field changes more than once, only the last value is sent. Related fields
+        may be applied to the backend in a single call (see `COMPOSITE_SETTERS`).
+
+        Examples
+        --------
+        >>> with image.hold_updates():
+        ...     image.cmap = "viridis"
+        ...     image.gamma = 0.5
+        """
+        if self._held_events is not None:  # already holding
+            yield
+            return
+
+        self._held_events = {}
+        try:
+            yield
+        finally:
+            updates, self._held_events = self._held_events, None
+            if self._update_queue is not None:
+                for name, args in updates.items():
+                    self._update_queue.put(self, name, args)
+            else:
+                self._apply_updates(updates)
+
+    batch = hold_updates
+
+    def _apply_updates(self, updates: dict[str, tuple]) -> None:
+        """Send a batch of {signal_name: args} updates to all backend adaptors."""
+        if not updates:
+            return
+        for backend, adaptor in self._backend_adaptors.items():
+            pending = dict(updates)
+            for composite, fields in self.COMPOSITE_SETTERS.items():
+                if not any(f in pending for f in fields):
+                    continue
+                method = SETTER_METHOD.format(name=composite)
+                if (setter := getattr(adaptor, method, None)) is None:
+                    continue
+                args = tuple(
+                    pending.pop(f)[0] if f in pending else getattr(self, f)
+                    for f in fields
+                )
+                self._call_setter(setter, composite, args)
+
+            setters = self._adaptor_setters.get(backend, {})
+            for signal_name, args in pending.items():
+                if (setter := setters.get(signal_name)) is not None:
+                    self._call_setter(setter, signal_name, args)
+
+    def _set_update_queue(self, queue: UpdateQueue | None) -> None:
+        """Defer backend updates to `queue` (or apply them immediately if None)."""
+        self._update_queue = queue
 
     # TODO:
     # def detach(self) -> None:
     #     """Disconnect and destroy the backend adaptor from the object."""
     #     self._backend = None
 
-    def validate_adaptor_class(self, adaptor_class: Any) -> type[AdaptorType]:
-        """Validate that the adaptor class is appropriate for the core object."""
-        # XXX: this could be a classmethod, but it's turning out to be difficult to
-        # set _evented_fields on that class (see note in __init__)
-
-        if adaptor_class in self._validated_adaptor_classes:
-            return cast("Type[AdaptorType]", adaptor_class)
+    @classmethod
+    def validate_adaptor_class(cls, adaptor_class: Any) -> type[AdaptorType]:
+        """Validate that the adaptor class is appropriate for the core object.
 
-        cls = type(self)
+        The adaptor class must have a `_vis_set_<name>` method for each evented
+        field of the model.
+        """
         logger.debug(f"Validating adaptor class {adaptor_class} for {cls}")
         if missing := {
-            SETTER_METHOD.format(name=field)
-            for field in self._evented_fields
-            if not hasattr(adaptor_class, SETTER_METHOD.format(name=field))
+            method
+            for method in _setter_table(cls, adaptor_class).values()
+            if not hasattr(adaptor_class, method)
         }:
             raise ValueError(
                 f"{adaptor_class} cannot be used as a backend object for "
                 f"{cls}: it is missing the following methods: {missing}"
             )
-        self._validated_adaptor_classes.add(adaptor_class)
         return cast("Type[AdaptorType]", adaptor_class)
 
 
+class UpdateQueue:
+    """Pending backend updates, coalesced per model and per field.
+
+    Models with an update queue (see `VisModel._set_update_queue`) put their
+    changes here instead of calling the backend immediately.  `flush` then applies
+    each changed field once, with its most recent value.  A `Canvas` in deferred
+    sync mode owns one of these, and flushes it right before drawing.
+
+    Parameters
+    ----------
+    on_pending : Callable[[], Any], optional
+        Called whenever an update is added to an empty queue.  (e.g. to schedule
+        a redraw, at which point the queue will be flushed.)
+    """
+
+    def __init__(self, on_pending: Callable[[], Any] | None = None) -> None:
+        # {id(model): (model, {signal_name: args})}
+        self._pending: dict[int, tuple[VisModel, dict[str, tuple]]] = {}
+        self._on_pending = on_pending
+
+    def __len__(self) -> int:
+        """Return the number of pending (model, field) updates."""
+        return sum(len(updates) for _, updates in self._pending.values())
+
+    def put(self, model: VisModel, name: str, args: tuple) -> None:
+        """Record that field `name` of `model` changed to `args`."""
+        was_empty = not self._pending
+        if (entry := self._pending.get(id(model))) is None:
+            self._pending[id(model)] = (model, {name: args})
+        elif name in (updates := entry[1]):
+            updates[name] = model._merge_update(name, updates[name], args)
+        else:
+            updates[name] = args
+        if was_empty and self._on_pending is not None:
+            self._on_pending()
+
+    def flush(self) -> None:
+        """Apply all pending updates to the backend adaptors, and clear the queue."""
+        pending, self._pending = self._pending, {}
+        for model, updates in pending.values():
+            model._apply_updates(updates)
+
+
+def _setter_table(model_cls: type[VisModel], adaptor_cls: type) -> dict[str, str]:
+    """Return {signal_name: setter_method_name} for a (model, adaptor) class pair.
+
+    The result is cached, so the (relatively expensive) introspection of evented
+    fields only happens once per pair of classes.
+    """
+    key = (model_cls, adaptor_cls)
+    if key not in _SETTER_TABLES:
+        signals = set(model_cls.__signal_group__._signals_)
+        _SETTER_TABLES[key] = {
+            name: SETTER_METHOD.format(name=name)
+            for name in model_cls.__fields__
+            if name in signals
+        }
+    return _SETTER_TABLES[key]
+
+
+def register_adaptor(
+    model_class: type[VisModel], backend: str, adaptor_class: type
+) -> None:
+    """Use `adaptor_class` as the `backend` adaptor of all `model_class` objects.
+
+    This takes precedence over `BACKEND_ADAPTORS` and the backend module, for
+    objects created afterwards.  Subclasses of `model_class` are not affected.
+
+    Raises
+    ------
+    ValueError
+        If `adaptor_class` doesn't implement a setter for each evented field of
+        `model_class`.
+    """
+    model_class.validate_adaptor_class(adaptor_class)
+    _ADAPTOR_CLASSES[(model_class, backend)] = adaptor_class
+
+
+@lru_cache(maxsize=None)
+def _backend_entry_points() -> dict[str, EntryPoint]:
+    """Return {backend_name: entry_point} of the installed backend plugins."""
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        eps = entry_points(group=BACKEND_ENTRY_POINT_GROUP)
+    else:
+        eps = entry_points().get(BACKEND_ENTRY_POINT_GROUP, ())
+    return {ep.name: ep for ep in eps}
+
+
+@lru_cache(maxsize=None)
+def _backend_module(backend: str) -> Any:
+    """Return the module with the adaptor classes of `backend`.
+
+    Backends provided by entry points take precedence over `microvis.backend.*`.
+    """
+    if (ep := _backend_entry_points().get(backend)) is not None:
+        logger.debug(f"Loading backend {backend!r} from entry point {ep.value}")
+        return ep.load()
+    return import_module(f"microvis.backend.{backend}")
+
+
 # XXX: the default behavior should be to
 # pick the "right" backend for the current environment.  i.e. microvis
 # should work with no configuration in both jupyter and ipython desktop.)
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import (
+    CancelledError,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from typing import Any, Callable, Deque, List, Tuple
+
+from microvis._logger import logger
+
+__all__ = ["Task", "WorkerPool", "check_cancelled", "current_task", "default_pool"]
+
+# threads of the pool used by objects that are not on a canvas (see `default_pool`)
+DEFAULT_THREADS = 4
+
+_local = threading.local()
+_DEFAULT_POOL: WorkerPool | None = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+class Task(Future):
+    """A function submitted to a `WorkerPool`.
+
+    This is a `concurrent.futures.Future`, whose `cancel` also requests the
+    cancellation of a task that is already running: the function may check for it
+    with `check_cancelled` (cooperative cancellation), and its result is never
+    delivered.
+    """
+
+    def __init__(self, priority: float) -> None:
+        super().__init__()
+        self.priority = priority
+        self._cancel_requested = threading.Event()
+
+    def cancel(self) -> bool:
+        self._cancel_requested.set()
+        return super().cancel()
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether `cancel` was called (even if the task was already running)."""
+        return self._cancel_requested.is_set()
+
+
+def current_task() -> Task | None:
+    """Return the task running in the current (worker) thread, if any."""
+    return getattr(_local, "task", None)
+
+
+def check_cancelled() -> None:
+    """Raise `CancelledError` if the task running in this thread was cancelled.
+
+    Long-running functions submitted to a `WorkerPool` should call this regularly.
+    Outside of a task, this does nothing.
+    """
+    task = current_task()
+    if task is not None and task.cancel_requested:
+        raise CancelledError
+
+
+class _Queue:
+    """Priority queue and executor of one kind of worker (threads or processes)."""
+
+    def __init__(self, max_workers: int, executor_cls: type) -> None:
+        self.max_workers = max_workers
+        self.executor_cls = executor_cls
+        self.executor: Any = None
+        # heap of (priority, order of submission, task, fn, args)
+        self.heap: List[Tuple[float, int, Task, Callable, tuple]] = []
+        self.running = 0
+
+    def get_executor(self) -> Any:
+        if self.executor is None:
+            name = {"thread_name_prefix": "microvis-worker"}
+            kwargs = name if self.executor_cls is ThreadPoolExecutor else {}
+            self.executor = self.executor_cls(self.max_workers, **kwargs)
+        return self.executor
+
+
+class WorkerPool:
+    """Bounded pools of worker threads and processes, for all background work.
+
+    Functions are submitted with a priority (lower values run first: reads of the
+    data in view use -1, reads ahead 1, and anything else defaults to 0), and run
+    with at most `max_threads` threads and `max_processes` processes at once (both
+    are only started when first needed).  `submit` returns a `Task` (a `Future`),
+    which may be cancelled: queued tasks never run, and running ones may stop
+    early by calling `check_cancelled` (functions run in a process can't).
+
+    Results are marshalled back to the thread that owns the backend: the
+    `callback` of a task runs when `deliver` is called from that thread (e.g.
+    right before the next draw, see `Canvas.flush_updates`), and `on_ready` is
+    called (from the worker) every time such a result is waiting.
+
+    Parameters
+    ----------
+    max_threads : int
+        The maximum number of worker threads.
+    max_processes : int
+        The maximum number of worker processes (0 to not allow any).
+    on_ready : Callable[[], Any], optional
+        Called from a worker when a task with a callback completes.  It must be
+        thread-safe, e.g. only schedule a call of `deliver` on the owning thread.
+    """
+
+    def __init__(
+        self,
+        max_threads: int = 4,
+        max_processes: int = 0,
+        on_ready: Callable[[], Any] | None = None,
+    ) -> None:
+        if max_threads < 1:
+            raise ValueError(f"max_threads must be >= 1, got {max_threads}")
+        self._threads = _Queue(max_threads, ThreadPoolExecutor)
+        self._processes = _Queue(max_processes, ProcessPoolExecutor)
+        self._on_ready = on_ready
+        self._cond = threading.Condition()
+        self._counter = itertools.count()
+        # completed tasks, waiting for `deliver`
+        self._done: Deque[Tuple[Task, Callable[[Any], Any]]] = deque()
+        self._closed = False
+        self.n_completed = 0
+        self.n_cancelled = 0
+
+    def __repr__(self) -> str:
+        s = self.stats()
+        return (
+            f"{type(self).__name__}(queued={s['queued']}, threads={s['threads']}, "
+            f"processes={s['processes']})"
+        )
+
+    @property
+    def max_threads(self) -> int:
+        return self._threads.max_workers
+
+    @property
+    def max_processes(self) -> int:
+        return self._processes.max_workers
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of queued, running, completed and cancelled tasks."""
+        with self._cond:
+            queued = sum(
+                not t.cancelled()
+                for q in (self._threads, self._processes)
+                for _, _, t, _, _ in q.heap
+            )
+            return {
+                "queued": queued,
+                "threads": self._threads.running,
+                "processes": self._processes.running,
+                "completed": self.n_completed,
+                "cancelled": self.n_cancelled,
+            }
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: float = 0,
+        callback: Callable[[Any], Any] | None = None,
+        process: bool = False,
+    ) -> Task:
+        """Run `fn(*args)` in a worker thread (or process, if `process` is True).
+
+        `callback(result)` is called by `deliver` once `fn` has returned, unless
+        the task was cancelled.  Functions run in a process (and their arguments
+        and results) must be picklable.
+        """
+        queue = self._processes if process else self._threads
+        if process and not queue.max_workers:
+            raise ValueError("This WorkerPool doesn't allow worker processes")
+        task = Task(priority)
+        if callback is not None:
+            task.add_done_callback(partial(self._task_done, callback))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a WorkerPool that is shut down")
+            entry = (priority, next(self._counter), task, fn, args)
+            heapq.heappush(queue.heap, entry)
+            self._dispatch(queue)
+        return task
+
+    def deliver(self) -> int:
+        """Run the callbacks of completed tasks (call from the backend's thread).
+
+        Returns the number of callbacks that ran.  Exceptions raised by tasks or
+        callbacks are logged.
+        """
+        n = 0
+        while True:
+            with self._cond:
+                if not self._done:
+                    return n
+                task, callback = self._done.popleft()
+            if task.cancel_requested:
+                continue
+            if (exc := task.exception()) is not None:
+                logger.error(f"Background task failed: {exc!r}")
+                continue
+            try:
+                callback(task.result())
+            except Exception as e:
+                logger.error(f"Delivering the result of a task failed: {e!r}")
+            n += 1
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until no task is queued or running.
+
+        Returns False if `timeout` (in seconds) expired first.
+        """
+
+        def _idle() -> bool:
+            return not any(
+                q.heap or q.running for q in (self._threads, self._processes)
+            )
+
+        with self._cond:
+            return self._cond.wait_for(_idle, timeout)
+
+    def shutdown(self) -> None:
+        """Cancel all tasks, and stop the workers (without waiting for them).
+
+        Running tasks are asked to stop (see `check_cancelled`), and their results
+        are discarded.  Nothing can be submitted afterwards.
+        """
+        with self._cond:
+            self._closed = True
+            for queue in (self._threads, self._processes):
+                for _, _, task, _, _ in queue.heap:
+                    task.cancel()
+                self.n_cancelled += len(queue.heap)
+                queue.heap.clear()
+            self._done.clear()
+            executors = [q.executor for q in (self._threads, self._processes)]
+            self._threads.executor = self._processes.executor = None
+            self._cond.notify_all()
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def process_executor(self) -> ProcessPoolExecutor:
+        """Return the (bounded) process pool, e.g. for `build_pyramid`."""
+        if not self._processes.max_workers:
+            raise ValueError("This WorkerPool doesn't allow worker processes")
+        with self._cond:
+            return self._processes.get_executor()  # type: ignore [no-any-return]
+
+    # ---------------------- internals ----------------------
+
+    def _dispatch(self, queue: _Queue) -> None:
+        # start the queued tasks with the highest priority (lowest value)
+        while queue.heap and queue.running < queue.max_workers:
+            _, _, task, fn, args = heapq.heappop(queue.heap)
+            if not task.set_running_or_notify_cancel():
+                self.n_cancelled += 1
+                continue
+            queue.running += 1
+            if queue is self._threads:
+                queue.get_executor().submit(self._run, task, fn, args)
+            else:
+                future = queue.get_executor().submit(fn, *args)
+                future.add_done_callback(lambda f, t=task: self._process_done(t, f))
+
+    def _run(self, task: Task, fn: Callable, args: tuple) -> None:
+        _local.task = task
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            task.set_exception(e)
+        else:
+            task.set_result(result)
+        finally:
+            _local.task = None
+            self._finished(self._threads)
+
+    def _process_done(self, task: Task, future: Future) -> None:
+        if future.cancelled():
+            task.set_exception(CancelledError())
+        elif (exc := future.exception()) is not None:
+            task.set_exception(exc)
+        else:
+            task.set_result(future.result())
+        self._finished(self._processes)
+
+    def _finished(self, queue: _Queue) -> None:
+        with self._cond:
+            queue.running -= 1
+            self.n_completed += 1
+            if not self._closed:
+                self._dispatch(queue)
+            self._cond.notify_all()
+
+    def _task_done(self, callback: Callable[[Any], Any], task: Task) -> None:
+        # a done-callback of tasks submitted with a callback (runs in the worker)
+        if task.cancelled() or task.cancel_requested:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            self._done.append((task, callback))
+        if self._on_ready is not None:
+            self._on_ready()
+
+
+def default_pool() -> WorkerPool:
+    """Return the (lazily created) pool used by objects that are not on a canvas."""
+    global _DEFAULT_POOL
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = WorkerPool(DEFAULT_THREADS)
+        return _DEFAULT_POOL
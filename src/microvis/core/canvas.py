@@ -2,13 +2,25 @@ from __future__ import annotations
 
 import warnings
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, Protocol, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
 from psygnal.containers import EventedList
+from pydantic import PrivateAttr
 
 from microvis._types import Color  # noqa: TCH001
 
-from ._vis_model import Field, SupportsVisibility, VisModel
+from ._scheduler import ChunkScheduler
+from ._vis_model import Field, SupportsVisibility, UpdateQueue, VisModel
+from ._workers import WorkerPool
 from .view import View
 
 if TYPE_CHECKING:
@@ -36,6 +48,19 @@ class CanvasAdaptorProtocol(SupportsVisibility['Canvas'], Protocol):
     def _vis_render(self) -> np.ndarray: ...
     @abstractmethod
     def _vis_add_view(self, view: View) -> None: ...
+    # optional composite setter, see VisModel.COMPOSITE_SETTERS
+    # def _vis_set_size(self, width: int, height: int) -> None: ...
+    # optional, used by Canvas.deferred_sync:
+    # call `callback` right before each draw, and schedule a redraw.
+    # def _vis_connect_before_draw(self, callback: Callable[[], None]) -> None: ...
+    # `_vis_request_draw` may be called from any thread (e.g. by the workers of
+    # `Canvas.workers` when a result is ready): adaptors must marshal the redraw to
+    # the thread that owns the native canvas, and must not draw from the caller.
+    # def _vis_request_draw(self) -> None: ...
+    # optional, called on the canvas thread when `Canvas.workers` is created (or
+    # right away if it exists when the adaptor is created): from now on,
+    # `_vis_request_draw` may be called from other threads.
+    # def _vis_enable_threaded_draws(self) -> None: ...
     def _vis_get_ipython_mimebundle(
         self, *args: Any, **kwargs: Any
     ) -> dict | tuple[dict, dict]:
@@ -71,6 +96,102 @@ class Canvas(VisModel[CanvasAdaptorProtocol]):
     title: str = Field(default="", description="The title of the canvas.")
     views: ViewList[View] = Field(default_factory=ViewList, allow_mutation=False)
 
+    COMPOSITE_SETTERS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "size": ("width", "height")
+    }
+
+    # maximum number of chunk reads running at the same time, see `scheduler`
+    MAX_CHUNK_READS: ClassVar[int] = 4
+    # maximum number of worker threads and processes, see `workers`
+    MAX_WORKER_THREADS: ClassVar[int] = 4
+    MAX_WORKER_PROCESSES: ClassVar[int] = 2
+
+    # queue of pending view/node updates when in deferred sync mode (else None)
+    _deferred_queue: Optional[UpdateQueue] = PrivateAttr(None)
+    _scheduler: Optional[ChunkScheduler] = PrivateAttr(None)
+    _workers: Optional[WorkerPool] = PrivateAttr(None)
+
+    @property
+    def deferred_sync(self) -> bool:
+        """Whether backend updates of views and their nodes are deferred.
+
+        In deferred sync mode, changes to any node in any view on the canvas are
+        not applied to the backend immediately. Instead, the changed fields are
+        marked dirty, and applied once (with their last value) right before the
+        next draw, or when `render()` is called.  This way, N changes between two
+        frames cost a single backend update per field.
+        """
+        return self._deferred_queue is not None
+
+    @deferred_sync.setter
+    def deferred_sync(self, value: bool) -> None:
+        if bool(value) == self.deferred_sync:
+            return
+        if value:
+            self._deferred_queue = UpdateQueue(on_pending=self._request_draw)
+        else:
+            self.flush_updates()
+            self._deferred_queue = None
+        for view in self.views:
+            view._set_update_queue(self._deferred_queue)
+
+    @property
+    def scheduler(self) -> ChunkScheduler:
+        """The scheduler of the chunk reads of the nodes in the views of this canvas.
+
+        Chunked data nodes (e.g. `TiledImage`) read the chunks they need through the
+        scheduler of the canvas they are shown on, closest to the center of the view
+        first, and with at most `MAX_CHUNK_READS` reads running at the same time.
+        The chunks that were read are delivered by `flush_updates`, right before the
+        next draw.
+        """
+        if self._scheduler is None:
+            self._scheduler = ChunkScheduler(
+                self.MAX_CHUNK_READS, on_ready=self._request_draw, pool=self.workers
+            )
+        return self._scheduler
+
+    @property
+    def workers(self) -> WorkerPool:
+        """The pool running all background work of the nodes on this canvas.
+
+        Reads (see `scheduler`), read-ahead (see `DataNode.prefetch`) and any other
+        background work share at most `MAX_WORKER_THREADS` threads and
+        `MAX_WORKER_PROCESSES` processes.  Results with a callback are delivered by
+        `flush_updates`, right before the next draw.  The pool is shut down by
+        `close()`.
+        """
+        if self._workers is None:
+            self._workers = WorkerPool(
+                self.MAX_WORKER_THREADS,
+                self.MAX_WORKER_PROCESSES,
+                on_ready=self._request_draw,
+            )
+            for adaptor in list(self._backend_adaptors.values()):
+                if hasattr(adaptor, "_vis_enable_threaded_draws"):
+                    adaptor._vis_enable_threaded_draws()
+        return self._workers
+
+    def flush_updates(self) -> None:
+        """Apply all pending updates to the backend.
+
+        The chunks read by `scheduler` and the results of other background work
+        (see `workers`) are delivered first, then deferred updates (see
+        `deferred_sync`) are applied.
+        """
+        if self._scheduler is not None:
+            self._scheduler.deliver()
+        if self._workers is not None:
+            self._workers.deliver()
+        if self._deferred_queue is not None:
+            self._deferred_queue.flush()
+
+    def _request_draw(self) -> None:
+        # (may run in a worker thread, see `_vis_request_draw`)
+        for adaptor in list(self._backend_adaptors.values()):
+            if hasattr(adaptor, "_vis_request_draw"):
+                adaptor._vis_request_draw()
+
     @property
     def size(self) -> tuple[float, float]:
         """Return the size of the canvas."""
@@ -79,10 +200,17 @@ class Canvas(VisModel[CanvasAdaptorProtocol]):
     @size.setter
     def size(self, value: tuple[float, float]) -> None:
         """Set the size of the canvas."""
-        self.width, self.height = value
+        with self.hold_updates():
+            self.width, self.height = value
 
     def close(self, backend: str | None = None) -> None:
-        """Close the canvas."""
+        """Close the canvas, cancelling and stopping all background work."""
+        if self._scheduler is not None:
+            self._scheduler.close()
+            self._scheduler = None
+        if self._workers is not None:
+            self._workers.shutdown()
+            self._workers = None
         if self.has_backend_adaptor(backend=backend):
             for adaptor in self.backend_adaptors:
                 adaptor._vis_close()
@@ -121,7 +249,9 @@ class Canvas(VisModel[CanvasAdaptorProtocol]):
     def render(self, backend: str | None = None) -> np.ndarray:
         """Render canvas to offscren buffer and return as numpy array."""
         # TODO: do we need to set visible=True temporarily here?
-        return self.backend_adaptor(backend=backend)._vis_render()
+        adaptor = self.backend_adaptor(backend=backend)
+        self.flush_updates()
+        return adaptor._vis_render()
 
     # consider using canvas.views.append?
     def add_view(self, view: View | None = None, **kwargs: Any) -> View:
@@ -135,11 +265,23 @@ class Canvas(VisModel[CanvasAdaptorProtocol]):
             raise TypeError("view must be an instance of View")
 
         self.views.append(view)
+        view._canvas = self
+        if self._deferred_queue is not None:
+            view._set_update_queue(self._deferred_queue)
+        view._on_camera_changed()  # the size of the view may now be known
         if self.has_backend_adaptor():
             for adaptor in self.backend_adaptors:
                 adaptor._vis_add_view(view)
         return view
 
+    def _create_adaptor(
+        self, cls: type[CanvasAdaptorProtocol]
+    ) -> CanvasAdaptorProtocol:
+        adaptor = super()._create_adaptor(cls)
+        if hasattr(adaptor, "_vis_connect_before_draw"):
+            adaptor._vis_connect_before_draw(self.flush_updates)
+        return adaptor
+
     def _repr_mimebundle_(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Return a mimebundle for the canvas.
 
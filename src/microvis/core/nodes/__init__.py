@@ -1,6 +1,25 @@
-from .camera import Camera
-from .image import Image
-from .node import Node
-from .scene import Scene
+from typing import TYPE_CHECKING
 
-__all__ = ["Camera", "Scene", "Image", "Node"]
+from microvis._lazy import attach
+
+if TYPE_CHECKING:
+    from .camera import Camera
+    from .image import Image
+    from .multiscale import MultiscaleImage
+    from .node import Node
+    from .scene import Scene
+    from .tiled import TiledImage
+
+__all__ = ["Camera", "Image", "MultiscaleImage", "Node", "Scene", "TiledImage"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "Camera": ".camera",
+        "Image": ".image",
+        "MultiscaleImage": ".multiscale",
+        "Node": ".node",
+        "Scene": ".scene",
+        "TiledImage": ".tiled",
+    },
+)
@@ -1,17 +1,44 @@
 from __future__ import annotations
 
+import threading
 from abc import abstractmethod
-from typing import Any, Protocol, TypeVar, cast
+from concurrent.futures import Future, wait
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
-from psygnal import EmissionInfo
+import numpy as np
 from psygnal.containers import EventedObjectProxy
 from pydantic import PrivateAttr
 from pydantic.generics import GenericModel
 
 from microvis._types import ArrayLike
+from microvis.core._cache import LRUCache
+from microvis.core._transform import Transform
+from microvis.core._workers import WorkerPool, default_pool
+from microvis.core.slice import Dimensions
+from microvis.data_source import DataSource, as_data_source
 
+from ._prefetch import infer_travel, prefetch_keys
+from ._stats import DataStats
 from .node import Node, NodeAdaptorProtocol, NodeTypeCoV
 
+if TYPE_CHECKING:
+    from psygnal import EmissionInfo
+
+    from microvis.core._scheduler import ChunkScheduler
+    from microvis.core.view import View
+
 
 class DataNodeAdaptorProtocol(NodeAdaptorProtocol[NodeTypeCoV], Protocol):
     """Protocol for a DataNode backend adaptor object."""
@@ -19,6 +46,12 @@ class DataNodeAdaptorProtocol(NodeAdaptorProtocol[NodeTypeCoV], Protocol):
     @abstractmethod
     def _vis_set_data(self, arg: ArrayLike) -> None: ...
 
+    # optional: update only a region of the data (e.g. a partial texture upload).
+    # `slices` has one (step-less) slice per dimension, `values` is data[slices].
+    # def _vis_update_data_region(
+    #     self, slices: tuple[slice, ...], values: ArrayLike
+    # ) -> None: ...
+
 
 DataNodeAdaptorProtocolT = TypeVar(
     "DataNodeAdaptorProtocolT", bound=DataNodeAdaptorProtocol, covariant=True
@@ -26,10 +59,93 @@ DataNodeAdaptorProtocolT = TypeVar(
 
 
 class DataField(GenericModel):
-    def apply(self, data: ArrayLike) -> Any:
+    def apply(self, data: ArrayLike, stats: DataStats | None = None) -> Any:
+        """Return the value of this field to send to the backend, given `data`.
+
+        `stats`, if provided, holds cached statistics of `data` that should be
+        used (and populated) instead of scanning `data` directly.
+        """
         return self
 
 
+# a bounding box in data coordinates, one step-less slice per dimension
+Region = Tuple[slice, ...]
+
+
+def _key_to_region(key: Any, shape: tuple[int, ...]) -> Region | None:
+    """Return the bounding box of `data[key]`, or None if it can't be determined.
+
+    Only basic indexing (integers, slices, and Ellipsis) is supported, anything else
+    (e.g. fancy indexing or boolean masks) returns None.
+    """
+    if not isinstance(key, tuple):
+        key = (key,)
+    n_ellipsis = sum(k is Ellipsis for k in key)
+    if n_ellipsis > 1:
+        return None
+    if n_ellipsis:
+        i = next(i for i, k in enumerate(key) if k is Ellipsis)
+        fill = (slice(None),) * (len(shape) - len(key) + 1)
+        key = key[:i] + fill + key[i + 1 :]
+    if len(key) > len(shape):
+        return None
+    key = key + (slice(None),) * (len(shape) - len(key))
+
+    region = []
+    for k, n in zip(key, shape):
+        if isinstance(k, slice):
+            rng = range(*k.indices(n))
+            if not rng:
+                region.append(slice(0, 0))
+            else:
+                lo, hi = sorted((rng[0], rng[-1]))
+                region.append(slice(lo, hi + 1))
+        elif isinstance(k, (int, np.integer)) and not isinstance(k, bool):
+            if not -n <= k < n:
+                return None
+            idx = int(k) % n
+            region.append(slice(idx, idx + 1))
+        else:
+            return None
+    return tuple(region)
+
+
+def _display_region(
+    region: Region, display_key: tuple, shape: tuple[int, ...]
+) -> Region | None:
+    """Map `region` of the data to the displayed region (see DataNode._display_key).
+
+    Returns None if the region is not displayed.  For strided display slices, the
+    whole extent of that dimension is returned.
+    """
+    out = []
+    for r, k, n in zip(region, display_key, shape):
+        if isinstance(k, slice):
+            rng = range(*k.indices(n))
+            if rng.step != 1:
+                out.append(slice(0, len(rng)))
+                continue
+            lo, hi = max(r.start, rng.start), min(r.stop, rng.stop)
+            if hi <= lo:
+                return None
+            out.append(slice(lo - rng.start, hi - rng.start))
+        elif not r.start <= k < r.stop:
+            return None
+    return tuple(out)
+
+
+def _hashable_key(key: tuple) -> tuple:
+    """Return a hashable version of a display key (slices aren't hashable < 3.12)."""
+    return tuple((k.start, k.stop, k.step) if isinstance(k, slice) else k for k in key)
+
+
+def _union_regions(a: Region, b: Region) -> Region:
+    """Return the bounding box of two regions."""
+    return tuple(
+        slice(min(sa.start, sb.start), max(sa.stop, sb.stop)) for sa, sb in zip(a, b)
+    )
+
+
 # TODO: make the ArrayLike here a generic type parameter on DataNode
 
 
@@ -37,13 +153,73 @@ class DataNode(Node[DataNodeAdaptorProtocolT]):
     """A node that has data.
 
     Data is wrapped in an evented object proxy so that mutation events can be seen.
+    When the data is modified with `__setitem__` (e.g. `node.data[10:20, 5] = 0`),
+    only the bounding box of the modified region is sent to backends that
+    implement `_vis_update_data_region`.
+
+    The data may be any array-like object with `shape`, `dtype` and `__getitem__`
+    (e.g. `np.memmap`, zarr or dask arrays), or a `DataSource`.  It is always read
+    through a `DataSource` (see `data_source`), and never as a whole: only the
+    region that is displayed (see `display_data`) is read and sent to the backend.
+
+    `dims` selects the displayed region of N-D data (see `Dimensions`).  Regions
+    read from data that is not an in-memory numpy array are kept in a byte-bounded
+    LRU cache (of at most `SLICE_CACHE_BYTES`), so returning to a recently viewed
+    slice doesn't read it again.  With `prefetch`, the next slices along the
+    dimension being stepped through are read ahead in background threads.
+
+    With `progressive`, nodes that support it (e.g. `Image`) first display a coarse
+    preview of a region that isn't loaded yet, while the region is read in the
+    background.
     """
 
+    # maximum total size (in bytes) of the slices kept in the slice cache
+    SLICE_CACHE_BYTES: ClassVar[int] = 256 * 2**20
+
     _data: EventedObjectProxy[ArrayLike] = PrivateAttr(None)
+    # the source that the data is read from (see `data_source`)
+    _source: Optional[DataSource] = PrivateAttr(None)
+    # incremented every time the data is replaced or mutated
+    _data_revision: int = PrivateAttr(0)
+    # statistics of the current display data (see `data_stats`)
+    _data_stats: Optional[DataStats] = PrivateAttr(None)
+    # (revision, key, array) of the last region read for display
+    _display_cache: Optional[Tuple[int, tuple, np.ndarray]] = PrivateAttr(None)
+    # regions read from (lazy) data, keyed on `_hashable_key(display_key)`
+    _slice_cache: LRUCache[tuple, np.ndarray] = PrivateAttr(None)
+    # held to change `_data_revision` and clear `_slice_cache` together, and by
+    # background reads to check the revision and fill the cache together
+    _revision_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _dims: Optional[Dimensions] = PrivateAttr(None)
+    # number of slices to read ahead, see `prefetch`
+    _prefetch: int = PrivateAttr(0)
+    # display key at the time of the last change of `dims`
+    _prefetch_origin: Optional[tuple] = PrivateAttr(None)
+    # pending background reads, keyed on `_hashable_key(display_key)`
+    _prefetch_futures: Dict[tuple, Future] = PrivateAttr(default_factory=dict)
+    _progressive: bool = PrivateAttr(False)
+    # (revision, display key, data, scale) of the last preview, see `progressive`
+    _preview: Optional[Tuple[int, tuple, np.ndarray, float]] = PrivateAttr(None)
+    # the chunk scheduler and worker pool of the canvas of the last view showing
+    # this node
+    _scheduler: Optional[ChunkScheduler] = PrivateAttr(None)
+    _pool: Optional[WorkerPool] = PrivateAttr(None)
 
-    def __init__(self, data: ArrayLike, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        data: ArrayLike,
+        dims: Any = None,
+        prefetch: int = 0,
+        progressive: bool = False,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
+        self._slice_cache = LRUCache(self.SLICE_CACHE_BYTES)
         self.data = cast("EventedObjectProxy", data)
+        self.prefetch = prefetch
+        self.progressive = progressive
+        if dims is not None:
+            self.dims = dims
 
     @property
     def data(self) -> EventedObjectProxy[ArrayLike]:
@@ -59,14 +235,369 @@ class DataNode(Node[DataNodeAdaptorProtocolT]):
             self._data = data  # don't rewrap
         else:
             self._data = EventedObjectProxy(data)
+        self._source = as_data_source(self._data.__wrapped__)
         self._on_data_changed()
         self._data.events.connect(self._on_data_changed)
 
-    def _on_data_changed(self) -> None:
-        # Note: could accept an EmissionInfo argument here and gate the
-        # update on event types.
-        if self.has_backend_adaptor():
-            self.backend_adaptor()._vis_set_data(cast(ArrayLike, self.data_raw))
+    @property
+    def data_source(self) -> DataSource | None:
+        """Return the `DataSource` that the data is read from.
+
+        This is the data itself if it is a `DataSource`, otherwise the data wrapped
+        with `as_data_source`.
+        """
+        return self._source
+
+    @property
+    def dims(self) -> Dimensions | None:
+        """Selection of the displayed region of N-D data.
+
+        May be set to a `Dimensions` object, or anything that can be converted to
+        one (e.g. `{0: 5}` or `"TZYX"`).  If None, the first index of each
+        non-displayed dimension is shown.  Any non-displayed dimensions left after
+        applying `dims` are shown at the first index of their selection.
+        """
+        return self._dims
+
+    @dims.setter
+    def dims(self, dims: Any) -> None:
+        if self._dims is not None:
+            self._dims.events.disconnect(self._on_dims_changed)
+        if dims is not None and not isinstance(dims, Dimensions):
+            dims = Dimensions(dims)
+        self._dims = dims
+        if dims is not None:
+            dims.events.connect(self._on_dims_changed)
+        if self._data is not None:
+            self._on_dims_changed()
+
+    @property
+    def prefetch(self) -> int:
+        """Number of slices to read ahead when stepping through `dims`.
+
+        When the index of a single non-displayed dimension changes (e.g. stepping
+        through Z with a slider), the next `prefetch` slices in the same direction
+        are read in background threads and stored in the slice cache.  Reads that
+        are no longer needed (e.g. after a change of direction) are cancelled.
+        Data that is an in-memory numpy array is never prefetched.  Slices are read
+        by the worker pool of the canvas the node is shown on (`Canvas.workers`).
+        """
+        return self._prefetch
+
+    @prefetch.setter
+    def prefetch(self, n: int) -> None:
+        if n < 0:
+            raise ValueError(f"prefetch must be >= 0, got {n}")
+        self._prefetch = n
+        if not n:
+            self._cancel_prefetch()
+
+    @property
+    def progressive(self) -> bool:
+        """Whether to display a coarse preview until the displayed region is loaded.
+
+        When the displayed region of data that is not an in-memory numpy array
+        isn't loaded yet, a coarse preview of it (e.g. a strided subsample, or the
+        coarsest level of a `MultiscaleImage`) is read and displayed right away,
+        scaled (see `_display_transform`) so that it covers the same area as the
+        full region.  The full region is read in the background, by the scheduler
+        of the canvas the node is shown on (see `Canvas.scheduler`), and replaces
+        the preview once it is delivered.  Nodes that are not on a canvas, or that
+        can't make a preview, always display the full region.
+        """
+        return self._progressive
+
+    @progressive.setter
+    def progressive(self, value: bool) -> None:
+        self._progressive = bool(value)
+        if not value:
+            self._preview = None
+
+    def _on_view_changed(self, view: View) -> None:
+        canvas = view._canvas
+        self._scheduler = canvas.scheduler if canvas is not None else None
+        self._pool = canvas.workers if canvas is not None else None
+
+    def _on_dims_changed(self) -> None:
+        self._on_display_changed()
+        if self._prefetch and self._data is not None:
+            self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        raw = cast(ArrayLike, self.data_raw)
+        if type(raw) is np.ndarray:
+            return
+        key = self._display_key()
+        prev_key, self._prefetch_origin = self._prefetch_origin, key
+        axis, direction = infer_travel(prev_key, key)
+        if axis is None or direction is None:
+            return
+
+        keys = prefetch_keys(key, raw.shape, axis, direction, self._prefetch)
+        wanted = {_hashable_key(k): k for k in keys}
+        self._cancel_prefetch(keep=wanted)
+        revision = self._data_revision
+        for hkey, k in wanted.items():
+            if hkey not in self._prefetch_futures and hkey not in self._slice_cache:
+                pool = self._pool or default_pool()
+                # after the reads of what is displayed (see ChunkScheduler)
+                task = pool.submit(self._load_region, k, revision, priority=1)
+                self._prefetch_futures[hkey] = task
+
+    def _cancel_prefetch(self, keep: Any = ()) -> None:
+        """Cancel pending background reads, except those with a key in `keep`."""
+        for hkey, future in list(self._prefetch_futures.items()):
+            if hkey not in keep or future.done():
+                future.cancel()
+                del self._prefetch_futures[hkey]
+
+    def _on_data_changed(self, info: EmissionInfo | None = None) -> None:
+        with self._revision_lock:
+            self._data_revision += 1
+            self._slice_cache.clear()
+        self._cancel_prefetch()
+        if info is not None and info.signal.name == "item_set":
+            shape = cast(ArrayLike, self.data_raw).shape
+            if (region := _key_to_region(info.args[0], shape)) is not None:
+                region = _display_region(region, self._display_key(), shape)
+                if region is not None and all(s.stop > s.start for s in region):
+                    self._on_display_region_changed(region)
+                return
+        self._on_display_changed()
+
+    def _on_display_region_changed(self, region: Region) -> None:
+        # `region` is in the coordinates of `display_data()`
+        self._update_backend("data_region", (region,))
+
+    def _on_display_changed(self) -> None:
+        # the data itself is read when the update is applied (see `_send_data`),
+        # as are the values of DataFields, which depend on it
+        self._update_backend("data", ())
+        for name in self.__fields__:
+            if isinstance(getattr(self, name), DataField):
+                self._update_backend(name, ())
+        if self._progressive:
+            # the scale of the displayed data may have changed
+            self._update_backend("transform", ())
+
+    def _merge_update(self, name: str, old: tuple, new: tuple) -> tuple:
+        if name == "data_region":
+            return (_union_regions(old[0], new[0]),)
+        return super()._merge_update(name, old, new)
+
+    def _apply_updates(self, updates: dict[str, tuple]) -> None:
+        if "data" in updates and "data_region" in updates:
+            # the full data update already includes the region
+            updates = {k: v for k, v in updates.items() if k != "data_region"}
+        super()._apply_updates(updates)
+
+    def _send_data(self, adaptor: Any) -> None:
+        adaptor._vis_set_data(self.display_data())
+
+    def _send_data_field(self, setter: Callable, name: str, *_: Any) -> None:
+        field = getattr(self, name)
+        if isinstance(field, DataField):
+            field = field.apply(self.display_data(), self.data_stats())
+        setter(field)
+
+    def _send_data_region(self, adaptor: Any, region: Region) -> None:
+        data = self.display_data()
+        if self._display_scale() == 1 and hasattr(adaptor, "_vis_update_data_region"):
+            adaptor._vis_update_data_region(region, data[region])
+        else:
+            adaptor._vis_set_data(data)
+
+    @property
+    def data_revision(self) -> int:
+        """Counter incremented every time the data is replaced or mutated."""
+        return self._data_revision
+
+    def _display_ndim(self) -> int | None:
+        """Return the number of (trailing) dimensions that are displayed.
+
+        None means that all dimensions are displayed.
+        """
+        return None
+
+    def _display_key(self) -> tuple:
+        """Return the index into `data_raw` of the region that is displayed.
+
+        The key has one entry per dimension of the data: a slice for each of the
+        trailing `_display_ndim()` dimensions (whatever the length of the selection
+        in `dims`, so the displayed data always has that many dimensions), and an
+        integer for the other (leading) dimensions: the first index of their
+        selection in `dims`.  Slices covering a whole dimension are normalized to
+        `slice(None)`.
+        """
+        shape = cast(ArrayLike, self.data_raw).shape
+        ndim = len(shape)
+        if self._dims is None:
+            slices: tuple[slice, ...] = (slice(None),) * ndim
+        else:
+            slices = self._dims.to_slices(ndim)
+        n_displayed = self._display_ndim()
+        first_displayed = 0 if n_displayed is None else max(ndim - n_displayed, 0)
+
+        key: list[int | slice] = []
+        for i, (slc, n) in enumerate(zip(slices, shape)):
+            rng = range(*slc.indices(n))
+            if i < first_displayed:
+                key.append(rng[0] if rng else 0)
+            elif rng == range(n):
+                key.append(slice(None))
+            else:
+                key.append(slice(rng.start, rng.stop, rng.step))
+        return tuple(key)
+
+    def display_data(self) -> np.ndarray:
+        """Return the displayed region of the data, as a numpy array.
+
+        Only this region is read from the (possibly lazy) data.  The result is
+        reused until the data or the displayed region changes.  If `progressive`,
+        and the region isn't loaded yet, this returns a coarse preview of the
+        region, and starts loading it in the background.
+        """
+        key = self._display_key()
+        if (preview := self._progressive_preview(key)) is not None:
+            return preview
+        cache = self._display_cache
+        if cache is None or cache[0] != self._data_revision or cache[1] != key:
+            data = self._read_region(key)
+            self._display_cache = cache = (self._data_revision, key, data)
+        return cache[2]
+
+    def _is_loaded(self, key: tuple) -> bool:
+        """Return whether `data_raw[key]` can be returned without reading it."""
+        if type(self.data_raw) is np.ndarray:
+            return True
+        cache = self._display_cache
+        if cache is not None and cache[:2] == (self._data_revision, key):
+            return True
+        return _hashable_key(key) in self._slice_cache
+
+    def _preview_data(self, key: tuple) -> tuple[np.ndarray, float] | None:
+        """Return a coarse preview of `data_raw[key]`, see `progressive`.
+
+        Returns (preview, scale), where `scale` is the size of a pixel of the preview
+        in pixels of the full region, or None if no preview can be made.
+        """
+        return None
+
+    def _progressive_preview(self, key: tuple) -> np.ndarray | None:
+        """Return the preview to display for `key`, or None to display the region.
+
+        The region is requested from the scheduler when a preview is returned.
+        """
+        if not self._progressive or self._scheduler is None:
+            self._preview = None
+            return None
+        # once shown, a preview is kept until the region is delivered, so that the
+        # data and transform sent to the backend (see `_display_scale`) agree
+        revision = self._data_revision
+        if self._preview is not None and self._preview[:2] == (revision, key):
+            return self._preview[2]
+        self._preview = None
+        if self._is_loaded(key) or (preview := self._preview_data(key)) is None:
+            return None
+        self._preview = (revision, key, *preview)
+
+        request_key = ("display", revision, _hashable_key(key))
+        self._scheduler.cancel(self, keep={request_key})  # reads of other regions
+        self._scheduler.submit(
+            self,
+            request_key,
+            partial(self._load_region, key, revision),
+            partial(self._on_region_loaded, key, revision),
+        )
+        return self._preview[2]
+
+    def _on_region_loaded(self, key: tuple, revision: int, data: np.ndarray) -> None:
+        # called by the scheduler with the region requested by _progressive_preview
+        if revision == self._data_revision and key == self._display_key():
+            self._display_cache = (revision, key, data)
+            self._preview = None
+            self._on_display_changed()  # also sends the (unscaled) transform
+
+    def _display_scale(self) -> float:
+        """Return the size of a displayed pixel, in pixels of `display_data`."""
+        if not self._progressive:
+            return 1
+        if self._progressive_preview(self._display_key()) is None:
+            return 1
+        return cast(Tuple[int, tuple, np.ndarray, float], self._preview)[3]
+
+    def _display_transform(self) -> Transform:
+        """Return the transform sent to the backend.
+
+        This is `transform`, preceded by the scale of the displayed pixels (see
+        `progressive`).
+        """
+        s = self._display_scale()
+        if s == 1:
+            return self.transform
+        return Transform().scaled((s, s, 1)) @ self.transform
+
+    def _read_region(self, key: tuple) -> np.ndarray:
+        """Return `data_raw[key]` as a numpy array, using the slice cache."""
+        raw = cast(ArrayLike, self.data_raw)
+        if type(raw) is np.ndarray:  # indexing is a cheap view: nothing to cache
+            if all(k == slice(None) for k in key):  # everything is displayed
+                return raw
+            return raw[key]
+        hkey = _hashable_key(key)
+        future = self._prefetch_futures.pop(hkey, None)
+        if future is not None and not future.cancel():
+            wait([future])  # already being read in the background
+        if (data := self._slice_cache.get(hkey)) is None:
+            data = self._load_region(key, self._data_revision)
+        return data
+
+    def _load_region(self, key: tuple, revision: int) -> np.ndarray:
+        """Read `data_raw[key]` into the slice cache (may run in a worker thread).
+
+        Nothing is cached if the data changed (see `data_revision`) meanwhile.
+        """
+        data = cast(DataSource, self._source).read(key)
+        with self._revision_lock:
+            if revision == self._data_revision:
+                self._slice_cache.put(_hashable_key(key), data)
+        return data
+
+    def data_stats(self) -> DataStats:
+        """Return (cached) statistics of the displayed data.
+
+        The statistics are computed lazily, and are reused until the displayed data
+        changes.
+        """
+        data = self.display_data()
+        stats = self._data_stats
+        if (
+            stats is None
+            or stats.revision != self._data_revision
+            or stats.data is not data
+        ):
+            self._data_stats = stats = DataStats(data, self._data_revision)
+        return stats
+
+    def _bind_setters(self, adaptor: Any) -> dict[str, Callable]:
+        # data is not a field, but it is dispatched like one (see _on_data_changed)
+        setters = super()._bind_setters(adaptor)
+        for name, setter in list(setters.items()):
+            if isinstance(getattr(self, name, None), DataField):
+                setters[name] = partial(self._send_data_field, setter, name)
+        setters["data"] = partial(self._send_data, adaptor)
+        setters["data_region"] = partial(self._send_data_region, adaptor)
+        setters["transform"] = partial(self._send_transform, setters["transform"])
+        return setters
+
+    def _send_transform(self, setter: Callable, *_: Any) -> None:
+        setter(self._display_transform())
+
+    def _create_adaptor(self, cls: type[DataNodeAdaptorProtocolT]) -> Any:
+        adaptor = super()._create_adaptor(cls)
+        if (transform := self._display_transform()) is not self.transform:
+            adaptor._vis_set_transform(transform)
+        return adaptor
 
     @property
     def data_raw(self) -> ArrayLike | None:
@@ -79,13 +610,11 @@ class DataNode(Node[DataNodeAdaptorProtocolT]):
         if not self.has_backend_adaptor():
             return
 
-        # if the event is coming from a DataField, make
-        # sure to apply the data to the field before emitting to the backend
-        # ... TODO: this is subject to change
+        # DataFields are applied to the data when the update is sent to the
+        # backend (see `_send_data_field`), so that they see the displayed data
         signal_name = info.signal.name
-        obj = getattr(self, signal_name)
-        if isinstance(obj, DataField) and self._data is not None:
-            val = obj.apply(cast(ArrayLike, self.data_raw))
-            info = EmissionInfo(info.signal, (val,))
+        if isinstance(getattr(self, signal_name), DataField):
+            self._update_backend(signal_name, ())
+            return
 
         super()._on_any_event(info)
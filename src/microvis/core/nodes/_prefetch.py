@@ -0,0 +1,48 @@
+"""Background reading of the slices that are likely to be displayed next.
+
+When stepping through a dimension (e.g. with a slider), the next few slices in
+the direction of travel are read by the worker pool of the canvas (see
+`Canvas.workers`, or `default_pool` for nodes that aren't on a canvas) and stored
+in the slice cache of the `DataNode` (see `DataNode.prefetch`).
+"""
+
+from __future__ import annotations
+
+__all__ = ["infer_travel", "prefetch_keys"]
+
+
+def infer_travel(
+    prev_key: tuple | None, key: tuple
+) -> tuple[int, int] | tuple[None, None]:
+    """Return (axis, direction) of a step from display key `prev_key` to `key`.
+
+    A step is a change of the (integer) index along exactly one axis, direction is
+    +1 or -1.  Returns (None, None) for anything else.
+    """
+    if prev_key is None or len(prev_key) != len(key):
+        return None, None
+    changed = [i for i, (a, b) in enumerate(zip(prev_key, key)) if a != b]
+    if len(changed) != 1:
+        return None, None
+    axis = changed[0]
+    a, b = prev_key[axis], key[axis]
+    if not (isinstance(a, int) and isinstance(b, int)):
+        return None, None
+    return axis, 1 if b > a else -1
+
+
+def prefetch_keys(
+    key: tuple, shape: tuple[int, ...], axis: int, direction: int, n: int
+) -> list[tuple]:
+    """Return the display keys of the `n` slices after `key` along `axis`.
+
+    Keys are ordered by distance from `key`, in `direction` (+1 or -1), and stop at
+    the edge of the data.
+    """
+    out = []
+    for i in range(1, n + 1):
+        idx = key[axis] + i * direction
+        if not 0 <= idx < shape[axis]:
+            break
+        out.append((*key[:axis], idx, *key[axis + 1 :]))
+    return out
@@ -0,0 +1,252 @@
+"""Fast statistics used for contrast limits.
+
+`np.percentile` partitions (a copy of) the full array for every call, which is
+prohibitively slow for large stacks.  The functions here avoid that:
+
+- integer data of up to 16 bits is reduced to a histogram in a single O(n)
+  pass, from which percentiles can be read *exactly*.
+- floating point data may be estimated from a random sample (see
+  `sampled_percentiles` for the error bound).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    Sequence,
+    TypeVar,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from microvis._types import ArrayLike
+
+T = TypeVar("T")
+
+# integer dtypes for which percentiles are computed from a full histogram
+HISTOGRAM_DTYPES = frozenset(np.dtype(t) for t in ("u1", "u2", "i1", "i2"))
+# number of elements to bincount at a time (bounds temporary memory)
+_CHUNK_SIZE = 1 << 22
+
+
+def supports_histogram(data: ArrayLike) -> bool:
+    """Return True if `data` has a dtype suitable for `bincount_histogram`."""
+    return np.dtype(data.dtype) in HISTOGRAM_DTYPES
+
+
+def bincount_histogram(data: ArrayLike) -> tuple[np.ndarray, int]:
+    """Return (counts, offset) for integer `data` of 16 bits or less.
+
+    `counts[i]` is the number of elements in `data` equal to `i + offset`.  The
+    array is visited in chunks (see `_iter_chunks`), so temporary memory does not
+    grow with the size of `data`, even if it is non-contiguous or lazy.
+    """
+    dtype = np.dtype(data.dtype)
+    if dtype not in HISTOGRAM_DTYPES:
+        raise TypeError(f"Cannot compute bincount histogram for dtype {dtype}")
+    info = np.iinfo(dtype)
+    nbins = int(info.max) - int(info.min) + 1
+    offset = int(info.min)
+
+    counts = np.zeros(nbins, dtype=np.intp)
+    for chunk in _iter_chunks(data, _CHUNK_SIZE):
+        if offset:
+            chunk = chunk.astype(np.intp) - offset
+        counts += np.bincount(chunk, minlength=nbins)
+    return counts, offset
+
+
+def _iter_chunks(data: ArrayLike, chunk_size: int) -> Iterator[np.ndarray]:
+    """Yield all elements of `data` as 1-D arrays of at most `chunk_size` elements.
+
+    Chunks are slices along the leading axes, so only one chunk at a time is read
+    (for lazy data) or copied (for non-contiguous data).
+    """
+    if data.ndim == 0:
+        yield np.asarray(data).reshape(1)
+        return
+    row_size = math.prod(data.shape[1:])
+    if row_size > chunk_size:
+        for i in range(data.shape[0]):
+            yield from _iter_chunks(data[i], chunk_size)
+        return
+    step = max(chunk_size // max(row_size, 1), 1)
+    for start in range(0, data.shape[0], step):
+        yield np.asarray(data[start : start + step]).ravel(order="K")
+
+
+def histogram_percentiles(
+    counts: np.ndarray, q: Sequence[float], offset: float = 0
+) -> tuple[float, ...]:
+    """Return percentiles `q` (0-100) of the data described by histogram `counts`.
+
+    The result is identical to `np.percentile(data, q)` (with the default "linear"
+    method) for the data that produced `counts` (see `bincount_histogram`).
+    """
+    cumsum = np.cumsum(counts)
+    n = int(cumsum[-1])
+    if n == 0:
+        raise ValueError("Cannot compute percentiles of empty data")
+
+    out = []
+    for p in q:
+        rank = p / 100 * (n - 1)
+        lo = math.floor(rank)
+        frac = rank - lo
+        # the k-th (0-based) smallest value is the first bin with cumsum > k
+        v_lo = int(np.searchsorted(cumsum, lo, side="right"))
+        if frac:
+            v_hi = int(np.searchsorted(cumsum, lo + 1, side="right"))
+            out.append(v_lo + (v_hi - v_lo) * frac + offset)
+        else:
+            out.append(float(v_lo + offset))
+    return tuple(out)
+
+
+def random_sample(data: ArrayLike, sample_size: int, seed: int = 0) -> np.ndarray:
+    """Return `sample_size` elements drawn uniformly (with replacement) from `data`.
+
+    If `data` has no more than `sample_size` elements, all of `data` is returned.
+    Only the sampled elements are read, so this is cheap for memory-mapped data.
+    """
+    if data.size <= sample_size:
+        return np.asarray(data)
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, data.size, size=sample_size)
+    return np.asarray(data[np.unravel_index(idx, data.shape)])
+
+
+def sampled_percentiles(
+    data: ArrayLike, q: Sequence[float], sample_size: int, seed: int = 0
+) -> tuple[float, ...]:
+    """Estimate percentiles `q` (0-100) of `data` from a random sample.
+
+    `sample_size` elements are drawn uniformly (with replacement) from `data`.  By
+    the Dvoretzky-Kiefer-Wolfowitz inequality, with probability at least
+    `1 - delta`, each returned value lies between the true `(p - 100 * eps)` and
+    `(p + 100 * eps)` percentiles of `data`, where::
+
+        eps = sqrt(ln(2 / delta) / (2 * sample_size))
+
+    For example, with `sample_size=100_000` and `delta=0.001`, the estimate is
+    within ±0.62 percentile points of the requested percentile.
+    If `data` has no more than `sample_size` elements, the exact percentiles are
+    returned.
+    """
+    return tuple(np.percentile(random_sample(data, sample_size, seed), q))
+
+
+class DataStats:
+    """Lazily computed statistics of an array, cached for reuse.
+
+    Each statistic (min, max, histogram, random sample, percentile) is computed at
+    most once. For example, once the histogram of integer data has been computed,
+    any other percentile is read from it without scanning the data again.
+
+    The cache assumes that `data` does not change: create a new `DataStats`
+    when it does (see `DataNode.data_stats`).
+
+    Parameters
+    ----------
+    data : ArrayLike
+        The data to compute statistics for.
+    revision : int
+        An optional revision number of `data`, used by the owner of this object to
+        determine whether the cache is still valid.
+    """
+
+    def __init__(self, data: ArrayLike, revision: int = 0) -> None:
+        self.data = data
+        self.revision = revision
+        self._cache: dict[Hashable, Any] = {}
+
+    def _cached(self, key: Hashable, func: Callable[[], T]) -> T:
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]  # type: ignore [no-any-return]
+
+    def min(self) -> float:
+        """Return the minimum value of the data."""
+        if "histogram" in self._cache:
+            counts, offset = self.histogram()
+            return float(np.flatnonzero(counts)[0] + offset)
+        return self._cached("min", self.data.min)
+
+    def max(self) -> float:
+        """Return the maximum value of the data."""
+        if "histogram" in self._cache:
+            counts, offset = self.histogram()
+            return float(np.flatnonzero(counts)[-1] + offset)
+        return self._cached("max", self.data.max)
+
+    def histogram(self) -> tuple[np.ndarray, int]:
+        """Return (counts, offset) for 8 and 16-bit integer data.
+
+        See `bincount_histogram`.
+        """
+        return self._cached("histogram", lambda: bincount_histogram(self.data))
+
+    def sample(self, sample_size: int) -> np.ndarray:
+        """Return a random sample of the data (see `random_sample`)."""
+        return self._cached(
+            ("sample", sample_size), lambda: random_sample(self.data, sample_size)
+        )
+
+    def percentiles(
+        self, q: Sequence[float], sample_size: int | None = None
+    ) -> tuple[float, ...]:
+        """Return percentiles `q` (0-100), using the fastest suitable method.
+
+        - For 8 and 16-bit integer data, the result is exact, from a histogram.
+        - Otherwise, if `sample_size` is provided, the result (including 0 and
+          100) is estimated from a random sample (see `sampled_percentiles` for
+          the error bound), so the full data is never scanned.
+        - Otherwise, 0 and 100 are the exact min and max of the data, and
+          `np.percentile` is used for the others.
+        """
+        if supports_histogram(self.data):
+            sample_size = None  # not needed: the histogram is exact and fast
+        keys = [("percentile", p, sample_size) for p in q]
+        if missing := [k[1] for k in keys if k not in self._cache]:
+            values = self._compute_percentiles(missing, sample_size)
+            for p, value in zip(missing, values):
+                self._cache[("percentile", p, sample_size)] = value
+        return tuple(self._cache[k] for k in keys)
+
+    def _compute_percentiles(
+        self, q: Sequence[float], sample_size: int | None = None
+    ) -> tuple[float, ...]:
+        out: dict[int, float] = {}
+        todo = []
+        for i, p in enumerate(q):
+            if p == 0 and sample_size is None:
+                out[i] = self.min()
+            elif p == 100 and sample_size is None:
+                out[i] = self.max()
+            else:
+                todo.append(i)
+
+        if todo:
+            _q = [q[i] for i in todo]
+            if supports_histogram(self.data):
+                counts, offset = self.histogram()
+                values = histogram_percentiles(counts, _q, offset)
+            elif sample_size is not None:
+                values = tuple(np.percentile(self.sample(sample_size), _q))
+            else:
+                values = tuple(np.percentile(self.data, _q))
+            out.update(zip(todo, values))
+        return tuple(out[i] for i in range(len(q)))
+
+
+def percentiles(
+    data: ArrayLike, q: Sequence[float], sample_size: int | None = None
+) -> tuple[float, ...]:
+    """Return percentiles `q` (0-100) of `data` (see `DataStats.percentiles`)."""
+    return DataStats(data).percentiles(q, sample_size)
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import math
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Iterable, Iterator, Protocol, Sequence, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+    cast,
+    overload,
+)
 
-import numpy as np
 from pydantic import Field, validator
 
 from microvis._types import ArrayLike, ImageInterpolation
 
 from ._data import DataField, DataNode, DataNodeAdaptorProtocol
+from ._stats import DataStats
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from microvis.data_source import DataSource
 
 
 # fmt: off
@@ -61,7 +79,16 @@ class AbsContrast(DataField, Sequence[float]):
 
 
 class PercentileContrast(DataField, Sequence[float]):
-    """Percentile contrast limits."""
+    """Percentile contrast limits.
+
+    Percentiles of 8 and 16-bit integer data are always computed exactly, from a
+    histogram of the data.  For other data types, `sample_size` may be used to
+    estimate the percentiles from a random sample of the data, rather than from the
+    full array (the min and max too, for `pmin=0` and `pmax=100`). (see
+    `microvis.core.nodes._stats.sampled_percentiles` for the error bound: with
+    100,000 samples, estimates are within ±0.62 percentile points with 99.9%
+    probability.)
+    """
 
     pmin: float = Field(
         default=0, ge=0, le=100, description="Minimum contrast percentile."
@@ -69,6 +96,12 @@ class PercentileContrast(DataField, Sequence[float]):
     pmax: float = Field(
         default=100, ge=0, le=100, description="Maximum contrast percentile."
     )
+    sample_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="If provided, estimate percentiles of non-integer data from a "
+        "random sample of this many values.",
+    )
 
     def __iter__(self) -> Iterator[float]:  # type: ignore [override]
         yield self.pmin
@@ -86,9 +119,11 @@ class PercentileContrast(DataField, Sequence[float]):
     def __len__(self) -> int:
         return 2
 
-    def apply(self, data: ArrayLike) -> tuple[float, float]:
-        _min = data.min() if self.pmin == 0 else np.percentile(data, self.pmin)
-        _max = data.max() if self.pmax == 100 else np.percentile(data, self.pmax)
+    def apply(
+        self, data: ArrayLike, stats: DataStats | None = None
+    ) -> tuple[float, float]:
+        stats = stats or DataStats(data)
+        _min, _max = stats.percentiles((self.pmin, self.pmax), self.sample_size)
         return (_min, _max)
 
 
@@ -115,7 +150,15 @@ class Cmap(str, Enum):
 
 
 class Image(DataNode[ImageBackend]):
-    """A Image that can be placed in scene."""
+    """A Image that can be placed in scene.
+
+    With `progressive` (see `DataNode.progressive`), the preview of a plane that
+    isn't loaded yet is every k-th row and column of the plane, with k such that the
+    preview has at most `PREVIEW_SIZE` rows and columns.
+    """
+
+    # maximum number of rows and columns of a progressive preview
+    PREVIEW_SIZE: ClassVar[int] = 512
 
     cmap: Cmap = Field(
         default=Cmap.GRAYS,
@@ -146,10 +189,34 @@ class Image(DataNode[ImageBackend]):
 
     def clim_applied(self) -> tuple[float, float]:
         """Return the current contrast limits, taking the data into account."""
-        # TODO: from a typing perspective, having to cast to ArrayLike everytime
-        # self._data is not None is a bit of an annoying hack.
-        return (
-            self.clim.apply(cast(ArrayLike, self.data_raw))
-            if self._data is not None
-            else (0, 0)
-        )
+        if self._data is None:
+            return (0, 0)
+        return self.clim.apply(self.display_data(), self.data_stats())
+
+    def _display_ndim(self) -> int:
+        # 2D images, with an optional trailing RGB(A) dimension
+        shape = cast(ArrayLike, self.data_raw).shape
+        return 3 if len(shape) >= 3 and shape[-1] in (3, 4) else 2
+
+    def _preview_data(self, key: tuple) -> tuple[np.ndarray, float] | None:
+        # every k-th row and column, with k such that the preview has at most
+        # PREVIEW_SIZE rows and columns
+        shape = cast(ArrayLike, self.data_raw).shape
+        axes = _plane_axes(key)
+        ranges = {a: range(*key[a].indices(shape[a])) for a in axes}
+        k = math.ceil(max(len(r) for r in ranges.values()) / self.PREVIEW_SIZE)
+        if k < 2:
+            return None
+        preview_key = list(key)
+        for a, rng in ranges.items():
+            rng = rng[::k]
+            preview_key[a] = slice(
+                rng.start, rng.stop if rng.stop >= 0 else None, rng.step
+            )
+        source = cast("DataSource", self.data_source)
+        return source.read(tuple(preview_key)), k
+
+
+def _plane_axes(key: tuple) -> list[int]:
+    """Return the axes of the data that are the rows and columns of the plane."""
+    return [i for i, k in enumerate(key) if isinstance(k, slice)][:2]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from microvis.core._transform import Transform
+from microvis.data_source import as_data_source
+
+from .image import Image, ImageBackend, _plane_axes
+
+if TYPE_CHECKING:
+    from microvis._types import ArrayLike
+    from microvis.core.view import View
+
+
+class MultiscaleImage(Image):
+    """An Image with multiple, progressively downsampled, resolution levels.
+
+    Only one level is displayed (and sent to the backend) at a time: the coarsest
+    level that still has at least one data pixel per screen pixel at the zoom of the
+    camera of the view that shows this image.  `data` is the displayed level.
+
+    With `progressive` (see `DataNode.progressive`), the preview of a level that
+    isn't loaded yet is the same plane of the coarsest level.
+
+    Parameters
+    ----------
+    data : Sequence[ArrayLike]
+        The levels, from the highest resolution to the lowest.  All levels must
+        have the same number of dimensions.
+    scales : Sequence[float], optional
+        The downsampling factor of each level, relative to the first (which must
+        have a factor of 1).  If not provided, the factors are inferred from the
+        shape of the last displayed dimension of each level.
+    **kwargs : Any
+        Passed to `Image`.
+    """
+
+    _levels: tuple = PrivateAttr(())
+    _scales: tuple = PrivateAttr(())
+    _level: int = PrivateAttr(0)
+
+    def __init__(
+        self,
+        data: Sequence[ArrayLike],
+        scales: Sequence[float] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        levels = tuple(data)
+        if not levels:
+            raise ValueError("MultiscaleImage requires at least one level")
+        if len({len(lvl.shape) for lvl in levels}) != 1:
+            raise ValueError("All levels must have the same number of dimensions")
+        super().__init__(levels[0], **kwargs)
+        self._levels = levels
+        if scales is None:  # e.g. a `microvis.pyramid.Pyramid` knows its scales
+            scales = getattr(data, "scales", None)
+        if scales is None:
+            axis = -self._display_ndim() + 1  # the last spatial (x) dimension
+            n0 = levels[0].shape[axis]
+            scales = [n0 / lvl.shape[axis] for lvl in levels]
+        if len(scales) != len(levels):
+            raise ValueError("There must be one scale factor per level")
+        if scales[0] != 1 or any(b < a for a, b in zip(scales, scales[1:])):
+            raise ValueError("Scales must start at 1, and must not decrease")
+        self._scales = tuple(float(s) for s in scales)
+
+    @property
+    def levels(self) -> tuple[ArrayLike, ...]:
+        """All resolution levels, from the highest resolution to the lowest."""
+        return self._levels
+
+    @property
+    def scales(self) -> tuple[float, ...]:
+        """Downsampling factor of each level, relative to the first level."""
+        return self._scales
+
+    @property
+    def level(self) -> int:
+        """Index of the level that is displayed."""
+        return self._level
+
+    @level.setter
+    def level(self, level: int) -> None:
+        if not 0 <= level < len(self._levels):
+            raise IndexError(f"Level {level} out of range for {len(self._levels)}")
+        if level == self._level:
+            return
+        self._level = level
+        self.data = self._levels[level]
+        self._update_backend("transform", ())
+
+    def level_for_zoom(self, zoom: float) -> int:
+        """Return the coarsest level with at least one data pixel per screen pixel.
+
+        `zoom` is the number of screen pixels per unit of the parent coordinate
+        frame (see `Camera.zoom`).
+        """
+        # screen pixels per (full resolution) data pixel
+        px_per_pixel = zoom * float(np.linalg.norm(self.transform.matrix[0, :3]))
+        if px_per_pixel <= 0:
+            return len(self._scales) - 1
+        fits = [i for i, s in enumerate(self._scales) if s * px_per_pixel <= 1]
+        return fits[-1] if fits else 0
+
+    def level_transform(self) -> Transform:
+        """Return `transform`, preceded by the scale of the displayed level."""
+        s = self._scales[self._level] * self._display_scale()
+        if s == 1:
+            return self.transform
+        return Transform().scaled((s, s, 1)) @ self.transform
+
+    def _display_transform(self) -> Transform:
+        # the backend is always sent the transform of the displayed level
+        return self.level_transform()
+
+    def _preview_data(self, key: tuple) -> tuple[np.ndarray, float] | None:
+        # the same plane of the coarsest level, unless only a window of the plane
+        # is displayed
+        coarsest = len(self._levels) - 1
+        axes = _plane_axes(key)
+        if self._level == coarsest or any(key[a] != slice(None) for a in axes):
+            return super()._preview_data(key)
+        preview = as_data_source(self._levels[coarsest]).read(key)
+        return preview, self._scales[coarsest] / self._scales[self._level]
+
+    def _on_view_changed(self, view: View) -> None:
+        super()._on_view_changed(view)
+        self.level = self.level_for_zoom(view.camera.zoom)
+
+    def _get_adaptor_class(
+        self, backend: str, class_name: str | None = None
+    ) -> type[ImageBackend]:
+        # backends display one level at a time, with their Image adaptor
+        return super()._get_adaptor_class(backend, class_name or "Image")
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, Iterator, Optional, Protocol, Sequence, TypeVar
+from contextlib import suppress
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from psygnal.containers import EventedList
-from pydantic import validator
+from pydantic import PrivateAttr, validator
 
 from microvis._logger import logger
 from microvis.core._transform import Transform
 from microvis.core._vis_model import Field, SupportsVisibility, VisModel
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+    from microvis.core._vis_model import UpdateQueue
+    from microvis.core.view import View
+
 NodeTypeCoV = TypeVar("NodeTypeCoV", bound="Node", covariant=True)
 NodeType = TypeVar("NodeType", bound="Node")
 NodeAdaptorProtocolTypeCoV = TypeVar(
@@ -43,12 +62,58 @@ class NodeAdaptorProtocol(SupportsVisibility[NodeTypeCoV], Protocol):
 
 
 class NodeList(EventedList[NodeType]):
+    """The children of a node.
+
+    Membership is by identity: `in`, `index` and `remove` don't compare nodes with
+    `==` (which compares all of their fields, recursively).  `in` is a lookup in an
+    index of {id(node): count} kept alongside the list.
+    """
+
     _owner: Optional[Node] = None
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._ids: Dict[int, int] = {}
+        super().__init__(*args, **kwargs)
+
+    def __setstate__(self, state: dict) -> None:
+        # (copies and unpickled lists contain other objects)
+        self.__dict__.update(state)
+        self._ids = {}
+        for item in self._data:
+            self._ids[id(item)] = self._ids.get(id(item), 0) + 1
+
+    def __contains__(self, value: object) -> bool:
+        return id(value) in self._ids
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        if id(value) in self._ids:
+            ids = list(map(id, self._data))
+            with suppress(ValueError):
+                return ids.index(id(value), start, len(ids) if stop is None else stop)
+        raise ValueError(f"{value!r} is not in list")
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        old = self._data[key]
+        super().__setitem__(key, value)
+        if value is not old:
+            self._forget(old if isinstance(key, slice) else [old])
+
+    def __delitem__(self, key: Any) -> None:
+        old = self._data[key]
+        super().__delitem__(key)
+        self._forget(old if isinstance(key, slice) else [old])
+
+    def _forget(self, items: Iterable[NodeType]) -> None:
+        for item in items:
+            if (count := self._ids.pop(id(item))) > 1:
+                self._ids[id(item)] = count - 1
+
     def _pre_insert(self, value: NodeType) -> NodeType:
         if not isinstance(value, Node):
             raise TypeError("Canvas views must be View objects")
-        return super()._pre_insert(value)
+        value = super()._pre_insert(value)
+        self._ids[id(value)] = self._ids.get(id(value), 0) + 1
+        return value
 
     def _post_insert(self, new_item: NodeType) -> None:
         if self._owner is not None:
@@ -86,6 +151,11 @@ class Node(VisModel[NodeAdaptorProtocolTypeCoV]):
         "frame of the parent.",
     )
 
+    # (root node, transform from this node to the parent frame of the root), or
+    # None when it must be recomputed (see `world_transform`).  When a node has it,
+    # all of its ancestors do too.
+    _world: Optional[Tuple[Node, Transform]] = PrivateAttr(None)
+
     def __repr_args__(self) -> Sequence[tuple[str | None, Any]]:
         args = super().__repr_args__()
         # avoid recursion in repr
@@ -100,22 +170,92 @@ class Node(VisModel[NodeAdaptorProtocolTypeCoV]):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.children._owner = self
+        # (connected directly: subclasses may not pass all events to `_on_any_event`)
+        self.events.transform.connect(self._invalidate_world)
+        self.events.parent.connect(self._invalidate_world)
+        if self.parent is not None:  # keep `parent.children` in sync
+            self.parent.add(self)
         logger.debug(f"created {type(self)} node {id(self)}")
 
     def __contains__(self, item: Node) -> bool:
-        """Return True if this node is an ancestor of item."""
+        """Return True if item is a child of this node."""
         return item in self.children
 
     def add(self, node: Node) -> None:
         """Add a child node."""
-        nd = f"{node.__class__.__name__} {id(node)}"
-        slf = f"{self.__class__.__name__} {id(self)}"
-        node.parent = self
+        # (assigning the same parent would still compare the old and new values,
+        # i.e. all of the fields of the parent and its subtree)
+        if node.parent is not self:
+            node.parent = self
+        if self._update_queue is not None:
+            node._set_update_queue(self._update_queue)
         if node not in self.children:
+            nd = f"{node.__class__.__name__} {id(node)}"
+            slf = f"{self.__class__.__name__} {id(self)}"
             logger.debug(f"Adding node {nd} to {slf}")
             self.children.append(node)
-            if self.has_backend_adaptor():
-                self.backend_adaptor()._vis_add_node(node)
+            for adaptor in self.backend_adaptors:
+                adaptor._vis_add_node(node)
+
+    def remove(self, node: Node) -> None:
+        """Remove a child node."""
+        self.children.remove(node)
+        node.parent = None
+
+    def _set_update_queue(self, queue: UpdateQueue | None) -> None:
+        super()._set_update_queue(queue)
+        for child in self.children:
+            child._set_update_queue(queue)
+
+    def _invalidate_world(self) -> None:
+        """Clear the cached world transforms of this node and its descendants."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # (descendants of a node without a cached transform don't have one)
+            if node._world is not None:
+                node._world = None
+                stack.extend(node.children)
+
+    @property
+    def world_transform(self) -> Transform:
+        """Transform from this node to the coordinate frame of the root of the tree.
+
+        (i.e. the frame of the parent of the root node: the root's `transform` is
+        included.)  It is cached until the `transform` or `parent` of this node or
+        one of its ancestors changes.  Its inverse (`world_transform.inv()`), from
+        the root frame to this node, is cached too.
+        """
+        return self._world_cache()[1]
+
+    def _world_cache(self) -> tuple[Node, Transform]:
+        if self._world is not None:
+            return self._world
+        # up to the first ancestor with a cached transform (or the root)...
+        uncached = [self]
+        while (parent := uncached[-1].parent) is not None and parent._world is None:
+            uncached.append(parent)
+        # ... then back down, composing each transform with its parent's
+        for node in reversed(uncached):
+            if node.parent is None:
+                node._world = (node, node.transform)
+            else:
+                root, parent_world = node.parent._world  # type: ignore [misc]
+                node._world = (root, node.transform @ parent_world)
+        return self._world  # type: ignore [return-value]
+
+    def _on_view_changed(self, view: View) -> None:
+        """Update this node after the camera of a `view` showing it changed.
+
+        Subclasses may override this to adapt what they display (e.g. the resolution
+        level of a `MultiscaleImage`) to the view.
+        """
+
+    def iter_descendants(self) -> Iterator[Node]:
+        """Return an iterator over all descendants of this node (depth first)."""
+        for child in self.children:
+            yield child
+            yield from child.iter_descendants()
 
     @classmethod
     def validate(cls, value: Any) -> Node:
@@ -144,12 +284,27 @@ class Node(VisModel[NodeAdaptorProtocolTypeCoV]):
 
         Returns
         -------
-        transform : instance of ChainTransform
+        transform : instance of Transform
             The transform.
         """
-        a, b = self.path_to_node(other)
-        tforms = [n.transform for n in a[:-1]] + [n.transform.inv() for n in b]
-        return Transform.chain(*tforms[::-1])
+        # both world transforms are cached, so this costs a single product
+        root, to_world = self._world_cache()
+        other_root, other_to_world = other._world_cache()
+        if root is not other_root:
+            slf = f"{self.__class__.__name__} {id(self)}"
+            nd = f"{other.__class__.__name__} {id(other)}"
+            raise RuntimeError(f"No common parent between nodes {slf} and {nd}.")
+        return to_world @ other_to_world.inv()
+
+    def map_points_to_node(
+        self, other: Node, points: ArrayLike, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Map (N, 2) or (N, 3) `points` from the coordinate frame of `self` to `other`.
+
+        The transforms along the path are composed once, then all points are mapped
+        in a single pass (see `Transform.map_points`, for `out`).
+        """
+        return self.transform_to_node(other).map_points(points, out)
 
     def path_to_node(self, other: Node) -> tuple[list[Node], list[Node]]:
         """Return two lists describing the path from this node to another.
@@ -183,17 +338,19 @@ class Node(VisModel[NodeAdaptorProtocolTypeCoV]):
             ([D, C, B], [E, F])
 
         """
-        my_parents = list(self.iter_parents())
         their_parents = list(other.iter_parents())
-        common_parent = next((p for p in my_parents if p in their_parents), None)
-        if common_parent is None:
-            slf = f"{self.__class__.__name__} {id(self)}"
-            nd = f"{other.__class__.__name__} {id(other)}"
-            raise RuntimeError(f"No common parent between nodes {slf} and {nd}.")
+        # the common parent is the first of my parents that is one of theirs.  (by
+        # identity: comparing models with `==` compares all of their fields)
+        their_index = {id(p): i for i, p in enumerate(their_parents)}
+        up = []
+        for parent in self.iter_parents():
+            up.append(parent)
+            if (i := their_index.get(id(parent))) is not None:
+                return (up, their_parents[:i][::-1])
 
-        up = my_parents[: my_parents.index(common_parent) + 1]
-        down = their_parents[: their_parents.index(common_parent)][::-1]
-        return (up, down)
+        slf = f"{self.__class__.__name__} {id(self)}"
+        nd = f"{other.__class__.__name__} {id(other)}"
+        raise RuntimeError(f"No common parent between nodes {slf} and {nd}.")
 
     def iter_parents(self) -> Iterator[Node]:
         """Return list of parents starting from this node.
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import math
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, Optional, Tuple, cast
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from microvis.core._cache import LRUCache
+from microvis.core._transform import Transform
+
+from ._data import _hashable_key
+from .image import Image, PercentileContrast, _plane_axes
+
+if TYPE_CHECKING:
+    from psygnal import EmissionInfo
+
+    from microvis._types import ArrayLike
+    from microvis.core._scheduler import Priority
+    from microvis.core.view import View
+    from microvis.data_source import DataSource
+
+    from ._data import Region
+
+TileIndex = Tuple[int, int]  # (row, column) of a tile
+Rect = Tuple[Tuple[float, float], Tuple[float, float]]  # ((x0, y0), (x1, y1))
+
+# fields of the TiledImage that are applied to each of its tiles
+_TILE_FIELDS = ("cmap", "clim", "gamma", "interpolation")
+# number of values sampled to estimate percentile contrast limits
+_CLIM_SAMPLE_SIZE = 100_000
+
+
+def _tile_nbytes(tile: Image) -> int:
+    return int(np.asarray(tile.data_raw).nbytes)
+
+
+class TiledImage(Image):
+    """An Image that is displayed as a grid of fixed-size tiles.
+
+    Each tile is an `Image` child of this node, translated to its position in the
+    plane.  Only tiles that intersect the area shown by the camera of the view that
+    shows this image (see `View.visible_rect`) are read and displayed, so planes
+    larger than the maximum texture size of the backend can be shown, and panning
+    only reads the tiles that come into view.  Tiles that go out of view are
+    hidden, and kept in an LRU cache of at most `TILE_CACHE_BYTES` until they are
+    either shown again or evicted.  Until a view is known, no tiles are shown.
+
+    When the view is on a canvas, tiles are read in the background through the
+    scheduler of the canvas (see `Canvas.scheduler`), closest to the center of the
+    view first, and are shown once they are delivered.  Reads of tiles that leave
+    the view before they start are cancelled.
+
+    Percentile contrast limits are estimated from a random sample of the displayed
+    plane (of `clim.sample_size` values, or 100,000 by default), and the same
+    contrast limits are used for all tiles.
+
+    Parameters
+    ----------
+    data : ArrayLike
+        The data, as for `Image`.
+    tile_size : int
+        The size (in pixels) of the (square) tiles.
+    **kwargs : Any
+        Passed to `Image`.
+    """
+
+    # maximum total size (in bytes) of the off-screen tiles that are kept
+    TILE_CACHE_BYTES: ClassVar[int] = 256 * 2**20
+
+    _tile_size: int = PrivateAttr(512)
+    # displayed tiles
+    _tiles: Dict[TileIndex, Image] = PrivateAttr(default_factory=dict)
+    # hidden tiles, evicted (removed from this node) when over budget
+    _offscreen: LRUCache[TileIndex, Image] = PrivateAttr(None)
+    # ((x0, y0), (x1, y1)) of the area shown by the last view, in local coordinates
+    _view_rect: Optional[Rect] = PrivateAttr(None)
+    # contrast limits applied to all tiles
+    _tile_clim: Optional[Tuple[float, float]] = PrivateAttr(None)
+
+    def __init__(self, data: ArrayLike, tile_size: int = 512, **kwargs: Any) -> None:
+        if tile_size <= 0:
+            raise ValueError(f"tile_size must be positive, got {tile_size}")
+        super().__init__(data, **kwargs)
+        self._tile_size = tile_size
+        self._offscreen = LRUCache(
+            self.TILE_CACHE_BYTES, sizeof=_tile_nbytes, on_evict=self._drop_tile
+        )
+
+    @property
+    def tile_size(self) -> int:
+        """The size (in pixels) of the tiles."""
+        return self._tile_size
+
+    @property
+    def tiles(self) -> dict[TileIndex, Image]:
+        """The displayed tiles, keyed on their (row, column) in the grid."""
+        return dict(self._tiles)
+
+    def clim_applied(self) -> tuple[float, float]:
+        """Return the contrast limits applied to all tiles."""
+        if self._data is None:
+            return (0, 0)
+        if self._tile_clim is None:
+            if isinstance(self.clim, PercentileContrast):
+                sample = self._sample_plane(self.clim.sample_size or _CLIM_SAMPLE_SIZE)
+                self._tile_clim = self.clim.apply(sample)
+            else:
+                self._tile_clim = (self.clim.min, self.clim.max)
+        return self._tile_clim
+
+    def _on_view_changed(self, view: View) -> None:
+        super()._on_view_changed(view)  # tiles are read with its scheduler, if any
+        if (rect := view.visible_rect()) is None:
+            return
+        # map the corners of the visible area into the coordinates of this node
+        (x0, y0), (x1, y1) = rect
+        corners = [(x0, y0), (x1, y0), (x0, y1), (x1, y1)]
+        to_scene = self.transform_to_node(view.scene)
+        local = np.atleast_2d(to_scene.imap(corners))[:, :2]
+        (lx0, ly0), (lx1, ly1) = local.min(axis=0), local.max(axis=0)
+        self._view_rect = ((lx0, ly0), (lx1, ly1))
+        self._update_tiles()
+
+    # ---------------------- tiles ----------------------
+
+    def _tile_key(self, idx: TileIndex) -> tuple:
+        """Return the index into `data_raw` of tile `idx`."""
+        shape = cast("ArrayLike", self.data_raw).shape
+        key = list(self._display_key())
+        ts = self._tile_size
+        for axis, i in zip(_plane_axes(tuple(key)), idx):
+            rng = range(*key[axis].indices(shape[axis]))[i * ts : (i + 1) * ts]
+            stop = rng.stop if rng.stop >= 0 else None
+            key[axis] = slice(rng.start, stop, rng.step)
+        return tuple(key)
+
+    def _visible_tiles(self) -> set[TileIndex]:
+        if self._view_rect is None:
+            return set()
+        shape = cast("ArrayLike", self.data_raw).shape
+        key = self._display_key()
+        n_rows, n_cols = (
+            len(range(*key[a].indices(shape[a]))) for a in _plane_axes(key)
+        )
+        ts = self._tile_size
+        (x0, y0), (x1, y1) = self._view_rect
+        rows = range(
+            max(math.floor(y0 / ts), 0), min(math.ceil(y1 / ts), -(-n_rows // ts))
+        )
+        cols = range(
+            max(math.floor(x0 / ts), 0), min(math.ceil(x1 / ts), -(-n_cols // ts))
+        )
+        return {(r, c) for r in rows for c in cols}
+
+    def _update_tiles(self) -> None:
+        if self._offscreen is None or self._data is None:
+            return  # still initializing
+        visible = self._visible_tiles()
+        hidden = {i: self._tiles.pop(i) for i in list(self._tiles) if i not in visible}
+        # take tiles out of the cache before adding hidden ones, which may evict them
+        missing = []
+        for idx in sorted(visible.difference(self._tiles)):
+            if (tile := self._offscreen.pop(idx)) is not None:
+                tile.visible = True
+                self._tiles[idx] = tile
+            else:
+                missing.append(idx)
+        for idx, tile in hidden.items():
+            tile.visible = False
+            self._offscreen.put(idx, tile)
+
+        if (scheduler := self._scheduler) is None:
+            for idx in missing:
+                self._tiles[idx] = self._create_tile(idx, self._read_tile(idx))
+            return
+        scheduler.cancel(self, keep=visible)
+        scheduler.reprioritize(self, self._tile_priority)
+        for idx in missing:
+            scheduler.submit(
+                self,
+                idx,
+                partial(self._read_tile, idx),
+                partial(self._on_tile_read, idx, self._tile_version(idx)),
+                self._tile_priority(idx),
+            )
+
+    def _tile_priority(self, idx: TileIndex) -> Priority:
+        """Return (0, distance of the center of tile `idx` from the view center)."""
+        if self._view_rect is None:
+            return (0, 0)
+        (x0, y0), (x1, y1) = self._view_rect
+        ts = self._tile_size
+        dx = (idx[1] + 0.5) * ts - (x0 + x1) / 2
+        dy = (idx[0] + 0.5) * ts - (y0 + y1) / 2
+        return (0, math.hypot(dx, dy))
+
+    def _tile_version(self, idx: TileIndex) -> tuple:
+        return (self._data_revision, _hashable_key(self._tile_key(idx)))
+
+    def _on_tile_read(self, idx: TileIndex, version: tuple, data: np.ndarray) -> None:
+        # called by the scheduler when the read of tile `idx` is delivered
+        if idx in self._tiles or idx not in self._visible_tiles():
+            return
+        if version != self._tile_version(idx):
+            self._update_tiles()  # read before the data changed: read it again
+        else:
+            self._tiles[idx] = self._create_tile(idx, data)
+
+    def _create_tile(self, idx: TileIndex, data: np.ndarray) -> Image:
+        ts = self._tile_size
+        tile = Image(
+            data,
+            name=f"tile {idx}",
+            cmap=self.cmap,
+            clim=self.clim_applied(),
+            gamma=self.gamma,
+            interpolation=self.interpolation,
+            transform=Transform().translated((idx[1] * ts, idx[0] * ts)),
+        )
+        self.add(tile)
+        return tile
+
+    def _read_tile(self, idx: TileIndex) -> np.ndarray:
+        return cast("DataSource", self.data_source).read(self._tile_key(idx))
+
+    def _drop_tile(self, idx: TileIndex, tile: Image) -> None:
+        self.remove(tile)
+
+    def _iter_tiles(self) -> Iterator[tuple[TileIndex, Image]]:
+        """Iterate over all (displayed and hidden) tiles."""
+        yield from list(self._tiles.items())
+        yield from self._offscreen.items()
+
+    def _clear_tiles(self) -> None:
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+        for _, tile in list(self._iter_tiles()):
+            self.remove(tile)
+        self._tiles.clear()
+        self._offscreen.clear()
+
+    def _sample_plane(self, sample_size: int) -> np.ndarray:
+        """Return a random sample of the displayed plane, reading only the sample."""
+        source = cast("DataSource", self.data_source)
+        key = self._display_key()
+        axes = [i for i, k in enumerate(key) if isinstance(k, slice)]
+        ranges = [range(*key[a].indices(source.shape[a])) for a in axes]
+        size = math.prod(len(r) for r in ranges)
+        if size <= sample_size:
+            return source.read(key)
+        flat = np.random.default_rng(0).integers(0, size, size=sample_size)
+        index: list = list(key)
+        for a, r, coords in zip(
+            axes, ranges, np.unravel_index(flat, [len(r) for r in ranges])
+        ):
+            index[a] = r.start + coords * r.step
+        return source.read(tuple(index))
+
+    # ------------- DataNode / VisModel hooks -------------
+
+    def _on_display_changed(self) -> None:
+        # the displayed plane was replaced: start over (nothing to send to the
+        # backend of this node, which only holds the tiles)
+        if self._offscreen is None:
+            return  # still initializing
+        self._tile_clim = None
+        self._clear_tiles()
+        self._update_tiles()
+
+    def _on_display_region_changed(self, region: Region) -> None:
+        ts = self._tile_size
+        (r0, r1), (c0, c1) = ((s.start, s.stop) for s in region[:2])
+        rows = range(r0 // ts, -(-r1 // ts))
+        cols = range(c0 // ts, -(-c1 // ts))
+        for idx, tile in self._iter_tiles():
+            if idx[0] in rows and idx[1] in cols:
+                tile.data = self._read_tile(idx)
+        if self._scheduler is not None:
+            # pending reads may have started before the change
+            self._scheduler.cancel(self)
+            self._update_tiles()
+
+    def _on_any_event(self, info: EmissionInfo) -> None:
+        name = info.signal.name
+        if name not in _TILE_FIELDS:
+            super()._on_any_event(info)
+            return
+        if name == "clim":
+            self._tile_clim = None
+            value: Any = self.clim_applied()
+        else:
+            value = getattr(self, name)
+        for _, tile in self._iter_tiles():
+            setattr(tile, name, value)
@@ -1,6 +1,7 @@
 """Models defining slicing of data.
 
-FIXME: none of this is hooked up anywhere yet.
+`Dimensions` is used by `DataNode.dims` to select the region of N-D data that
+is displayed.
 """
 
 from __future__ import annotations
@@ -10,6 +11,8 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Iterator,
+    List,
     Optional,
     Sequence,
     SupportsIndex,
@@ -17,7 +20,7 @@ from typing import (
 )
 
 from psygnal import EventedModel
-from pydantic import validator
+from pydantic import PrivateAttr, validator
 
 from ._vis_model import Field
 
@@ -45,7 +48,13 @@ class Slice(EventedModel):
         It returns a tuple of three integers; respectively these are the
         start and stop indices and the step or stride length of the slice.
         """
-        return slice(self.start, self.stop, self.step).indices(len)
+        return self.to_slice().indices(len)
+
+    def to_slice(self) -> slice:
+        """Return an equivalent builtin `slice` (with integer values)."""
+        return slice(
+            *(None if v is None else int(v) for v in (self.start, self.stop, self.step))
+        )
 
     @classmethod
     def __get_validators__(cls) -> Generator[Callable, None, None]:
@@ -55,6 +64,10 @@ class Slice(EventedModel):
     def validate(cls, v: Any) -> Slice:
         if v is None:
             return cls()
+        if isinstance(v, Slice):
+            return v
+        if isinstance(v, dict):
+            return cls(**v)
         if isinstance(v, slice):
             return cls(start=v.start, stop=v.stop, step=v.step)
         if isinstance(v, (int, float)):
@@ -66,14 +79,81 @@ class Slice(EventedModel):
 
 
 class Dimensions(EventedModel):
+    """Mapping of dimension keys to the `Slice` selected along that dimension.
+
+    Keys are either integer axis indices (negative values count from the end) or
+    names of the axes (e.g. `Dimensions("TZYX")`), see `to_slices`.  A slice that
+    selects a single element (e.g. `Slice(5, 6)`, see `set_point`) drops that
+    dimension from the result.
+
+    `events.__root__` is emitted both when a dimension is (re)assigned and when a
+    `Slice` in this object is mutated in place.
+    """
+
     __root__: Dict[Union[int, str], Slice]
+    # the slices whose events are relayed (see `_connect_slices`)
+    _connected: List[Slice] = PrivateAttr(default_factory=list)
 
-    def __init__(_model_self_, __root__: Any) -> None:
+    def __init__(_model_self_, __root__: Any = ()) -> None:
         super().__init__(__root__=__root__)
+        _model_self_._connect_slices()
+        _model_self_.events.__root__.connect(_model_self_._connect_slices)
 
     def __repr__(self) -> str:
         return f"Dimensions({self.__root__!r})"
 
+    def __getitem__(self, key: int | str) -> Slice:
+        return self.__root__[key]
+
+    def __setitem__(self, key: int | str, value: Any) -> None:
+        self.__root__ = {**self.__root__, key: Slice.validate(value)}
+
+    def __iter__(self) -> Iterator[int | str]:  # type: ignore [override]
+        return iter(self.__root__)
+
+    def __len__(self) -> int:
+        return len(self.__root__)
+
+    def set_point(self, key: int | str, index: int) -> None:
+        """Select the single element `index` along dimension `key`."""
+        self[key] = Slice(index, index + 1)
+
+    def to_slices(self, ndim: int) -> tuple[slice, ...]:
+        """Return one builtin `slice` for each axis of `ndim`-dimensional data.
+
+        If all keys are integers, they are the indices of the axes they apply to.
+        Otherwise, the keys name the axes of the data in order, and there must be
+        exactly `ndim` of them.  Axes without a key are not sliced.
+        """
+        out = [slice(None)] * ndim
+        if all(isinstance(k, int) for k in self.__root__):
+            for k, slc in self.__root__.items():
+                if not -ndim <= k < ndim:  # type: ignore [operator]
+                    raise IndexError(f"Dimension {k} is out of range for {ndim}D data")
+                out[k] = slc.to_slice()  # type: ignore [index]
+        elif len(self.__root__) != ndim:
+            raise ValueError(
+                f"Cannot apply {len(self.__root__)} named dimensions "
+                f"({list(self.__root__)}) to {ndim}D data"
+            )
+        else:
+            out = [slc.to_slice() for slc in self.__root__.values()]
+        return tuple(out)
+
+    def _connect_slices(self) -> None:
+        # relay in-place changes of any Slice as a change of the dimensions, and
+        # stop relaying those of the Slices that were replaced.
+        current = {id(slc): slc for slc in self.__root__.values()}
+        for slc in self._connected:
+            if id(slc) not in current:
+                slc.events.disconnect(self._on_slice_changed)
+        for slc in current.values():
+            slc.events.connect(self._on_slice_changed, unique=True)
+        self._connected[:] = current.values()
+
+    def _on_slice_changed(self) -> None:
+        self.events.__root__.emit(self.__root__)
+
     @validator("__root__", pre=True)
     def _validate_root(cls, v: Any) -> dict[int | str, Slice]:
         if isinstance(v, (tuple, list, Sequence)):
@@ -83,6 +163,7 @@ class Dimensions(EventedModel):
             v = {i: None for i in v}
         if not isinstance(v, dict):
             raise TypeError(f"Cannot convert {type(v)} to Dimensions")
+        v = dict(v)
         for k in list(v):
             if v[k] is None:
                 v[k] = Slice()
@@ -3,6 +3,8 @@ from __future__ import annotations
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Optional, Protocol, Tuple, TypeVar
 
+from pydantic import PrivateAttr
+
 from microvis._types import ArrayLike, Color  # noqa: TCH001
 
 from ._vis_model import Field
@@ -118,15 +120,65 @@ class View(Node[ViewAdaptorProtocol]):
         description="The margin to keep outside the widget's border.",
     )
 
+    # the canvas this view was added to (see `Canvas.add_view`)
+    _canvas: Optional[Canvas] = PrivateAttr(None)
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.add(self.camera)
         self.add(self.scene)
+        self._connect_camera()
+        self.events.size.connect(self._on_camera_changed)
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if name == "camera":
+            self._connect_camera(disconnect=True)
+        old = getattr(self, name, None) if name in {"camera", "scene"} else None
         super().__setattr__(name, value)
         if name in {"camera", "scene"}:
-            self.add(getattr(self, name))
+            new = getattr(self, name)
+            if old is not None and old is not new and old in self:
+                self.remove(old)
+            self.add(new)
+        if name == "camera":
+            self._connect_camera()
+            self._on_camera_changed()
+
+    def _connect_camera(self, disconnect: bool = False) -> None:
+        for signal in (self.camera.events.zoom, self.camera.events.center):
+            if disconnect:
+                signal.disconnect(self._on_camera_changed)
+            else:
+                signal.connect(self._on_camera_changed)
+
+    def _on_camera_changed(self) -> None:
+        # nodes may add or remove children (e.g. TiledImage), so collect them first
+        for node in list(self.scene.iter_descendants()):
+            node._on_view_changed(self)
+
+    def content_size(self) -> tuple[float, float] | None:
+        """Return the size of the view in pixels, or None if it isn't known yet.
+
+        This is `size` if set, otherwise the size of the canvas the view is on.
+        """
+        if self.size is not None:
+            return self.size
+        if self._canvas is not None:
+            return (self._canvas.width, self._canvas.height)
+        return None
+
+    def visible_rect(self) -> tuple[tuple[float, float], tuple[float, float]] | None:
+        """Return ((x0, y0), (x1, y1)), the area of the scene shown by the camera.
+
+        The area is centered on `camera.center` (ordered (..., y, x)), with a size
+        of `content_size() / camera.zoom` (i.e. `zoom` is screen pixels per unit
+        of the scene).  Returns None if the size of the view isn't known.
+        """
+        if (size := self.content_size()) is None or self.camera.zoom <= 0:
+            return None
+        cy, cx = self.camera.center[-2:]
+        half_w, half_h = size[0] / self.camera.zoom / 2, size[1] / self.camera.zoom / 2
+        return ((cx - half_w, cy - half_h), (cx + half_w, cy + half_h))
 
     def show(self) -> Canvas:
         """Show the view.
@@ -146,6 +198,7 @@ class View(Node[ViewAdaptorProtocol]):
     def add_node(self, node: NodeType) -> NodeType:
         """Add any node to the scene."""
         self.scene.add(node)
+        node._on_view_changed(self)
         self.camera._set_range(margin=0)
         return node
 
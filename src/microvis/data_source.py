@@ -0,0 +1,260 @@
+"""Sources of array data, read in chunks.
+
+A `DataSource` describes the shape, dtype and chunk grid of some stored data, and
+reads regions of it with `read` (blocking) or `aread` (asynchronous).  `DataNode`
+reads all of its data through a source: any array-like data is wrapped with
+`as_data_source`, and a `DataSource` may also be passed as data directly::
+
+    source = ImageDirectorySource("path/to/planes", pattern="*.tif")
+    view.add_node(Image(source))
+
+Asynchronous reads run in threads, so several reads (e.g. the planes of a stack,
+or the tiles of a `TiledImage`) may be awaited concurrently, and cancelling the
+task awaiting a read stops any part of it that hasn't started yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import os
+
+    from microvis._types import ArrayLike
+
+__all__ = [
+    "ArraySource",
+    "DataSource",
+    "ImageDirectorySource",
+    "MemmapSource",
+    "as_data_source",
+    "iter_chunks",
+]
+
+
+@runtime_checkable
+class DataSource(Protocol):
+    """Protocol for chunked array data.
+
+    `chunks` is the shape of the chunks in which the data is stored (reading a
+    region that is aligned to the chunk grid is the most efficient).  `read`
+    accepts a basic numpy index (integers and slices) and returns a numpy array.
+    Sources are also indexable (`source[key]` is `source.read(key)`), so they can
+    be used wherever an `ArrayLike` is expected.
+    """
+
+    @property
+    def shape(self) -> Tuple[int, ...]: ...
+    @property
+    def dtype(self) -> np.dtype: ...
+    @property
+    def chunks(self) -> Tuple[int, ...]: ...
+    def read(self, key: Any) -> np.ndarray: ...
+    async def aread(self, key: Any) -> np.ndarray: ...
+    def __getitem__(self, key: Any) -> np.ndarray: ...
+
+
+def _normalize_key(key: Any, ndim: int) -> tuple:
+    """Return `key` as a tuple with one entry per dimension (Ellipsis expanded)."""
+    if not isinstance(key, tuple):
+        key = (key,)
+    if any(k is Ellipsis for k in key):
+        i = next(i for i, k in enumerate(key) if k is Ellipsis)
+        fill = (slice(None),) * (ndim - len(key) + 1)
+        key = key[:i] + fill + key[i + 1 :]
+    return key + (slice(None),) * (ndim - len(key))
+
+
+class _Source(ABC):
+    """Base class of the data sources in this module.
+
+    Subclasses implement `shape`, `dtype`, `chunks` and `read`.  `aread` runs
+    `read` in the default executor of the running event loop.
+    """
+
+    shape: Tuple[int, ...]
+    dtype: np.dtype
+    chunks: Tuple[int, ...]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(shape={self.shape}, dtype={self.dtype})"
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        return math.prod(self.shape) * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        return self.read(key)
+
+    @abstractmethod
+    def read(self, key: Any) -> np.ndarray: ...
+
+    async def aread(self, key: Any) -> np.ndarray:
+        return await _run_in_executor(partial(self.read, key))
+
+
+async def _run_in_executor(func: Callable[[], Any]) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(None, func)
+
+
+class ArraySource(_Source):
+    """A source reading from an array-like object (e.g. an in-memory numpy array).
+
+    The chunk shape is taken from a `chunks` attribute of the array if it has one
+    of integers (as zarr arrays do), otherwise the whole array is a single chunk.
+    Reading a numpy array returns a view, not a copy.
+    """
+
+    def __init__(self, array: ArrayLike) -> None:
+        self.array = array
+        self.shape = tuple(array.shape)
+        self.dtype = np.dtype(array.dtype)
+        chunks = getattr(array, "chunks", None)
+        if isinstance(chunks, tuple) and all(isinstance(c, int) for c in chunks):
+            self.chunks = chunks
+        else:
+            self.chunks = self.shape
+
+    def read(self, key: Any) -> np.ndarray:
+        return np.asarray(self.array[key])
+
+
+class MemmapSource(_Source):
+    """A source reading from a memory-mapped array, such as a `.npy` file.
+
+    Each plane (the last two dimensions) is a chunk.  Reads return copies, so the
+    result doesn't keep the file open.
+
+    Parameters
+    ----------
+    data : np.memmap | str | os.PathLike
+        A memory-mapped array, or the path of a `.npy` file to open (read-only).
+    """
+
+    def __init__(self, data: np.memmap | str | os.PathLike) -> None:
+        if not isinstance(data, np.ndarray):
+            data = np.load(data, mmap_mode="r")
+        self.array = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.chunks = (1,) * (data.ndim - 2) + data.shape[-2:]
+
+    def read(self, key: Any) -> np.ndarray:
+        return np.array(self.array[key])
+
+
+class ImageDirectorySource(_Source):
+    """A source reading a stack of 2D images, stored as one file per plane.
+
+    The files in `directory` matching `pattern` are sorted by name, and read with
+    `imageio`.  The data has shape `(n_files, *plane_shape)`, where all planes are
+    assumed to have the shape and dtype of the first one, and each plane is a
+    chunk.  Only the planes that are indexed are read, and `aread` reads them
+    concurrently.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike
+        The directory holding the planes.
+    pattern : str
+        A glob pattern selecting the files in `directory`.
+    """
+
+    def __init__(self, directory: str | os.PathLike, pattern: str = "*") -> None:
+        self.files = sorted(p for p in Path(directory).glob(pattern) if p.is_file())
+        if not self.files:
+            raise ValueError(f"No files matching {pattern!r} in {str(directory)!r}")
+        first = self._read_plane(0)
+        self.shape = (len(self.files), *first.shape)
+        self.dtype = first.dtype
+        self.chunks = (1, *first.shape)
+
+    def _read_plane(self, index: int) -> np.ndarray:
+        import imageio.v3 as iio
+
+        return np.asarray(iio.imread(self.files[index]))
+
+    def _plan(self, key: Any) -> tuple[list[int], Any, tuple]:
+        """Return the planes to read for `key`, and the index into their stack.
+
+        The index (for the first axis, and the remaining axes) is applied to the
+        stack of the planes that are read, in the order returned.
+        """
+        key = _normalize_key(key, self.ndim)
+        first, rest = key[0], key[1:]
+        n = len(self.files)
+        if isinstance(first, slice):
+            return list(range(*first.indices(n))), slice(None), rest
+        index = np.asarray(first)
+        if index.dtype.kind not in "iu":
+            raise TypeError(f"Planes must be indexed by integers, got {first!r}")
+        if np.any((index < -n) | (index >= n)):
+            raise IndexError(f"index {first} is out of bounds for {n} planes")
+        planes, inverse = np.unique(index % n, return_inverse=True)
+        first_index = inverse.reshape(index.shape)
+        if index.ndim == 0:
+            first_index = int(first_index)
+        return planes.tolist(), first_index, rest
+
+    def _stack(self, planes: Sequence[np.ndarray], index: Any, rest: tuple) -> Any:
+        if len(planes) == 1 and isinstance(index, int):
+            return planes[0][rest]  # a single plane: no need to copy it
+        out = np.empty((len(planes), *self.shape[1:]), dtype=self.dtype)
+        for i, plane in enumerate(planes):
+            out[i] = plane
+        return out[(index, *rest)]
+
+    def read(self, key: Any) -> np.ndarray:
+        planes, index, rest = self._plan(key)
+        return self._stack([self._read_plane(i) for i in planes], index, rest)
+
+    async def aread(self, key: Any) -> np.ndarray:
+        planes, index, rest = self._plan(key)
+        reads = [_run_in_executor(partial(self._read_plane, i)) for i in planes]
+        return self._stack(await asyncio.gather(*reads), index, rest)
+
+
+def as_data_source(data: Any) -> DataSource:
+    """Return `data` as a `DataSource`.
+
+    Data sources are returned as is, memory-mapped arrays are wrapped in a
+    `MemmapSource`, and any other array-like object in an `ArraySource`.
+    """
+    if isinstance(data, DataSource):
+        return data
+    if isinstance(data, np.memmap):
+        return MemmapSource(data)
+    return ArraySource(data)
+
+
+def iter_chunks(source: DataSource) -> Iterator[tuple[slice, ...]]:
+    """Iterate over the regions of the chunk grid of `source`, in C order."""
+    grid = [range(0, n, max(c, 1)) for n, c in zip(source.shape, source.chunks)]
+    for starts in np.ndindex(*(len(g) for g in grid)):
+        yield tuple(
+            slice(g[i], min(g[i] + c, n))
+            for i, g, c, n in zip(starts, grid, source.chunks, source.shape)
+        )
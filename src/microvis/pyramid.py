@@ -0,0 +1,373 @@
+"""Build multiscale (pyramid) data for `MultiscaleImage`.
+
+`build_pyramid` downsamples an array by a factor of 2 along its two spatial
+(row and column) dimensions, level after level, and writes every level to a `.npy`
+file. The data is processed in chunks (in a pool of worker processes), so memory
+use doesn't depend on the size of the data, and an interrupted build resumes
+where it stopped when `build_pyramid` is called again with the same arguments::
+
+    data = np.load("huge_stack.npy", mmap_mode="r")
+    pyramid = build_pyramid(data, "huge_stack_pyramid")
+    view.add_node(MultiscaleImage(pyramid))
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Literal,
+    Sequence,
+    Tuple,
+    overload,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from microvis._types import ArrayLike
+
+__all__ = ["Pyramid", "build_pyramid"]
+
+Method = Literal["mean", "max", "nearest"]
+# (first plane, last plane + 1, first row, last row + 1) of the output level
+Chunk = Tuple[int, int, int, int]
+
+_META_FILE = "pyramid.json"
+# memmaps opened by this process (workers may be reused by several builds), keyed
+# on their spec (see `_memmap_spec`), which includes a token unique to each build of
+# a level, so that a file that was rebuilt (even with the same layout, and inode) is
+# opened again.  (`_OPEN_MEMMAPS.clear()` only clears the dict of this process.)
+_OPEN_MEMMAPS: Dict[tuple, np.memmap] = {}
+# the maximum number of memmaps kept open by a process
+_MAX_OPEN_MEMMAPS = 8
+
+
+class Pyramid(Sequence[np.ndarray]):
+    """The levels of a multiscale image, from the highest resolution to the lowest.
+
+    This is a sequence of arrays, which can be passed to `MultiscaleImage`.
+    """
+
+    def __init__(self, levels: Sequence[ArrayLike], scales: Sequence[float]) -> None:
+        self.levels = list(levels)
+        self.scales = tuple(scales)
+
+    def __repr__(self) -> str:
+        shapes = ", ".join(str(tuple(lvl.shape)) for lvl in self.levels)
+        return f"Pyramid({shapes})"
+
+    @overload
+    def __getitem__(self, index: int) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[np.ndarray]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return self.levels[index]
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+
+def _spatial_axes(shape: tuple[int, ...]) -> tuple[int, int]:
+    # rows and columns, before an optional trailing RGB(A) dimension (as in Image)
+    if len(shape) >= 3 and shape[-1] in (3, 4):
+        return len(shape) - 3, len(shape) - 2
+    return len(shape) - 2, len(shape) - 1
+
+
+def _downsampled_shape(shape: tuple[int, ...]) -> tuple[int, ...]:
+    out = list(shape)
+    for ax in _spatial_axes(shape):
+        out[ax] = -(-shape[ax] // 2)
+    return tuple(out)
+
+
+def downsample(block: np.ndarray, method: Method = "mean") -> np.ndarray:
+    """Return `block`, downsampled 2x along its spatial dimensions.
+
+    Odd sizes are padded with the last row/column. "mean" of integer data is rounded
+    to the nearest integer, the dtype is always preserved.
+    """
+    ya, xa = _spatial_axes(block.shape)
+    if method == "nearest":
+        index = [slice(None)] * block.ndim
+        index[ya] = index[xa] = slice(None, None, 2)
+        return block[tuple(index)]
+
+    pad = [(0, 0)] * block.ndim
+    pad[ya], pad[xa] = (0, block.shape[ya] % 2), (0, block.shape[xa] % 2)
+    if any(p[1] for p in pad):
+        block = np.pad(block, pad, mode="edge")
+    shape = list(block.shape)
+    shape[ya : xa + 1] = [shape[ya] // 2, 2, shape[xa] // 2, 2]
+    blocks = block.reshape(shape)
+    if method == "max":
+        return blocks.max(axis=(ya + 1, ya + 3))
+    if method == "mean":
+        out = blocks.mean(axis=(ya + 1, ya + 3), dtype=np.float64)
+        if np.issubdtype(block.dtype, np.integer):
+            out = np.rint(out)
+        return out.astype(block.dtype)
+    raise ValueError(f"Unknown downsampling method: {method!r}")
+
+
+def _as_planes(arr: np.ndarray) -> np.ndarray:
+    """Return a view of `arr` with all leading dimensions flattened into one."""
+    ya, _ = _spatial_axes(arr.shape)
+    return arr.reshape((-1, *arr.shape[ya:]))
+
+
+def _open_memmap(spec: tuple) -> np.memmap:
+    """Return the memmap described by `spec` (see `_memmap_spec`), cached."""
+    filename, offset, dtype, shape, mode, _token = spec
+    if (mm := _OPEN_MEMMAPS.get(spec)) is None:
+        mm = np.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=shape)
+        while len(_OPEN_MEMMAPS) >= _MAX_OPEN_MEMMAPS:  # drop the oldest
+            del _OPEN_MEMMAPS[next(iter(_OPEN_MEMMAPS))]
+        _OPEN_MEMMAPS[spec] = mm
+    return mm
+
+
+def _memmap_spec(mm: np.memmap, mode: str, token: str) -> tuple | None:
+    """Return the arguments to re-open `mm` in another process, if possible.
+
+    `token` identifies the build the memmap is used by (see `_OPEN_MEMMAPS`).
+    """
+    if not isinstance(mm, np.memmap) or mm.filename is None:
+        return None
+    # the memmap must be the whole mapping (e.g. not a slice of another memmap)
+    if not mm.flags.c_contiguous or not isinstance(mm.base, mmap.mmap):
+        return None
+    return (str(mm.filename), mm.offset, mm.dtype.str, mm.shape, mode, token)
+
+
+def _read_planes(src: ArrayLike, chunk: Chunk) -> np.ndarray:
+    """Read the input of `chunk` (of the output level) from `src`."""
+    p0, p1, r0, r1 = chunk
+    ya, _ = _spatial_axes(src.shape)
+    lead = src.shape[:ya]
+    rows = slice(2 * r0, 2 * r1)
+    planes = [
+        np.asarray(src[(*np.unravel_index(p, lead), rows)]) for p in range(p0, p1)
+    ]
+    return np.stack(planes)
+
+
+def _reduce_chunk(
+    src: tuple | np.ndarray, dst: tuple, chunk: Chunk, method: Method
+) -> Chunk:
+    """Downsample `chunk` of the output level (run in a worker process).
+
+    `src` is either the input rows of the chunk, or the spec of a memmap of the
+    whole input level.  `dst` is the spec of the memmap of the output level.
+    """
+    p0, p1, r0, r1 = chunk
+    if isinstance(src, tuple):
+        block = _as_planes(_open_memmap(src))[p0:p1, 2 * r0 : 2 * r1]
+    else:
+        block = src
+    out = _as_planes(_open_memmap(dst))
+    out[p0:p1, r0:r1] = downsample(np.asarray(block), method)
+    out.flush()
+    return chunk
+
+
+def _chunks(shape: tuple[int, ...], itemsize: int, chunk_bytes: int) -> list[Chunk]:
+    """Split output level `shape` into chunks of about `chunk_bytes` of input."""
+    ya, _ = _spatial_axes(shape)
+    n_planes = math.prod(shape[:ya])
+    n_rows = shape[ya]
+    # bytes of input read per output row
+    row_bytes = 2 * math.prod(shape[ya + 1 :]) * 2 * itemsize
+    rows = max(chunk_bytes // row_bytes, 1)
+    if rows < n_rows:  # split planes into blocks of rows
+        return [
+            (p, p + 1, r, min(r + rows, n_rows))
+            for p in range(n_planes)
+            for r in range(0, n_rows, rows)
+        ]
+    planes = max(rows // n_rows, 1)  # group whole planes
+    return [
+        (p, min(p + planes, n_planes), 0, n_rows) for p in range(0, n_planes, planes)
+    ]
+
+
+def _n_levels(shape: tuple[int, ...], min_size: int) -> int:
+    ya, xa = _spatial_axes(shape)
+    n = 1
+    while max(shape[ya], shape[xa]) > min_size:
+        shape = _downsampled_shape(shape)
+        n += 1
+    return n
+
+
+def build_pyramid(
+    data: ArrayLike,
+    directory: str | os.PathLike,
+    n_levels: int | None = None,
+    method: Method = "mean",
+    min_size: int = 256,
+    processes: int | None = None,
+    chunk_bytes: int = 64 * 2**20,
+    executor: Executor | None = None,
+) -> Pyramid:
+    """Build (or resume building) a 2x downsampled pyramid of `data`.
+
+    Levels 1 and up are written to `directory/level_{i}.npy`, and are returned as
+    read-only memmaps.  Level 0 is `data` itself.  Only the last two dimensions
+    (before an optional trailing RGB(A) dimension) are downsampled.
+
+    The data is read in chunks of about `chunk_bytes`, so memory use is bounded
+    by `chunk_bytes` times the number of chunks in flight (twice the number of
+    processes).  Progress is recorded in `directory` after each chunk: calling
+    this function again with the same arguments after an interruption only
+    processes the remaining chunks.
+
+    Parameters
+    ----------
+    data : ArrayLike
+        The full resolution data, e.g. an `np.memmap`.
+    directory : str | os.PathLike
+        Directory to write the levels to (created if needed).
+    n_levels : int, optional
+        Total number of levels (including `data`).  By default, levels are added
+        until the largest spatial dimension is no larger than `min_size`.
+    method : {"mean", "max", "nearest"}
+        How each 2x2 block of pixels is reduced to one pixel.
+    min_size : int
+        See `n_levels`.
+    processes : int, optional
+        Number of worker processes. Defaults to the number of CPUs.  With 0, the
+        work is done in the current process.  With `executor`, the number of its
+        workers (which bounds the number of chunks in flight).
+    chunk_bytes : int
+        Approximate number of bytes of input processed per chunk.
+    executor : Executor, optional
+        An existing pool of worker processes to use instead of starting one (e.g.
+        `canvas.workers.process_executor()`, with `processes` set to
+        `canvas.workers.max_processes`).  It is not shut down.
+
+    Returns
+    -------
+    Pyramid
+        The levels, from `data` to the lowest resolution.
+    """
+    if method not in ("mean", "max", "nearest"):
+        raise ValueError(f"Unknown downsampling method: {method!r}")
+    shape, dtype = tuple(data.shape), np.dtype(data.dtype)
+    if n_levels is None:
+        n_levels = _n_levels(shape, min_size)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    meta = {"shape": list(shape), "dtype": dtype.str, "method": method}
+    meta_path = directory / _META_FILE
+    if meta_path.exists():
+        old = json.loads(meta_path.read_text())
+        if {k: old.get(k) for k in meta} != meta:
+            raise ValueError(
+                f"{directory} contains a pyramid of different data "
+                f"({old}). Remove it, or use another directory."
+            )
+        done_levels = old.get("levels_done", 1)
+    else:
+        done_levels = 1
+        meta_path.write_text(json.dumps({**meta, "levels_done": done_levels}))
+
+    own_executor = executor is None
+    n_workers = (os.cpu_count() or 1) if processes is None else processes
+    if executor is not None:
+        n_workers = max(n_workers, 1)
+    elif n_workers:
+        executor = ProcessPoolExecutor(n_workers)
+    levels: list[Any] = [data]
+    try:
+        for i in range(1, n_levels):
+            path = directory / f"level_{i}.npy"
+            src = levels[-1]
+            if i < done_levels:
+                levels.append(np.load(path, mmap_mode="r"))
+                continue
+            out_shape = _downsampled_shape(tuple(src.shape))
+            _build_level(src, path, out_shape, method, chunk_bytes, executor, n_workers)
+            levels.append(np.load(path, mmap_mode="r"))
+            meta_path.write_text(json.dumps({**meta, "levels_done": i + 1}))
+    finally:
+        if own_executor and executor is not None:
+            executor.shutdown()
+        _OPEN_MEMMAPS.clear()
+    return Pyramid(levels, [2**i for i in range(len(levels))])
+
+
+def _build_level(
+    src: ArrayLike,
+    path: Path,
+    shape: tuple[int, ...],
+    method: Method,
+    chunk_bytes: int,
+    executor: Executor | None,
+    n_workers: int,
+) -> None:
+    dtype = np.dtype(src.dtype)
+    chunks = _chunks(shape, dtype.itemsize, chunk_bytes)
+    progress_path = path.with_suffix(".progress.npy")
+    if path.exists() and progress_path.exists():
+        out = np.load(path, mmap_mode="r+")
+        done = np.load(progress_path, mmap_mode="r+")
+        if out.shape != shape or len(done) != len(chunks):
+            raise ValueError(f"Cannot resume {path}: the chunking has changed")
+    else:
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        done = np.lib.format.open_memmap(
+            progress_path, mode="w+", dtype=bool, shape=(len(chunks),)
+        )
+    token = uuid.uuid4().hex
+    dst = _memmap_spec(out, "r+", token)
+    src_spec = _memmap_spec(src, "r", token)  # type: ignore [arg-type]
+    index = {c: i for i, c in enumerate(chunks)}
+
+    def _inputs() -> Iterator[tuple[Any, Chunk]]:
+        for chunk, is_done in zip(chunks, done):
+            if not is_done:
+                # memmaps are read by the worker, anything else is sent to it
+                yield src_spec or _read_planes(src, chunk), chunk
+
+    def _mark_done(chunk: Chunk) -> None:
+        done[index[chunk]] = True
+        done.flush()
+
+    if executor is None:
+        for arg, chunk in _inputs():
+            _mark_done(_reduce_chunk(arg, dst, chunk, method))
+    else:
+        # keep a bounded number of chunks in flight
+        pending: set[Future] = set()
+        for arg, chunk in _inputs():
+            pending.add(executor.submit(_reduce_chunk, arg, dst, chunk, method))
+            while len(pending) >= 2 * n_workers:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in finished:
+                    _mark_done(f.result())
+        for f in wait(pending).done:
+            _mark_done(f.result())
+
+    del out
+    _OPEN_MEMMAPS.clear()
+    progress_path.unlink()
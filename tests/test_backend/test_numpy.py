@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from microvis import Canvas
+from microvis.backend.numpy._util import colormap_lut
+from microvis.core import Image, Transform
+from microvis.core.nodes.tiled import TiledImage
+
+DATA = np.arange(16, dtype=np.float32).reshape(4, 4)
+
+
+def _canvas(width: int = 40, height: int = 40, **view_kwargs: object) -> Canvas:
+    """Return a canvas with a view of the scene from (0, 0) to (width, height)/10."""
+    canvas = Canvas(width=width, height=height)
+    view = canvas.add_view(**view_kwargs)
+    view.camera.center = (height / 20, width / 20)
+    view.camera.zoom = 10
+    return canvas
+
+
+def _upsampled(data: np.ndarray, factor: int = 10) -> np.ndarray:
+    return np.kron(data, np.ones((factor, factor)))
+
+
+def test_render_image() -> None:
+    canvas = _canvas()
+    image = canvas.views[0].add_node(Image(DATA, clim=(0, 15)))
+    out = canvas.render(backend="numpy")
+    assert out.shape == (40, 40, 4)
+    assert out.dtype == np.uint8
+    expected = np.rint(_upsampled(DATA) / 15 * 255)
+    np.testing.assert_array_equal(out[..., 0], expected)
+    np.testing.assert_array_equal(out[..., 3], 255)
+
+    # changes are sent to the backend
+    with image.hold_updates():
+        image.gamma = 2
+        image.cmap = "viridis"
+    out = canvas.render(backend="numpy")
+    lut = colormap_lut("viridis")
+    index = np.rint((_upsampled(DATA) / 15) ** 2 * 255).astype(int)
+    np.testing.assert_array_equal(out[..., :3], np.rint(lut[index, :3] * 255))
+
+    with image.hold_updates():
+        image.gamma = 1
+        image.cmap = "grays"
+        image.interpolation = "linear"
+    row = canvas.render(backend="numpy")[15, :, 0].astype(int)
+    # linear between the centers of the pixels (5 canvas pixels from the edges)
+    assert np.all(np.diff(row[5:35]) >= 0)
+    assert row[5] < row[10] < row[15] < row[20] < row[34]
+
+
+def test_render_single_row() -> None:
+    canvas = _canvas()
+    canvas.views[0].add_node(Image(DATA[:1], clim=(0, 15)))
+    out = canvas.render(backend="numpy")
+    np.testing.assert_array_equal(
+        out[:10, :, 0], np.rint(_upsampled(DATA[:1]) / 15 * 255)
+    )
+    np.testing.assert_array_equal(out[10:, :, 3], 0)
+
+
+def test_render_transform_and_opacity() -> None:
+    canvas = _canvas(background_color="white")
+    view = canvas.views[0]
+    # rotated by 90 degrees about the center of the image
+    transform = Transform().translated((-2, -2)).rotated(90, (0, 0, 1))
+    view.add_node(Image(DATA, clim=(0, 15), transform=transform.translated((2, 2))))
+    out = canvas.render(backend="numpy")
+    rotated = np.rint(_upsampled(np.rot90(DATA, -1)) / 15 * 255)
+    np.testing.assert_array_equal(out[..., 0], rotated)
+
+    # half transparent, drawn over the first image, in the top-left quarter
+    top = Image(
+        np.ones((2, 2)),
+        clim=(0, 1),
+        cmap="red",
+        opacity=0.5,
+        transform=Transform(),
+    )
+    view.add_node(top)
+    out = canvas.render(backend="numpy").astype(float)
+    np.testing.assert_allclose(out[:20, :20, 0], rotated[:20, :20] / 2 + 127.5, atol=1)
+    np.testing.assert_allclose(out[:20, :20, 1], rotated[:20, :20] / 2, atol=1)
+    np.testing.assert_array_equal(out[20:, 20:, 0], rotated[20:, 20:])
+
+    top.visible = False
+    np.testing.assert_array_equal(canvas.render(backend="numpy")[..., 0], rotated)
+
+
+def test_render_views() -> None:
+    canvas = Canvas(width=40, height=20)
+    for x, color in [(0, "red"), (20, "blue")]:
+        view = canvas.add_view(
+            position=(x, 0),
+            size=(20, 20),
+            background_color=color,
+            border_width=2,
+            border_color="white",
+        )
+        view.camera.center = (1, 1)
+        view.camera.zoom = 4
+        view.add_node(Image(np.zeros((2, 2)), clim=(0, 1), opacity=0.5))
+
+    out = canvas.render(backend="numpy")
+    np.testing.assert_array_equal(out[0, :, :3], 255)  # the top border
+    np.testing.assert_array_equal(out[:, 21, :3], 255)  # the left border of view 2
+    # backgrounds, then the half transparent (black) images over them
+    np.testing.assert_array_equal(out[3, 3], (255, 0, 0, 255))
+    np.testing.assert_array_equal(out[10, 10], (128, 0, 0, 255))
+    np.testing.assert_array_equal(out[10, 30], (0, 0, 128, 255))
+    # a canvas without a background color is transparent
+    assert (
+        Canvas(width=2, height=3).render(backend="numpy").tolist()
+        == [[[0, 0, 0, 0]] * 2] * 3
+    )
+
+
+def test_render_fit_and_tiles() -> None:
+    # the camera fits the scene until its zoom or center is set
+    data = np.random.default_rng(0).random((64, 48)).astype(np.float32)
+    canvas = Canvas(width=24, height=32)
+    canvas.add_view().add_node(Image(data, clim=(0, 1)))
+    out = canvas.render(backend="numpy")
+    np.testing.assert_array_equal(out[..., 0], np.rint(data[1::2, 1::2] * 255))
+
+    canvas = _canvas(48, 64)
+    canvas.views[0].camera.zoom = 1
+    canvas.views[0].camera.center = (32, 24)
+    canvas.views[0].add_node(TiledImage(data, tile_size=16, clim=(0, 1)))
+    canvas.render(backend="numpy")
+    assert canvas.scheduler.wait(5)
+    out = canvas.render(backend="numpy")
+    np.testing.assert_array_equal(out[..., 0], np.rint(data * 255))
+    canvas.close()
+
+
+@pytest.mark.parametrize("name", ["grays", "viridis", "hot", "bone", "pink"])
+def test_colormaps(name: str) -> None:
+    lut = colormap_lut(name)
+    assert lut.shape == (256, 4)
+    assert np.all((lut >= 0) & (lut <= 1))
+    # all of these colormaps go from dark to light
+    assert lut[0, :3].sum() < lut[-1, :3].sum()
@@ -1,8 +1,14 @@
 import json
+import threading
+import time
+from functools import partial
 
+import numpy as np
 import pytest
 
 from microvis._types import Color
+from microvis.core._scheduler import ChunkScheduler
+from microvis.core._workers import WorkerPool, check_cancelled, current_task
 from microvis.core.canvas import Canvas
 
 
@@ -29,8 +35,10 @@ def test_canvas() -> None:
     canvas.height = 750
     adaptor._vis_set_height.assert_called_once_with(750)
     canvas.size = (720, 770)
-    adaptor._vis_set_width.assert_called_with(720)
-    adaptor._vis_set_height.assert_called_with(770)
+    # size is applied to the backend in a single call
+    adaptor._vis_set_size.assert_called_once_with(720, 770)
+    adaptor._vis_set_width.assert_called_once()
+    adaptor._vis_set_height.assert_called_once()
     canvas.title = "MicroVis2"
     adaptor._vis_set_title.assert_called_once_with("MicroVis2")
     canvas.background_color = "blue"
@@ -60,3 +68,203 @@ def test_canvas() -> None:
     # these should get passed to the backend adaptor object.
     canvas._repr_mimebundle_(1, 2, x=1)  # random args, kwargs
     adaptor._vis_get_ipython_mimebundle.assert_called_once_with(1, 2, x=1)
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_canvas_deferred_sync() -> None:
+    canvas = Canvas()
+    view = canvas.add_view()
+    canvas.deferred_sync = True
+    canvas.show()
+    adaptor = canvas.backend_adaptor()
+    adaptor._vis_connect_before_draw.assert_called_once_with(canvas.flush_updates)
+    cam_adaptor = view.camera.backend_adaptor()
+
+    for zoom in range(2, 10):
+        view.camera.zoom = zoom
+    adaptor._vis_request_draw.assert_called_once()
+    cam_adaptor._vis_set_zoom.assert_not_called()
+
+    # nodes added later share the canvas queue
+    image = view.add_image(np.zeros((4, 4)))
+    img_adaptor = image.backend_adaptor()
+    image.gamma = 2
+    img_adaptor._vis_set_gamma.assert_not_called()
+
+    # pending updates are flushed before rendering
+    canvas.render()
+    cam_adaptor._vis_set_zoom.assert_called_once_with(9)
+    img_adaptor._vis_set_gamma.assert_called_once_with(2)
+
+    # turning off deferred sync applies updates immediately
+    view.camera.zoom = 1
+    canvas.deferred_sync = False
+    cam_adaptor._vis_set_zoom.assert_called_with(1)
+    view.camera.zoom = 2
+    cam_adaptor._vis_set_zoom.assert_called_with(2)
+
+
+def test_chunk_scheduler() -> None:
+    scheduler = ChunkScheduler(max_in_flight=1)
+    release = threading.Event()
+    order: list = []
+    delivered: list = []
+
+    def _read(key: str) -> str:
+        if key == "blocker":
+            release.wait(5)
+        order.append(key)
+        return key.upper()
+
+    owner = object()
+
+    def _submit(key: str, priority: tuple) -> None:
+        scheduler.submit(owner, key, partial(_read, key), delivered.append, priority)
+
+    _submit("blocker", (0, 0))  # occupies the worker
+    for key, priority in [("far", (0, 50)), ("near", (0, 1)), ("other", (1, 0))]:
+        _submit(key, priority)
+    _submit("gone", (0, 10))
+    _submit("near", (0, 0))  # already queued: only its priority is updated
+    assert scheduler.queue_depth == 4
+    assert scheduler.in_flight == 1
+
+    # requests that left the view are cancelled before they run
+    assert scheduler.cancel(owner, keep={"blocker", "far", "near", "other"}) == 1
+    scheduler.reprioritize(owner, lambda key: (0, 100) if key == "near" else (0, 5))
+    assert scheduler.stats() == {
+        "queued": 3,
+        "in_flight": 1,
+        "submitted": 5,
+        "completed": 0,
+        "cancelled": 1,
+    }
+
+    release.set()
+    assert scheduler.wait(5)
+    assert order == ["blocker", "far", "other", "near"]
+    # results are only delivered when asked (on the main thread)
+    assert not delivered
+    assert scheduler.deliver() == 4
+    assert delivered == ["BLOCKER", "FAR", "OTHER", "NEAR"]
+    scheduler.close()
+
+
+def test_canvas_scheduler() -> None:
+    canvas = Canvas()
+    scheduler = canvas.scheduler
+    assert scheduler.max_in_flight == Canvas.MAX_CHUNK_READS
+    delivered: list = []
+    scheduler.submit(canvas, "key", lambda: 1, delivered.append)
+    assert scheduler.wait(5)
+    # chunks are delivered with the other pending updates, before drawing
+    canvas.flush_updates()
+    assert delivered == [1]
+
+    canvas.close()
+    assert canvas._scheduler is None
+
+
+def test_worker_pool() -> None:
+    ready = threading.Event()
+    pool = WorkerPool(max_threads=1, max_processes=1, on_ready=ready.set)
+    release, started = threading.Event(), threading.Event()
+    order: list = []
+    delivered: list = []
+
+    def _blocker() -> str:
+        started.set()
+        release.wait(5)
+        return "blocker"
+
+    def _cancellable() -> None:
+        started.set()
+        while True:
+            check_cancelled()
+            release.wait(0.01)
+
+    blocker = pool.submit(_blocker, callback=delivered.append)
+    assert started.wait(5)
+    # the queued tasks run by priority, then in order of submission
+    for name, priority in [("stats", 0), ("read-ahead", 1), ("display", -1)]:
+        pool.submit(order.append, name, priority=priority)
+    dropped = pool.submit(order.append, "dropped", callback=delivered.append)
+    assert dropped.cancel()
+    assert pool.stats()["queued"] == 3
+    release.set()
+    assert blocker.result(5) == "blocker"
+    assert pool.wait(5)
+    assert order == ["display", "stats", "read-ahead"]
+    assert current_task() is None
+
+    # results are only delivered when asked (on the main thread)
+    assert ready.is_set()
+    assert not delivered
+    assert pool.deliver() == 1
+    assert delivered == ["blocker"]
+
+    # running tasks stop when they check for cancellation
+    release.clear()
+    started.clear()
+    task = pool.submit(_cancellable, callback=delivered.append)
+    assert started.wait(5)
+    task.cancel()
+    assert pool.wait(5)
+    assert task.cancel_requested
+    assert pool.deliver() == 0
+
+    assert pool.submit(pow, 3, 4, process=True).result(30) == 81
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(order.append, "late")
+
+
+def test_canvas_workers() -> None:
+    canvas = Canvas()
+    workers = canvas.workers
+    assert workers.max_threads == Canvas.MAX_WORKER_THREADS
+    assert workers.max_processes == Canvas.MAX_WORKER_PROCESSES
+    # chunk reads share the pool of the canvas
+    assert canvas.scheduler._pool is workers
+    delivered: list = []
+    workers.submit(sum, [1, 2], callback=delivered.append)
+    assert workers.wait(5)
+    canvas.flush_updates()
+    assert delivered == [3]
+
+    canvas.close()
+    assert canvas._workers is None
+    with pytest.raises(RuntimeError):
+        workers.submit(sum, [1])
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_canvas_workers_request_draw() -> None:
+    # workers only request a draw (which adaptors must marshal to their thread),
+    # the results are delivered on the thread that flushes the updates
+    canvas = Canvas()
+    canvas.show()
+    threads: list = []
+    adaptor = canvas.backend_adaptor()
+    adaptor._vis_request_draw.side_effect = lambda: threads.append(
+        threading.current_thread()
+    )
+    # adaptors are only told to expect draw requests from other threads once the
+    # canvas has workers (e.g. so that idle vispy canvases don't poll for them)
+    adaptor._vis_enable_threaded_draws.assert_not_called()
+    assert canvas.workers is canvas.workers
+    adaptor._vis_enable_threaded_draws.assert_called_once()
+    delivered: list = []
+    canvas.workers.submit(
+        sum, [1, 2], callback=lambda r: delivered.append(threading.current_thread())
+    )
+    assert canvas.workers.wait(5)
+    deadline = time.monotonic() + 5
+    while not threads and time.monotonic() < deadline:  # (called after the task)
+        time.sleep(0.001)
+    assert threads
+    assert threads[0] is not threading.main_thread()
+    assert not delivered
+    canvas.flush_updates()
+    assert delivered == [threading.main_thread()]
+    canvas.close()
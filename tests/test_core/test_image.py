@@ -0,0 +1,494 @@
+import threading
+from concurrent.futures import wait
+from typing import Optional
+from unittest.mock import ANY
+
+import numpy as np
+import pytest
+
+from microvis.core.canvas import Canvas
+from microvis.core.nodes import _prefetch, _stats
+from microvis.core.nodes._data import _hashable_key, _key_to_region
+from microvis.core.nodes.image import Image, PercentileContrast
+from microvis.core.nodes.multiscale import MultiscaleImage
+from microvis.core.nodes.tiled import TiledImage
+from microvis.core.view import View
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "uint16", "int8", "int16"])
+def test_histogram_percentiles_exact(dtype: str) -> None:
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(0)
+    data = rng.integers(info.min, info.max, size=(101, 67), dtype=dtype)
+    q = [0.1, 1, 33.3, 50, 99, 99.9]
+    expected = np.percentile(data, q)
+    np.testing.assert_allclose(_stats.percentiles(data, q), expected)
+
+    counts, offset = _stats.bincount_histogram(data[::2, 1::3])  # non-contiguous
+    result = _stats.histogram_percentiles(counts, q, offset)
+    np.testing.assert_allclose(result, np.percentile(data[::2, 1::3], q))
+
+
+def test_bincount_histogram_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = np.random.default_rng(0).integers(0, 255, (5, 40, 30), dtype="uint8")
+    expected = np.bincount(data.ravel(), minlength=256)
+    # chunks of rows, of single planes, and of parts of a row
+    for chunk_size in (2000, 1000, 7):
+        monkeypatch.setattr(_stats, "_CHUNK_SIZE", chunk_size)
+        counts, _ = _stats.bincount_histogram(data)
+        np.testing.assert_array_equal(counts, expected)
+        counts, _ = _stats.bincount_histogram(data.transpose(2, 0, 1)[:, ::2])
+        np.testing.assert_array_equal(
+            counts, np.bincount(data[::2].ravel(), minlength=256)
+        )
+
+
+def test_sampled_percentiles() -> None:
+    data = np.random.default_rng(0).normal(size=(1000, 1000)).astype("float32")
+    q = [1, 50, 99]
+    n = 100_000
+    est = _stats.sampled_percentiles(data, q, sample_size=n)
+    # the DKW bound: estimate falls between the true p ± 100 * eps percentiles
+    eps = np.sqrt(np.log(2 / 0.001) / (2 * n)) * 100
+    for p, value in zip(q, est):
+        lo, hi = np.percentile(data, [p - eps, p + eps])
+        assert lo <= value <= hi
+
+    # with a sample size, the extremes are read from the sample too
+    stats = _stats.DataStats(data)
+    low, high = stats.percentiles([0, 100], sample_size=1000)
+    sample = stats.sample(1000)
+    assert (low, high) == (sample.min(), sample.max())
+    assert "min" not in stats._cache and "max" not in stats._cache
+
+    # small data is exact
+    small = data[:10, :10]
+    np.testing.assert_allclose(
+        _stats.sampled_percentiles(small, q, n), np.percentile(small, q)
+    )
+
+
+def test_percentile_contrast() -> None:
+    data = np.random.default_rng(0).random((100, 100))
+    assert PercentileContrast().apply(data) == (data.min(), data.max())
+    clim = PercentileContrast(pmin=1, pmax=99)
+    np.testing.assert_allclose(clim.apply(data), np.percentile(data, [1, 99]))
+
+    img = Image(data, clim={"pmin": 1, "pmax": 99, "sample_size": 1000})
+    assert isinstance(img.clim, PercentileContrast)
+    assert img.clim.sample_size == 1000
+    low, high = img.clim_applied()
+    assert data.min() < low < high < data.max()
+
+
+def test_data_stats_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = np.random.default_rng(0).integers(0, 1000, (64, 64), dtype="uint16")
+    img = Image(data, clim={"pmin": 1, "pmax": 99})
+    n_calls = 0
+    original = _stats.bincount_histogram
+
+    def _counting_histogram(data: np.ndarray) -> tuple:
+        nonlocal n_calls
+        n_calls += 1
+        return original(data)
+
+    monkeypatch.setattr(_stats, "bincount_histogram", _counting_histogram)
+    rev = img.data_revision
+    np.testing.assert_allclose(img.clim_applied(), np.percentile(data, [1, 99]))
+    img.clim = {"pmin": 2, "pmax": 98}
+    np.testing.assert_allclose(img.clim_applied(), np.percentile(data, [2, 98]))
+    assert n_calls == 1  # the histogram was reused
+
+    # mutating the data bumps the revision and invalidates the cache
+    img.data[0, 0] = 999
+    assert img.data_revision == rev + 1
+    img.clim_applied()
+    assert n_calls == 2
+
+
+@pytest.mark.parametrize(
+    "key, region",
+    [
+        (1, (slice(1, 2), slice(0, 20), slice(0, 30))),
+        ((slice(2, 5), -1), (slice(2, 5), slice(19, 20), slice(0, 30))),
+        ((..., slice(None, None, -3)), (slice(0, 10), slice(0, 20), slice(2, 30))),
+        ((slice(1, 8, 3), ..., 4), (slice(1, 8), slice(0, 20), slice(4, 5))),
+        (np.array([1, 2]), None),
+        ((1, 2, 3, 4), None),
+    ],
+)
+def test_key_to_region(key, region) -> None:
+    assert _key_to_region(key, (10, 20, 30)) == region
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_data_region_update() -> None:
+    data = np.zeros((100, 100))
+    img = Image(data)
+    adaptor = img.backend_adaptor()
+
+    img.data[10:20, 50:60] = 1
+    adaptor._vis_update_data_region.assert_called_once_with(
+        (slice(10, 20), slice(50, 60)), ANY
+    )
+    np.testing.assert_array_equal(
+        adaptor._vis_update_data_region.call_args[0][1], np.ones((10, 10))
+    )
+    adaptor._vis_set_data.assert_not_called()
+
+    # regions changed while holding updates are merged into one bounding box
+    adaptor.reset_mock()
+    with img.hold_updates():
+        img.data[5, 5] = 2
+        img.data[30:40, 0:2] = 3
+    adaptor._vis_update_data_region.assert_called_once_with(
+        (slice(5, 40), slice(0, 6)), ANY
+    )
+
+    # anything else still updates all of the data
+    img.data[data > 1] = 0
+    adaptor._vis_set_data.assert_called_once_with(data)
+
+
+class _LazyArray:
+    """Array-like that records reads, and can't be converted as a whole."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        self._data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.reads: list = []
+        # if set, reads wait for this event
+        self.gate: Optional[threading.Event] = None
+
+    def __getitem__(self, key):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.reads.append(key)
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __array__(self, *_):
+        raise AssertionError("lazy array should not be fully read")
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_lazy_data() -> None:
+    data = np.random.default_rng(0).integers(0, 100, (5, 32, 32), dtype="uint8")
+    lazy = _LazyArray(data)
+    img = Image(lazy, clim={"pmin": 1, "pmax": 99})
+    assert not lazy.reads  # nothing is read until needed
+
+    adaptor = img.backend_adaptor()
+    np.testing.assert_allclose(img.clim_applied(), np.percentile(data[0], [1, 99]))
+    np.testing.assert_array_equal(img.display_data(), data[0])
+    assert lazy.reads == [(0, slice(None), slice(None))]
+
+    # the backend gets the displayed plane
+    img.data = lazy
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], data[0])
+
+    # edits outside of the displayed plane don't touch the backend
+    adaptor.reset_mock()
+    img.data[2, 0:4] = 1
+    adaptor._vis_set_data.assert_not_called()
+    adaptor._vis_update_data_region.assert_not_called()
+    img.data[0, 0:4] = 1
+    adaptor._vis_update_data_region.assert_called_once_with(
+        (slice(0, 4), slice(0, 32)), ANY
+    )
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_data_node_dims() -> None:
+    data = np.random.default_rng(0).integers(0, 100, (4, 5, 16, 16), dtype="uint8")
+    lazy = _LazyArray(data)
+    img = Image(lazy, dims="TZYX", clim={"pmin": 0, "pmax": 100})
+    adaptor = img.backend_adaptor()
+    np.testing.assert_array_equal(img.display_data(), data[0, 0])
+
+    assert img.dims is not None
+    img.dims.set_point("T", 2)
+    img.dims.set_point("Z", 3)
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], data[2, 3])
+    # DataFields are re-applied to the new slice
+    expected = (data[2, 3].min(), data[2, 3].max())
+    assert adaptor._vis_set_clim.call_args[0][0] == expected
+
+    # recently viewed slices come from the cache
+    n_reads = len(lazy.reads)
+    img.dims.set_point("T", 0)
+    img.dims.set_point("Z", 0)
+    img.dims.set_point("T", 2)
+    img.dims.set_point("Z", 3)
+    assert lazy.reads[n_reads:] == [(0, 3, slice(None), slice(None))]
+
+    # windows in the displayed dimensions crop the data
+    img.dims["Y"] = slice(4, 12)
+    assert img.display_data().shape == (8, 16)
+
+    # edits are mapped to the displayed region
+    adaptor.reset_mock()
+    img.data[2, 3, 0:6, 1] = 0
+    adaptor._vis_update_data_region.assert_called_once()
+    region = adaptor._vis_update_data_region.call_args[0][0]
+    assert region == (slice(0, 2), slice(1, 2))
+    # data changes invalidate the cache
+    assert (img.display_data()[:2, 1] == 0).all()
+
+
+def test_display_key_singleton_axes() -> None:
+    # displayed axes of length 1 stay displayed (as slices)
+    data = np.arange(100.0).reshape(1, 100)
+    img = Image(data)
+    assert img._display_key() == (slice(None), slice(None))
+    np.testing.assert_array_equal(img.display_data(), data)
+
+    # a singleton displayed axis does not promote a leading axis to displayed
+    data = np.arange(500.0).reshape(5, 1, 100)
+    img = Image(data, dims=range(3))
+    assert img._display_key() == (0, slice(None), slice(None))
+    np.testing.assert_array_equal(img.display_data(), data[0])
+    assert img.dims is not None
+    img.dims.set_point(0, 3)
+    np.testing.assert_array_equal(img.display_data(), data[3])
+
+
+def test_prefetch_keys() -> None:
+    key = (3, 0, slice(None), slice(None))
+    shape = (6, 2, 8, 8)
+    assert _prefetch.infer_travel((2, 0, *key[2:]), key) == (0, 1)
+    assert _prefetch.infer_travel((2, 1, *key[2:]), key) == (None, None)
+    assert _prefetch.prefetch_keys(key, shape, 0, 1, 5) == [
+        (4, 0, *key[2:]),
+        (5, 0, *key[2:]),
+    ]
+    assert _prefetch.prefetch_keys(key, shape, 0, -1, 2) == [
+        (2, 0, *key[2:]),
+        (1, 0, *key[2:]),
+    ]
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_prefetch() -> None:
+    data = np.random.default_rng(0).integers(0, 100, (10, 16, 16), dtype="uint8")
+    lazy = _LazyArray(data)
+    img = Image(lazy, dims={0: None}, prefetch=2)
+    img.backend_adaptor()
+    assert img.dims is not None
+
+    img.dims.set_point(0, 1)
+    wait(img._prefetch_futures.values())
+    assert sorted(k[0] for k in lazy.reads) == [1, 2, 3]
+
+    # stepping onto prefetched slices doesn't read them again
+    n_reads = len(lazy.reads)
+    img.dims.set_point(0, 2)
+    np.testing.assert_array_equal(img.display_data(), data[2])
+    wait(img._prefetch_futures.values())
+    assert [k[0] for k in lazy.reads[n_reads:]] == [4]
+
+    # reversing direction reads ahead in the new direction
+    img.dims.set_point(0, 1)
+    wait(img._prefetch_futures.values())
+    assert _hashable_key((0, slice(None), slice(None))) in img._slice_cache
+
+    # in-memory data is never prefetched
+    img = Image(data, dims={0: None}, prefetch=2)
+    img.dims.set_point(0, 1)  # type: ignore [union-attr]
+    assert not img._prefetch_futures
+
+
+def test_background_read_of_stale_data() -> None:
+    data = np.zeros((4, 8, 8), dtype="uint8")
+    img = Image(_LazyArray(data))
+    key = (1, slice(None), slice(None))
+    in_put, resume = threading.Event(), threading.Event()
+    cache = img._slice_cache
+    put = cache.put
+
+    def _paused_put(*args: object) -> None:
+        in_put.set()
+        resume.wait(5)
+        put(*args)
+
+    cache.put = _paused_put  # type: ignore [method-assign]
+    reader = threading.Thread(target=img._load_region, args=(key, img.data_revision))
+    reader.start()
+    assert in_put.wait(5)
+    # the data changes after the read, while it is being cached
+    editor = threading.Thread(target=img.data.__setitem__, args=(1, 7))
+    editor.start()
+    editor.join(0.1)
+    resume.set()
+    reader.join(5)
+    editor.join(5)
+    # the stale read must not be cached under the new revision
+    assert _hashable_key(key) not in cache
+    np.testing.assert_array_equal(img._read_region(key), 7)
+
+
+def test_memmap_data(tmp_path) -> None:
+    mm = np.lib.format.open_memmap(
+        tmp_path / "data.npy", mode="w+", dtype="uint16", shape=(10, 64, 64)
+    )
+    mm[:] = np.arange(10, dtype="uint16")[:, None, None]
+    img = Image(mm)
+    assert img.display_data().shape == (64, 64)
+    assert img.clim_applied() == (0, 0)
+    rgb = Image(np.zeros((4, 8, 8, 3), dtype="uint8"))
+    assert rgb.display_data().shape == (8, 8, 3)
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_multiscale_image() -> None:
+    base = np.random.default_rng(0).integers(0, 100, (64, 128), dtype="uint8")
+    levels = [_LazyArray(base[:: 2**i, :: 2**i]) for i in range(4)]
+    img = MultiscaleImage(levels)
+    assert img.scales == (1, 2, 4, 8)
+    assert img.level_for_zoom(1) == 0
+    assert img.level_for_zoom(0.5) == 1
+    assert img.level_for_zoom(0.3) == 1
+    assert img.level_for_zoom(0.01) == 3
+    assert img.level_for_zoom(4) == 0
+
+    view = View()
+    view.add_node(img)
+    adaptor = img.backend_adaptor()
+    view.camera.zoom = 0.25
+    assert img.level == 2
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], base[::4, ::4])
+    # the displayed level is scaled to the coordinates of the full resolution level
+    transform = adaptor._vis_set_transform.call_args[0][0]
+    np.testing.assert_allclose(transform.map((16, 8))[:2], (64, 32))
+    # only the displayed level has been read
+    assert not levels[0].reads and not levels[1].reads
+
+    with pytest.raises(ValueError, match="Scales"):
+        MultiscaleImage(levels, scales=(1, 4, 2, 8))
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_progressive_image() -> None:
+    data = np.random.default_rng(0).integers(0, 1000, (1000, 1500), dtype="uint16")
+    lazy = _LazyArray(data)
+    canvas = Canvas()
+    view = canvas.add_view(View(size=(600, 400)))
+    img = view.add_node(Image(lazy, progressive=True))
+    adaptor = img.backend_adaptor()
+
+    # a strided preview is shown first, scaled to the size of the full plane
+    img.dims = "YX"
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], data[::3, ::3])
+    transform = adaptor._vis_set_transform.call_args[0][0]
+    np.testing.assert_allclose(transform.map((10, 20))[:2], (30, 60))
+    expected_clim = (data[::3, ::3].min(), data[::3, ::3].max())
+    assert adaptor._vis_set_clim.call_args[0][0] == expected_clim
+    assert img.transform.is_null()
+
+    # ... and replaced by the full plane once it is loaded
+    assert canvas.scheduler.wait(5)
+    canvas.flush_updates()
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], data)
+    assert adaptor._vis_set_transform.call_args[0][0].is_null()
+    assert len(lazy.reads) == 2
+    canvas.close()
+
+    # multiscale images preview the coarsest level
+    levels = [_LazyArray(data[:: 2**i, :: 2**i]) for i in range(4)]
+    canvas = Canvas()
+    view = canvas.add_view(View(size=(600, 400)))
+    view.camera.zoom = 1
+    img = view.add_node(MultiscaleImage(levels, scales=(1, 2, 4, 8), progressive=True))
+    adaptor = img.backend_adaptor()
+    img.dims = "YX"
+    assert img.level == 0
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], data[::8, ::8])
+    transform = adaptor._vis_set_transform.call_args[0][0]
+    np.testing.assert_allclose(transform.map((10, 20))[:2], (80, 160))
+    assert canvas.scheduler.wait(5)
+    canvas.flush_updates()
+    np.testing.assert_array_equal(adaptor._vis_set_data.call_args[0][0], data)
+    assert adaptor._vis_set_transform.call_args[0][0].is_null()
+    canvas.close()
+
+
+@pytest.mark.usefixtures("mock_backend")
+def test_tiled_image(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = np.random.default_rng(0).integers(0, 100, (2000, 3000), dtype="uint8")
+    lazy = _LazyArray(data)
+    # room for 6 hidden tiles
+    monkeypatch.setattr(TiledImage, "TILE_CACHE_BYTES", 6 * 512 * 512)
+    img = TiledImage(lazy, tile_size=512, clim=(10, 90))
+    view = View(size=(600, 400))
+    view.camera.center = (1000, 1500)
+    view.add_node(img)
+    img.backend_adaptor()
+    # x in [1200, 1800], y in [800, 1200]
+    assert set(img.tiles) == {(1, 2), (1, 3), (2, 2), (2, 3)}
+    assert len(lazy.reads) == 4
+    tile = img.tiles[(2, 3)]
+    np.testing.assert_array_equal(tile.data_raw, data[1024:1536, 1536:2048])
+    np.testing.assert_array_equal(tile.transform.map((0, 0))[:2], (1536, 1024))
+
+    # panning hides tiles that go out of view, and reuses them when they come back
+    view.camera.center = (1000, 2700)
+    assert set(img.tiles) == {(1, 4), (1, 5), (2, 4), (2, 5)}
+    assert not tile.visible
+    view.camera.center = (1000, 1500)
+    assert img.tiles[(2, 3)] is tile and tile.visible
+    assert len(lazy.reads) == 8
+
+    # hidden tiles beyond the cache budget are removed
+    view.camera.center = (0, 0)
+    assert len(img.children) == 6 + len(img.tiles)
+
+    # image properties are applied to all tiles
+    img.cmap = "viridis"
+    img.clim = (0, 50)
+    assert all(t.cmap == "viridis" for t in img.children)
+    assert all(tuple(t.clim) == (0, 50) for t in img.children)
+
+    # edits update the tiles that contain them
+    img.data[0:10, 0:10] = 99
+    assert (img.tiles[(0, 0)].data_raw[0:10, 0:10] == 99).all()
+
+
+def test_tiled_image_scheduled() -> None:
+    data = np.random.default_rng(0).integers(0, 100, (2000, 3000), dtype="uint8")
+    lazy = _LazyArray(data)
+    canvas = Canvas()
+    view = canvas.add_view(View(size=(600, 400)))
+    view.camera.center = (1000, 1500)
+    img = view.add_node(TiledImage(lazy, tile_size=512, clim=(10, 90)))
+    scheduler = canvas.scheduler
+    # tiles are read in the background, and shown once delivered
+    assert not img.tiles
+    assert scheduler.wait(5)
+    canvas.flush_updates()
+    assert set(img.tiles) == {(1, 2), (1, 3), (2, 2), (2, 3)}
+    np.testing.assert_array_equal(
+        img.tiles[(2, 3)].data_raw, data[1024:1536, 1536:2048]
+    )
+
+    # reads of tiles that left the view before they were read are cancelled
+    lazy.gate = threading.Event()
+    view.camera.center = (1000, 2700)  # 4 new tiles, all read (and blocked)
+    view.camera.center = (1700, 500)  # 4 more tiles, queued
+    view.camera.center = (1000, 1500)
+    assert scheduler.n_cancelled == 8
+    lazy.gate.set()
+    assert scheduler.wait(5)
+    canvas.flush_updates()
+    assert set(img.tiles) == {(1, 2), (1, 3), (2, 2), (2, 3)}
+    assert scheduler.queue_depth == scheduler.in_flight == 0
+    canvas.close()
+
+
+def test_tiled_image_clim() -> None:
+    data = np.random.default_rng(0).normal(size=(1000, 1000)).astype("float32")
+    img = TiledImage(_LazyArray(data), clim={"pmin": 1, "pmax": 99})
+    expected = np.percentile(data, [1, 99])
+    np.testing.assert_allclose(img.clim_applied(), expected, rtol=0.05)
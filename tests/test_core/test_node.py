@@ -0,0 +1,39 @@
+import copy
+
+import pytest
+
+from microvis.core import Node
+
+
+def test_children_by_identity() -> None:
+    root = Node()
+    # equal (default) nodes, which are still different children
+    a, b = Node(), Node()
+    root.add(a)
+    assert a in root
+    assert b not in root
+    root.add(b)
+    root.add(a)  # already a child
+    assert list(root.children) == [a, b]
+
+    assert root.children.index(b) == 1
+    root.remove(a)
+    assert a not in root
+    assert b in root
+    assert a.parent is None
+    with pytest.raises(ValueError, match="not in list"):
+        root.children.index(a)
+
+    # the index follows the other changes of the list
+    root.children[0] = a
+    assert a in root
+    assert b not in root
+    del root.children[:]
+    assert a not in root
+    assert not root.children._ids
+
+    # copies have their own index
+    root.add(a)
+    children = copy.copy(root.children)
+    assert a in children
+    assert children._ids is not root.children._ids
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from microvis.core._cache import LRUCache
+from microvis.core.slice import Dimensions, Slice
+
+
+def test_dimensions() -> None:
+    dims = Dimensions("TZYX")
+    assert list(dims) == ["T", "Z", "Y", "X"]
+    assert dims.to_slices(4) == (slice(None),) * 4
+    with pytest.raises(ValueError, match="named dimensions"):
+        dims.to_slices(3)
+
+    emitted = []
+    dims.events.__root__.connect(emitted.append)
+    dims.set_point("T", 3)
+    dims["Z"].stop = 10  # in-place changes are relayed
+    assert len(emitted) == 2
+    assert dims.to_slices(4)[:2] == (slice(3, 4), slice(None, 10))
+
+    # a replaced Slice is no longer relayed
+    old = dims["Z"]
+    dims["Z"] = Slice(1, 2)
+    old.stop = 20
+    assert len(emitted) == 3
+    assert len(old.events) == 0
+
+    assert Dimensions({-3: Slice(2, 5)}).to_slices(3)[0] == slice(2, 5)
+    with pytest.raises(IndexError):
+        Dimensions({3: None}).to_slices(3)
+
+
+def test_lru_cache() -> None:
+    evicted = []
+    cache = LRUCache(max_bytes=300, on_evict=lambda k, v: evicted.append(k))
+    for i in range(3):
+        cache.put(i, np.zeros(100, dtype="uint8"))
+    assert cache.get(0) is not None  # 0 is now the most recently used
+    cache.put(3, np.zeros(100, dtype="uint8"))
+    assert evicted == [1]
+    assert list(cache) == [2, 0, 3]
+    assert cache.nbytes == 300
+
+    cache.put(4, np.zeros(301, dtype="uint8"))  # too large to cache
+    assert 4 not in cache
+    assert len(cache) == 3
+    cache.clear()
+    assert cache.nbytes == 0
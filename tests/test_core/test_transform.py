@@ -0,0 +1,176 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from microvis.core import Image, Node, Transform, _transform
+
+
+def test_transform_is_immutable() -> None:
+    transform = Transform().translated((1, 2))
+    with pytest.raises(ValueError, match="read-only"):
+        transform.matrix[0, 0] = 2
+    with pytest.raises(ValueError, match="Expected 4x4 matrix"):
+        Transform(np.eye(3))
+
+    # the matrix passed in is copied, so it can still be modified
+    matrix = np.eye(4)
+    Transform(matrix)
+    matrix[0, 0] = 2
+
+    # including after a round-trip through pickle
+    transform.inv()
+    restored = pickle.loads(pickle.dumps(transform))  # noqa: S301
+    assert restored == transform
+    for obj in (restored, restored.inv()):
+        with pytest.raises(ValueError, match="read-only"):
+            obj.matrix[0, 0] = 2
+
+
+def test_transform_caches() -> None:
+    transform = Transform().scaled((2, 4)).translated((1, 2))
+    inverse = transform.inv()
+    assert transform.inv() is inverse
+    assert inverse.inv() is transform
+    np.testing.assert_allclose(transform.imap(transform.map((3, 5))), [3, 5, 0, 1])
+    assert not transform.is_null()
+    assert (transform @ inverse).is_null()
+
+
+def test_transform_chain() -> None:
+    transforms = [Transform().rotated(i * 10, (0, 0, 1)) for i in range(5)]
+    expected = np.linalg.multi_dot([t.matrix for t in transforms])
+    np.testing.assert_allclose(Transform.chain(*transforms).matrix, expected)
+    assert Transform.chain().is_null()
+    # derived transforms are fully functional models
+    derived = transforms[0] @ transforms[1]
+    assert isinstance(derived, Transform)
+    assert derived.events is derived.events
+    assert derived.dict().keys() == {"matrix"}
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_map_points(ndim: int, dtype: str) -> None:
+    transform = Transform().rotated(30, (0, 0, 1)).scaled((2, 3, 4)).translated((1, 2))
+    points = np.random.default_rng(0).random((1000, ndim)).astype(dtype)
+    expected = transform.map(points)[:, :ndim]
+
+    mapped = transform.map_points(points)
+    assert mapped.dtype == dtype
+    np.testing.assert_allclose(mapped, expected, rtol=1e-5)
+    np.testing.assert_allclose(transform.imap_points(mapped), points, atol=1e-5)
+
+    # in place, in several chunks
+    out = points.copy()
+    _transform.MAP_CHUNK_SIZE, size = 64, _transform.MAP_CHUNK_SIZE
+    try:
+        assert transform.map_points(out, out=out) is out
+    finally:
+        _transform.MAP_CHUNK_SIZE = size
+    np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+    with pytest.raises(ValueError, match="must be a float32 or float64"):
+        transform.map_points(points, out=np.empty((1000, ndim), dtype=int))
+
+
+def test_map_points_projective() -> None:
+    matrix = np.eye(4)
+    matrix[0, 3] = 1  # w = x + 1
+    points = np.array([[1.0, 2.0], [3.0, 4.0]])
+    mapped = Transform(matrix).map_points(points)
+    np.testing.assert_allclose(mapped, points / (points[:, :1] + 1))
+
+
+def test_map_points_to_node() -> None:
+    root = Node()
+    a = Node(transform=Transform().scaled((2, 2)), parent=root)
+    a1 = Node(transform=Transform().translated((10, 0)), parent=a)
+    b = Node(transform=Transform().scaled((4, 4)), parent=root)
+    points = np.array([[1.0, 1.0], [2.0, 3.0]])
+    # a1 -> a -> root -> b
+    expected = np.add(points, [10, 0]) * 2 / 4
+    np.testing.assert_allclose(a1.map_points_to_node(b, points), expected)
+    np.testing.assert_allclose(a1.transform_to_node(b).map(points)[:, :2], expected)
+
+
+def test_transform_to_node_order() -> None:
+    # non-commuting transforms: the order of composition matters
+    root = Node(transform=Transform().rotated(30, (0, 0, 1)))
+    a = Node(transform=Transform().rotated(45, (0, 0, 1)).scaled((2, 3)), parent=root)
+    a1 = Node(transform=Transform().scaled((0.5, 4)).translated((7, -2)), parent=a)
+    b = Node(
+        transform=Transform().translated((1, 2)).rotated(-60, (0, 0, 1)), parent=root
+    )
+    b1 = Node(transform=Transform().scaled((3, 1)).rotated(10, (0, 0, 1)), parent=b)
+
+    up, down = a1.path_to_node(b1)
+    assert (up, down) == ([a1, a, root], [b, b1])
+    # row vectors: up to (excluding) the common parent, then down its inverses
+    matrix = np.eye(4)
+    for node in up[:-1]:
+        matrix = matrix @ node.transform.matrix
+    for node in down:
+        matrix = matrix @ np.linalg.inv(node.transform.matrix)
+
+    np.testing.assert_allclose(a1.transform_to_node(b1).matrix, matrix, atol=1e-12)
+    np.testing.assert_allclose(
+        b1.transform_to_node(a1).matrix, np.linalg.inv(matrix), atol=1e-12
+    )
+    points = np.array([[1.0, 2.0], [-3.0, 0.5]])
+    expected = np.c_[points, np.zeros(2), np.ones(2)] @ matrix
+    np.testing.assert_allclose(a1.map_points_to_node(b1, points), expected[:, :2])
+
+
+def test_world_transform_cache() -> None:
+    root = Node(transform=Transform().scaled((2, 2)))
+    a = Node(transform=Transform().translated((1, 0)), parent=root)
+    b = Node(transform=Transform().translated((0, 1)), parent=a)
+    other = Node(parent=root)
+    assert b in a.children  # `parent` adds the node to the parent's children
+
+    world = b.world_transform
+    assert b.world_transform is world
+    assert b.world_transform.inv() is world.inv()
+    np.testing.assert_allclose(world.map_points([[0, 0]]), [[2, 2]])
+    assert other.world_transform is not None
+
+    # changing a transform invalidates the subtree, and only the subtree
+    other_world = other.world_transform
+    a.transform = Transform().translated((5, 0))
+    np.testing.assert_allclose(b.world_transform.map_points([[0, 0]]), [[10, 2]])
+    assert other.world_transform is other_world
+
+    # as does reparenting
+    root.remove(a)
+    np.testing.assert_allclose(b.world_transform.map_points([[0, 0]]), [[5, 1]])
+    with pytest.raises(RuntimeError, match="No common parent"):
+        b.transform_to_node(other)
+    other.add(a)
+    np.testing.assert_allclose(b.transform_to_node(root).map((0, 0)), [5, 1, 0, 1])
+
+
+def test_path_to_node() -> None:
+    # A --- B --- C --- D
+    #        \
+    #         --- E --- F
+    a, b, c, d, e, f = (Node(name=n) for n in "ABCDEF")
+    a.add(b)
+    b.add(c)
+    c.add(d)
+    b.add(e)
+    e.add(f)
+    assert d.path_to_node(f) == ([d, c, b], [e, f])
+    assert f.path_to_node(b) == ([f, e, b], [])
+    assert b.path_to_node(d) == ([b], [c, d])
+    with pytest.raises(RuntimeError, match="No common parent"):
+        d.path_to_node(Node())
+
+
+def test_world_transform_cache_data_node() -> None:
+    # data nodes without a backend adaptor also invalidate their world transform
+    root = Node()
+    image = Image(np.zeros((4, 4)), parent=root)
+    np.testing.assert_allclose(image.transform_to_node(root).map([1, 1]), [1, 1, 0, 1])
+    image.transform = Transform().translated((10, 0))
+    np.testing.assert_allclose(image.transform_to_node(root).map([1, 1]), [11, 1, 0, 1])
@@ -0,0 +1,135 @@
+from importlib.metadata import EntryPoint
+from types import SimpleNamespace
+from typing import Any, ClassVar
+from unittest.mock import Mock
+
+import pytest
+
+from microvis._logger import debug_enabled, logger
+from microvis.core import _vis_model, register_adaptor
+from microvis.core.nodes.camera import Camera
+
+
+class _Adaptor:
+    def __init__(self, obj: Any, **backend_kwargs: Any) -> None:
+        self.mock = Mock()
+
+    def _vis_get_native(self) -> Any:
+        return None
+
+
+for _field in Camera.__fields__:
+    setattr(
+        _Adaptor,
+        f"_vis_set_{_field}",
+        lambda self, arg, _f=_field: self.mock(_f, arg),
+    )
+
+
+class _Camera(Camera):
+    BACKEND_ADAPTORS: ClassVar[dict] = {"test": _Adaptor}
+
+
+def test_setter_dispatch_table() -> None:
+    cam = _Camera()
+    adaptor = cam.backend_adaptor("test")
+    assert (_Camera, _Adaptor) in _vis_model._SETTER_TABLES
+
+    cam.zoom = 2
+    adaptor.mock.assert_called_once_with("zoom", 2)
+    cam.center = (1, 2, 3)
+    adaptor.mock.assert_called_with("center", (1, 2, 3))
+
+    # the table is shared by all instances of the same class pair
+    table = _vis_model._SETTER_TABLES[(_Camera, _Adaptor)]
+    _Camera().backend_adaptor("test")
+    assert _vis_model._SETTER_TABLES[(_Camera, _Adaptor)] is table
+
+
+def test_debug_logging_follows_handlers() -> None:
+    cam = _Camera()
+    cam.backend_adaptor("test")
+    messages: list = []
+    handler = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        assert debug_enabled()
+        cam.zoom = 2
+    finally:
+        logger.remove(handler)
+    assert any(m.startswith("_Camera.zoom=") for m in messages)
+
+    if not debug_enabled():  # (unless DEBUG is set in the environment)
+        messages.clear()
+        cam.zoom = 3
+        assert not messages
+
+
+def test_hold_updates() -> None:
+    cam = _Camera()
+    adaptor = cam.backend_adaptor("test")
+
+    with cam.hold_updates():
+        cam.zoom = 2
+        with cam.batch():  # nested contexts flush at the outermost exit
+            cam.zoom = 3
+            cam.center = (1, 2, 3)
+        adaptor.mock.assert_not_called()
+        assert cam.zoom == 3
+    assert adaptor.mock.call_count == 2
+    adaptor.mock.assert_any_call("zoom", 3)
+    adaptor.mock.assert_any_call("center", (1, 2, 3))
+
+
+def test_composite_setter() -> None:
+    class _CompositeAdaptor(_Adaptor):
+        def _vis_set_view(self, zoom: float, center: tuple) -> None:
+            self.mock("view", zoom, center)
+
+    class _CompositeCamera(Camera):
+        BACKEND_ADAPTORS: ClassVar[dict] = {"test": _CompositeAdaptor}
+        COMPOSITE_SETTERS: ClassVar[dict] = {"view": ("zoom", "center")}
+
+    cam = _CompositeCamera()
+    adaptor = cam.backend_adaptor("test")
+    with cam.hold_updates():
+        cam.zoom = 4
+        cam.visible = False
+    assert adaptor.mock.call_count == 2
+    adaptor.mock.assert_any_call("view", 4, (0, 0, 0))
+    adaptor.mock.assert_any_call("visible", False)
+
+    # outside of hold_updates, the individual setters are used
+    cam.zoom = 5
+    adaptor.mock.assert_called_with("zoom", 5)
+
+
+def test_adaptor_registry(monkeypatch: Any) -> None:
+    class _RegistryCamera(Camera):
+        pass
+
+    # resolved from the backend module (here, an entry point) once per class
+    backends = {"plugin": SimpleNamespace(_RegistryCamera=_Adaptor)}
+    load = Mock(side_effect=backends.get)
+    monkeypatch.setattr(_vis_model, "_backend_module", load)
+    assert isinstance(_RegistryCamera().backend_adaptor("plugin"), _Adaptor)
+    assert isinstance(_RegistryCamera().backend_adaptor("plugin"), _Adaptor)
+    load.assert_called_once_with("plugin")
+    assert _vis_model._ADAPTOR_CLASSES[(_RegistryCamera, "plugin")] is _Adaptor
+
+    class _OtherAdaptor(_Adaptor):
+        pass
+
+    register_adaptor(_RegistryCamera, "plugin", _OtherAdaptor)
+    assert isinstance(_RegistryCamera().backend_adaptor("plugin"), _OtherAdaptor)
+    with pytest.raises(ValueError, match="missing the following methods"):
+        register_adaptor(_RegistryCamera, "plugin", object)
+
+
+def test_backend_entry_points(monkeypatch: Any) -> None:
+    ep = EntryPoint("plugin", "microvis.backend.numpy", "microvis.backends")
+    monkeypatch.setattr(_vis_model, "_backend_entry_points", lambda: {"plugin": ep})
+    _vis_model._backend_module.cache_clear()
+    try:
+        assert _vis_model._backend_module("plugin").__name__ == ep.value
+    finally:
+        _vis_model._backend_module.cache_clear()
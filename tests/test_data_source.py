@@ -0,0 +1,99 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import imageio.v3 as iio
+import numpy as np
+import pytest
+
+from microvis import data_source
+from microvis.core.nodes.image import Image
+from microvis.data_source import (
+    ArraySource,
+    DataSource,
+    ImageDirectorySource,
+    MemmapSource,
+    as_data_source,
+    iter_chunks,
+)
+
+
+@pytest.fixture
+def planes(tmp_path: Path) -> np.ndarray:
+    data = np.random.default_rng(0).integers(0, 255, (5, 12, 10), dtype="uint8")
+    for i, plane in enumerate(data):
+        iio.imwrite(tmp_path / f"plane_{i:02}.png", plane)
+    (tmp_path / "notes.txt").write_text("not a plane")
+    return data
+
+
+def test_array_sources(tmp_path: Path) -> None:
+    data = np.arange(2 * 6 * 8, dtype="float32").reshape(2, 6, 8)
+    source = as_data_source(data)
+    assert isinstance(source, ArraySource)
+    assert isinstance(source, DataSource)
+    assert source.chunks == source.shape == (2, 6, 8)
+    assert np.shares_memory(source.read((1, slice(2, 4))), data)
+    assert as_data_source(source) is source
+    assert not isinstance(data, DataSource)
+
+    np.save(tmp_path / "data.npy", data)
+    mm = MemmapSource(tmp_path / "data.npy")
+    assert isinstance(as_data_source(np.load(tmp_path / "data.npy", "r")), MemmapSource)
+    assert mm.chunks == (1, 6, 8)
+    region = mm[1, 2:4]
+    np.testing.assert_array_equal(region, data[1, 2:4])
+    assert not np.shares_memory(region, mm.array)
+    np.testing.assert_array_equal(asyncio.run(mm.aread((0, ..., 3))), data[0, :, 3])
+
+    assert list(iter_chunks(mm)) == [
+        (slice(0, 1), slice(0, 6), slice(0, 8)),
+        (slice(1, 2), slice(0, 6), slice(0, 8)),
+    ]
+
+    # sources that don't implement `read` can't be created
+    class _Incomplete(data_source._Source):
+        shape = (1,)
+
+    with pytest.raises(TypeError, match="abstract"):
+        _Incomplete()  # type: ignore [abstract]
+
+
+def test_image_directory_source(tmp_path: Path, planes: np.ndarray) -> None:
+    source = ImageDirectorySource(tmp_path, "*.png")
+    assert source.shape == (5, 12, 10)
+    assert source.dtype == np.uint8
+    assert source.chunks == (1, 12, 10)
+
+    with patch.object(source, "_read_plane", wraps=source._read_plane) as read:
+        np.testing.assert_array_equal(source.read((3, slice(2, 5))), planes[3, 2:5])
+        assert read.call_args_list == [((3,),)]
+        read.reset_mock()
+        np.testing.assert_array_equal(source[-1:0:-2, 1], planes[-1:0:-2, 1])
+        assert sorted(c.args[0] for c in read.call_args_list) == [2, 4]
+        read.reset_mock()
+        # fancy indexing reads each plane once
+        index = (np.array([4, 0, 4]), np.array([1, 2, 3]), np.array([0, 5, 9]))
+        np.testing.assert_array_equal(source.read(index), planes[index])
+        assert sorted(c.args[0] for c in read.call_args_list) == [0, 4]
+
+    result = asyncio.run(source.aread((slice(1, 4), slice(None), 0)))
+    np.testing.assert_array_equal(result, planes[1:4, :, 0])
+
+    with pytest.raises(IndexError):
+        source.read(5)
+    with pytest.raises(ValueError, match="No files"):
+        ImageDirectorySource(tmp_path, "*.tif")
+
+
+def test_data_node_source(tmp_path: Path, planes: np.ndarray) -> None:
+    source = ImageDirectorySource(tmp_path, "*.png")
+    img = Image(source, dims={0: slice(2, 3)})
+    assert img.data_source is source
+    with patch.object(source, "read", wraps=source.read) as read:
+        np.testing.assert_array_equal(img.display_data(), planes[2])
+        read.assert_called_once_with((2, slice(None), slice(None)))
+
+    img.data = planes
+    assert isinstance(img.data_source, ArraySource)
+    assert img.data_source.array is planes
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import pytest
+
+import microvis
+from microvis import core
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _imported_modules(statement: str) -> set:
+    code = f"{statement}; import sys; print(' '.join(sys.modules))"
+    return set(_run(code).stdout.split())
+
+
+# (the import time itself is measured in benchmarks/, see `test_import_time`)
+@pytest.mark.parametrize(
+    "statement, not_imported",
+    [
+        (
+            "import microvis",
+            {
+                "numpy",
+                "pydantic",
+                "loguru",
+                "vispy",
+                "microvis.core",
+                "microvis.core.nodes",
+                "microvis.backend",
+            },
+        ),
+        (
+            "from microvis.core import Transform",
+            {"loguru", "microvis._types", "microvis.core.canvas", "microvis.backend"},
+        ),
+        ("from microvis import Canvas", {"loguru", "microvis.backend"}),
+    ],
+)
+def test_lazy_imports(statement: str, not_imported: set) -> None:
+    # neither the packages in `not_imported`, nor any of their submodules
+    imported = {
+        name
+        for name in _imported_modules(statement)
+        if any(name == m or name.startswith(f"{m}.") for m in not_imported)
+    }
+    assert not imported
+
+
+def test_lazy_attributes() -> None:
+    assert microvis.__version__
+    assert {"Canvas", "imshow", "__version__"} <= set(dir(microvis))
+    assert core.Canvas is core.canvas.Canvas
+    assert "MultiscaleImage" in dir(core)
+    with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+        core.Nope  # noqa: B018
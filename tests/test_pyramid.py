@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from microvis import pyramid
+from microvis.core.nodes.multiscale import MultiscaleImage
+
+
+def _reference(data: np.ndarray, method: str) -> np.ndarray:
+    h, w = data.shape[-2:]
+    padded = np.pad(data, [(0, 0)] * (data.ndim - 2) + [(0, h % 2), (0, w % 2)], "edge")
+    blocks = np.stack(
+        [padded[..., i::2, j::2] for i in range(2) for j in range(2)], axis=0
+    )
+    if method == "max":
+        return blocks.max(axis=0)
+    mean = blocks.mean(axis=0, dtype=np.float64)
+    if np.issubdtype(data.dtype, np.integer):
+        mean = np.rint(mean)
+    return mean.astype(data.dtype)
+
+
+@pytest.mark.parametrize("method", ["mean", "max", "nearest"])
+def test_downsample(method: str) -> None:
+    data = np.random.default_rng(0).integers(0, 255, (3, 33, 50), dtype="uint8")
+    result = pyramid.downsample(data, method)  # type: ignore [arg-type]
+    assert result.shape == (3, 17, 25)
+    assert result.dtype == data.dtype
+    if method == "nearest":
+        np.testing.assert_array_equal(result, data[..., ::2, ::2])
+    else:
+        np.testing.assert_array_equal(result, _reference(data, method))
+
+    rgb = np.zeros((8, 6, 3), dtype="float32")
+    assert pyramid.downsample(rgb).shape == (4, 3, 3)
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_build_pyramid(tmp_path: Path, processes: int) -> None:
+    src = np.lib.format.open_memmap(
+        tmp_path / "data.npy", mode="w+", dtype="uint16", shape=(2, 3, 101, 130)
+    )
+    src[:] = np.random.default_rng(0).integers(0, 4000, src.shape, dtype="uint16")
+    pyr = pyramid.build_pyramid(
+        src, tmp_path / "pyr", min_size=20, processes=processes, chunk_bytes=4000
+    )
+    assert [lvl.shape[-2:] for lvl in pyr] == [(101, 130), (51, 65), (26, 33), (13, 17)]
+    assert pyr.scales == (1, 2, 4, 8)
+    expected = np.asarray(src)
+    for level in pyr[1:]:
+        expected = _reference(expected, "mean")
+        np.testing.assert_array_equal(level, expected)
+    assert not list((tmp_path / "pyr").glob("*.progress.npy"))
+
+    img = MultiscaleImage(pyr)
+    # the scales of the pyramid, not the ratios of the (odd) sizes
+    assert img.scales == (1, 2, 4, 8)
+    assert img.level_for_zoom(0.2) == 2
+
+
+def test_build_pyramid_resume(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = np.random.default_rng(0).random((64, 64)).astype("float32")
+    reduce_chunk = pyramid._reduce_chunk
+    calls: list = []
+    interrupt_at = [5]
+
+    def _interrupted(*args):  # type: ignore
+        if len(calls) in interrupt_at:
+            interrupt_at.clear()
+            raise KeyboardInterrupt
+        calls.append(args[2])
+        return reduce_chunk(*args)
+
+    monkeypatch.setattr(pyramid, "_reduce_chunk", _interrupted)
+    kwargs = {"n_levels": 3, "processes": 0, "chunk_bytes": 1024}
+    with pytest.raises(KeyboardInterrupt):
+        pyramid.build_pyramid(data, tmp_path, **kwargs)  # type: ignore [arg-type]
+
+    # the second run only processes the remaining chunks
+    n_done = len(calls)
+    pyr = pyramid.build_pyramid(data, tmp_path, **kwargs)  # type: ignore [arg-type]
+    n_chunks = [len(pyramid._chunks(shape, 4, 1024)) for shape in [(32, 32), (16, 16)]]
+    assert len(calls) - n_done == n_chunks[0] - n_done + n_chunks[1]
+    np.testing.assert_allclose(pyr[2], _reference(_reference(data, "mean"), "mean"))
+
+    with pytest.raises(ValueError, match="different data"):
+        pyramid.build_pyramid(data[:10], tmp_path)
+
+
+def test_open_memmap_rebuilt(tmp_path: Path) -> None:
+    # workers of a reused pool must not read a rebuilt file with a stale layout
+    path = tmp_path / "level.npy"
+    old = np.lib.format.open_memmap(path, mode="w+", dtype="uint8", shape=(4, 4))
+    spec = pyramid._memmap_spec(old, "r", "build1")
+    assert pyramid._open_memmap(spec).shape == (4, 4)
+    del old
+
+    path.unlink()
+    new = np.lib.format.open_memmap(path, mode="w+", dtype="float32", shape=(2, 8))
+    new[:] = 1
+    new.flush()
+    spec = pyramid._memmap_spec(new, "r", "build2")
+    mm = pyramid._open_memmap(spec)
+    assert mm.shape == (2, 8)
+    assert mm.dtype == np.float32
+    np.testing.assert_array_equal(mm, 1)
+    assert pyramid._open_memmap(spec) is mm
+
+    # a rebuild with the same layout (and possibly the same inode) is reopened too
+    del new
+    path.unlink()
+    same = np.lib.format.open_memmap(path, mode="w+", dtype="float32", shape=(2, 8))
+    same[:] = 2
+    same.flush()
+    rebuilt = pyramid._open_memmap(pyramid._memmap_spec(same, "r", "build3"))
+    assert rebuilt is not mm
+    np.testing.assert_array_equal(rebuilt, 2)
+    pyramid._OPEN_MEMMAPS.clear()
+
+
+def test_build_pyramid_executor(tmp_path: Path) -> None:
+    data = np.random.default_rng(0).random((64, 48)).astype("float32")
+    with ThreadPoolExecutor(2) as executor:
+        pyr = pyramid.build_pyramid(
+            data, tmp_path, n_levels=3, processes=2, executor=executor, chunk_bytes=512
+        )
+        assert executor.submit(int).result() == 0  # not shut down by build_pyramid
+    np.testing.assert_allclose(pyr[2], _reference(_reference(data, "mean"), "mean"))